@@ -37,6 +37,7 @@ Classes
    class-filemonitor.rst
    class-filedownload.rst
    class-fdhandler.rst
+   class-threadpoolexecutor.rst
 
 
 Enumerations
@@ -420,6 +421,7 @@ include "efl.ecore_events.pxi"
 include "efl.ecore_exe.pxi"
 include "efl.ecore_file_download.pxi"
 include "efl.ecore_file_monitor.pxi"
+include "efl.ecore_thread_safe.pxi"
 
 init()
 atexit.register(shutdown)
@@ -19,8 +19,26 @@ from cpython cimport PyUnicode_AsUTF8String
 
 cdef extern from "Python.h":
     object PyUnicode_FromStringAndSize(char *s, Py_ssize_t len)
-    int PyObject_GetBuffer(obj, Py_buffer *view, int flags)
+    int PyObject_GetBuffer(obj, Py_buffer *view, int flags) except -1
     void PyBuffer_Release(Py_buffer *view)
+    int PyBuffer_FillInfo(Py_buffer *view, obj, void *buf, Py_ssize_t len,
+                          int readonly, int flags) except -1
+    enum:
+        PyBUF_WRITABLE
+
+cdef extern from "errno.h":
+    enum:
+        EWOULDBLOCK
+
+from libc.string cimport memcpy
+from libc.errno cimport errno, EINTR, EAGAIN
+from posix cimport unistd
+from posix.fcntl cimport fcntl, F_DUPFD, F_GETFD, F_SETFD, F_GETFL, \
+    F_SETFL, FD_CLOEXEC, O_NONBLOCK
+
+import os
+import stat
+from collections import deque
 
 
 cdef exe_flags2str(int value):
@@ -50,62 +68,55 @@ cdef exe_flags2str(int value):
     return ", ".join(flags)
 
 
-cdef Eina_Bool _exe_event_filter_cb(void *data, int type, void *event) with gil:
+# The Exe events are dispatched by a single handler per event type, to the
+# filter of the Exe sending it, found in _ecore_exe_event_mapping.
+cdef dict _exe_event_handlers = {}
+
+
+cdef Eina_Bool _exe_event_dispatch_cb(void *data, int type, void *event) with gil:
     cdef:
-        ExeEventFilter self = <ExeEventFilter>data
-        Ecore_Exe_Event_Add *e_add
-        Ecore_Exe_Event_Del *e_del
-        Ecore_Exe_Event_Data *e_data
-        Event e
-        list cbs
-        tuple cb
+        Ecore_Exe *exe
+        Exe owner
+        ExeEventFilter filter
 
     try:
-        assert self.event_type == type, "event is not what we asked? impossible"
         if type == enums.ECORE_EXE_EVENT_ADD:
-            e_add = <Ecore_Exe_Event_Add *>event
-            if e_add.exe != self.exe:
-                return 1
-            e = EventExeAdd()
+            exe = (<Ecore_Exe_Event_Add *>event).exe
         elif type == enums.ECORE_EXE_EVENT_DEL:
-            e_del = <Ecore_Exe_Event_Del *>event
-            if e_del.exe != self.exe:
-                return 1
-            e = EventExeDel()
-        elif type == enums.ECORE_EXE_EVENT_DATA or type == enums.ECORE_EXE_EVENT_ERROR:
-            e_data = <Ecore_Exe_Event_Data *>event
-            if e_data.exe != self.exe:
-                return 1
-            e = EventExeData()
+            exe = (<Ecore_Exe_Event_Del *>event).exe
         else:
-            raise SystemError("unknown event type=%d" % type)
-
-        r = e._set_obj(event)
-        assert r != -1, "exe is not known?! impossible!"
-
-        cbs = self.callbacks[:] # copy, so we can change self.callbacks
-        for cb in cbs:
-            try:
-                cb[0](self.owner, e, *cb[1], **cb[2])
-            except Exception:
-                traceback.print_exc()
-
+            exe = (<Ecore_Exe_Event_Data *>event).exe
+
+        owner = _ecore_exe_event_mapping.get(<uintptr_t><void *>exe)
+        if owner is None:
+            return 1
+        filter = owner._event_filter_get(type)
+        if filter is not None:
+            filter._call(event)
     except Exception:
         traceback.print_exc()
 
     return 1 # always return true, no matter what
 
 
+cdef int _exe_event_handler_add(int event_type) except 0:
+    cdef Ecore_Event_Handler *handler
+    if event_type in _exe_event_handlers:
+        return 1
+    handler = ecore_event_handler_add(event_type, _exe_event_dispatch_cb, NULL)
+    if handler == NULL:
+        raise SystemError("could not add the event handler of type %d" %
+                          event_type)
+    _exe_event_handlers[event_type] = <uintptr_t>handler
+    return 1
+
+
 cdef class ExeEventFilter:
     def __cinit__(self, *a, **ka):
         self.event_type = -1
         self.callbacks = []
 
     def __dealloc__(self):
-        if self.handler != NULL:
-            ecore_event_handler_del(self.handler)
-            self.handler = NULL
-
         self.exe = NULL
         self.owner = None
         self.event_type = -1
@@ -117,32 +128,52 @@ cdef class ExeEventFilter:
         self.event_type = event_type
         self.callbacks = []
 
+    cdef int _call(self, void *event) except 0:
+        cdef Event e
+
+        if not self.callbacks:
+            return 1
+
+        if self.event_type == enums.ECORE_EXE_EVENT_ADD:
+            e = EventExeAdd()
+        elif self.event_type == enums.ECORE_EXE_EVENT_DEL:
+            e = EventExeDel()
+        elif self.event_type == enums.ECORE_EXE_EVENT_DATA or \
+             self.event_type == enums.ECORE_EXE_EVENT_ERROR:
+            e = EventExeData()
+        else:
+            raise SystemError("unknown event type=%d" % self.event_type)
+
+        r = e._set_obj(event)
+        assert r != -1, "exe is not known?! impossible!"
+
+        # the list is replaced, not changed in place, when callbacks are
+        # added or removed
+        for func, args, kargs in self.callbacks:
+            try:
+                func(self.owner, e, *args, **kargs)
+            except Exception:
+                traceback.print_exc()
+        if isinstance(e, EventExeData):
+            (<EventExeData>e)._unset_obj()
+        return 1
+
     def delete(self):
-        if self.handler != NULL:
-            ecore_event_handler_del(self.handler)
-            self.handler = NULL
         self.callbacks = None
 
     def callback_add(self, func, args, kargs):
-        if self.handler == NULL:
-            self.handler = ecore_event_handler_add(
-                self.event_type, _exe_event_filter_cb, <void *>self)
-        self.callbacks.append((func, args, kargs))
+        _exe_event_handler_add(self.event_type)
+        self.callbacks = self.callbacks + [(func, args, kargs)]
 
     def callback_del(self, func, args, kargs):
+        cdef list callbacks = list(self.callbacks)
         try:
-            self.callbacks.remove((func, args, kargs))
+            callbacks.remove((func, args, kargs))
         except ValueError:
             raise ValueError(
                 "callback is not registered: %s, args=%s, kargs=%s" %
                 (func, args, kargs))
-
-        if self.callbacks:
-            return
-
-        if self.handler != NULL:
-            ecore_event_handler_del(self.handler)
-            self.handler = NULL
+        self.callbacks = callbacks
 
 
 def exe_run_priority_set(int pri):
@@ -169,6 +200,22 @@ cdef void _ecore_exe_pre_free_cb(void *data, const Ecore_Exe *exe) with gil:
         traceback.print_exc()
 
 
+cdef int _fd_flags_add(int fd, int get, int set, int flags) except -1:
+    cdef int r = fcntl(fd, get)
+    if r == -1 or fcntl(fd, set, r | flags) == -1:
+        raise OSError(errno, os.strerror(errno))
+    return 0
+
+
+cdef Eina_Bool _exe_stdin_write_cb(void *data, Ecore_Fd_Handler *fdh) with gil:
+    cdef Exe obj = <Exe>data
+    try:
+        obj._stdin_flush()
+    except Exception:
+        traceback.print_exc()
+    return 1
+
+
 cdef class Exe(object):
     """
 
@@ -198,6 +245,22 @@ cdef class Exe(object):
     with the error version.  Writing will only be allowed with
     ``ECORE_EXE_PIPE_WRITE`` enabled in the *flags*.
 
+    :py:meth:`send` buffers without limit, which is not suitable to feed
+    large amounts of data to the child. With *stdin_stream* the stdin of
+    the child is a pipe written as the child reads it: :py:meth:`write`
+    returns False once more than the high watermark is pending, and the
+    callbacks added with :py:meth:`on_drain_event_add` are called when the
+    pending data drops to the low watermark. :py:meth:`send_file` streams
+    a file to the child in chunks, without reading it all in memory::
+
+        def on_drain(exe):
+            while exe.write(produce_chunk()):
+                pass
+
+        exe = Exe("encoder", stdin_stream=True)
+        exe.on_drain_event_add(on_drain)
+        on_drain(exe)
+
     .. rubric:: Instance Event Handling
 
     To make use easier, there are methods that automatically filter
@@ -311,31 +374,96 @@ cdef class Exe(object):
 
     :type flags: int
     :param data: extra data to be associated and available with ``data_get()``
+    :param stdin_stream: give the child a flow controlled stdin, see
+        :py:meth:`write`. The command is then always run by the shell.
+        Can't be used with ``ECORE_EXE_PIPE_WRITE`` or
+        ``ECORE_EXE_ISOLATE_IO``.
+    :type stdin_stream: bool
+
+    .. versionchanged:: 1.27
+        The *stdin_stream* parameter
 
     """
     def __cinit__(self, *a, **ka):
         self.exe = NULL
         self.__data = None
         self.__callbacks = {}
-
-    def __init__(self, exe_cmd, int flags=0, data=None):
+        self._stdin_fd = -1
+        self._stdin_handler = NULL
+        self._stdin_high = 65536
+        self._stdin_low = 16384
+        self._drain_callbacks = []
+        self._drain_waiters = []
+
+    def __init__(self, exe_cmd, int flags=0, data=None, stdin_stream=False):
         if not exe_cmd:
             raise ValueError("exe_cmd must not be empty!")
 
         if flags is None:
             flags = 0
 
+        if stdin_stream and flags & (enums.ECORE_EXE_PIPE_WRITE |
+                                     enums.ECORE_EXE_ISOLATE_IO):
+            raise ValueError("stdin_stream can't be used with "
+                             "ECORE_EXE_PIPE_WRITE or ECORE_EXE_ISOLATE_IO")
+
         if isinstance(exe_cmd, unicode): exe_cmd = PyUnicode_AsUTF8String(exe_cmd)
-        self._set_obj(exe_cmd, flags)
+        self._set_obj(exe_cmd, flags, stdin_stream)
         self.__data = data
         self.__callbacks = {}
 
-    cdef int _set_obj(self, char *exe_cmd, int flags) except 0:
-        cdef Ecore_Exe *exe
+    cdef int _set_obj(self, char *exe_cmd, int flags,
+                      bint stdin_stream=False) except 0:
+        cdef:
+            Ecore_Exe *exe
+            int fds[2]
+            int rfd = -1
 
         assert self.exe == NULL, "Exe must be clean, not wrapping any Ecore_Exe"
 
-        exe = ecore_exe_pipe_run(exe_cmd, <Ecore_Exe_Flags>flags, <void *>self)
+        if not stdin_stream:
+            exe = ecore_exe_pipe_run(exe_cmd, <Ecore_Exe_Flags>flags,
+                                     <void *>self)
+        else:
+            # Ecore doesn't tell how much of what it was sent is still
+            # pending, so the child gets a pipe of ours as stdin: its read
+            # end is inherited, above the standard fds, and the shell
+            # running the command moves it to fd 0 in the child.
+            if unistd.pipe(fds) == -1:
+                raise OSError(errno, os.strerror(errno))
+            try:
+                _fd_flags_add(fds[0], F_GETFD, F_SETFD, FD_CLOEXEC)
+                _fd_flags_add(fds[1], F_GETFD, F_SETFD, FD_CLOEXEC)
+                _fd_flags_add(fds[1], F_GETFL, F_SETFL, O_NONBLOCK)
+                rfd = fcntl(fds[0], F_DUPFD, 3)
+                if rfd == -1:
+                    raise OSError(errno, os.strerror(errno))
+                prefix = ("exec 0<&%d %d<&-; " % (rfd, rfd)).encode("ascii")
+                exe = ecore_exe_pipe_run(prefix + exe_cmd,
+                    <Ecore_Exe_Flags>(flags | enums.ECORE_EXE_USE_SH),
+                    <void *>self)
+                self._cmd_skip = len(prefix)
+            except:
+                unistd.close(fds[1])
+                raise
+            finally:
+                if rfd != -1:
+                    unistd.close(rfd)
+                unistd.close(fds[0])
+
+            if exe == NULL:
+                unistd.close(fds[1])
+            else:
+                self._stdin_fd = fds[1]
+                self._stdin_queue = deque()
+                self._stdin_pending = 0
+                self._stdin_offset = 0
+                self._stdin_wants_drain = False
+                self._stdin_closing = False
+                self._stdin_handler = ecore_main_fd_handler_add(
+                    fds[1], <Ecore_Fd_Handler_Flags>0, _exe_stdin_write_cb,
+                    <void *>self, NULL, NULL)
+
         if exe == NULL:
             raise SystemError("could not run subprocess %r, flags=%#x" %
                               (exe_cmd, flags))
@@ -352,11 +480,112 @@ cdef class Exe(object):
             filter.delete()
         self.__callbacks = None
 
+        self._stdin_close()
+        self._drain_callbacks = []
+
         _ecore_exe_event_mapping.pop(<uintptr_t><void *>self.exe)
         self.exe = NULL
         Py_DECREF(self)
         return 1
 
+    cdef int _stdin_close(self) except 0:
+        if self._stdin_handler != NULL:
+            ecore_main_fd_handler_del(self._stdin_handler)
+            self._stdin_handler = NULL
+        if self._stdin_fd != -1:
+            unistd.close(self._stdin_fd)
+            self._stdin_fd = -1
+            for item in self._stdin_queue:
+                if isinstance(item, tuple) and item[1]:
+                    os.close(item[0])
+            self._stdin_queue.clear()
+            self._stdin_pending = 0
+        waiters, self._drain_waiters = self._drain_waiters, []
+        for fut in waiters:
+            if not fut.done():
+                fut.set_exception(ValueError("stdin of the child is closed"))
+        return 1
+
+    cdef int _stdin_flush(self) except 0:
+        cdef:
+            object queue = self._stdin_queue
+            bytes chunk
+            Py_ssize_t n, size
+
+        while queue:
+            item = queue[0]
+            if isinstance(item, tuple):
+                # a file from send_file(), queue its next chunk
+                try:
+                    chunk = os.read(item[0], 65536)
+                except OSError:
+                    if item[1]:
+                        os.close(item[0])
+                    queue.popleft()
+                    raise
+                if not chunk:
+                    if item[1]:
+                        os.close(item[0])
+                    queue.popleft()
+                    continue
+                queue.appendleft(chunk)
+                self._stdin_pending += len(chunk)
+                continue
+
+            chunk = item
+            size = len(chunk) - self._stdin_offset
+            n = unistd.write(self._stdin_fd,
+                             <char *>chunk + self._stdin_offset, size)
+            if n == -1:
+                if errno == EINTR:
+                    continue
+                if errno == EAGAIN or errno == EWOULDBLOCK:
+                    break
+                # the child closed its stdin, nothing more can be written
+                self._stdin_close()
+                return 1
+
+            self._stdin_pending -= n
+            if n < size:
+                self._stdin_offset += n
+            else:
+                self._stdin_offset = 0
+                queue.popleft()
+
+        if not queue and self._stdin_closing:
+            self._stdin_close()
+            return 1
+
+        ecore_main_fd_handler_active_set(self._stdin_handler,
+            enums.ECORE_FD_WRITE if queue else <Ecore_Fd_Handler_Flags>0)
+
+        if self._stdin_wants_drain and \
+                self._stdin_pending <= self._stdin_low and \
+                not any(isinstance(item, tuple) for item in queue):
+            self._stdin_wants_drain = False
+            waiters, self._drain_waiters = self._drain_waiters, []
+            for fut in waiters:
+                if not fut.done():
+                    fut.set_result(None)
+            for func, args, kargs in self._drain_callbacks:
+                try:
+                    func(self, *args, **kargs)
+                except Exception:
+                    traceback.print_exc()
+        return 1
+
+    cdef int _stdin_check(self) except 0:
+        if self._stdin_fd == -1:
+            if self._stdin_queue is None:
+                raise ValueError("Exe was not created with stdin_stream")
+            raise ValueError("stdin of the child is closed")
+        return 1
+
+    cdef object _event_filter_get(self, int event_type):
+        if self.__callbacks is None:
+            return None
+        return self.__callbacks.get(event_type)
+
     def __repr__(self):
         if self.exe == NULL:
             pid = None
@@ -418,6 +647,11 @@ cdef class Exe(object):
         :raise ValueError: if size is larger than buffer size.
         :return: success or failure.
         :rtype: bool
+
+        .. versionchanged:: 1.27
+            If the Exe was created with *stdin_stream*, this queues the data
+            like :py:meth:`write` without limit.
+
         """
         cdef:
             Py_buffer buf_view
@@ -426,6 +660,14 @@ cdef class Exe(object):
         if isinstance(buf, unicode):
             buf = PyUnicode_AsUTF8String(buf)
 
+        if self._stdin_queue is not None:
+            if self._stdin_fd == -1 or self._stdin_closing:
+                return False
+            if size > 0:
+                buf = memoryview(buf)[:size]
+            self.write(buf)
+            return True
+
         PyObject_GetBuffer(buf, &buf_view, 0)
 
         if size <= 0:
@@ -439,6 +681,158 @@ cdef class Exe(object):
         PyBuffer_Release(&buf_view)
         return ret
 
+    def write(self, buf):
+        """Queues data to be written to the stdin of the child process.
+
+        The data is written as the child reads it, from the main loop. If the
+        pending data is more than the high watermark this returns False:
+        stop writing and wait for the drain callbacks before writing more.
+
+        :param buf: object that implements buffer interface, like bytes.
+        :return: False if the pending data reached the high watermark.
+        :rtype: bool
+        :raise ValueError: if the Exe was not created with *stdin_stream*
+            or its stdin is closed.
+
+        .. versionadded:: 1.27
+
+        """
+        self._stdin_check()
+        if self._stdin_closing:
+            raise ValueError("stdin of the child is closing")
+        if isinstance(buf, unicode):
+            buf = PyUnicode_AsUTF8String(buf)
+        elif not isinstance(buf, bytes):
+            buf = memoryview(buf).tobytes()
+        if buf:
+            self._stdin_queue.append(buf)
+            self._stdin_pending += len(buf)
+            ecore_main_fd_handler_active_set(self._stdin_handler,
+                                             enums.ECORE_FD_WRITE)
+        if self._stdin_pending >= self._stdin_high:
+            self._stdin_wants_drain = True
+            return False
+        return True
+
+    def send_file(self, file):
+        """Streams a file to the stdin of the child process.
+
+        The file is read in chunks as the child reads its stdin, after the
+        data already queued. The drain callbacks are called when it was all
+        written.
+
+        :param file: the path of the file, or an open file descriptor or
+            file object, that is not closed. The data is read from its
+            current position.
+        :raise ValueError: if the Exe was not created with *stdin_stream*,
+            its stdin is closed or the file is not a regular file.
+
+        .. versionadded:: 1.27
+
+        """
+        self._stdin_check()
+        if self._stdin_closing:
+            raise ValueError("stdin of the child is closing")
+        if isinstance(file, (bytes, unicode)):
+            fd = os.open(file, os.O_RDONLY)
+            owned = True
+        else:
+            fd = file if isinstance(file, int) else file.fileno()
+            owned = False
+        # the chunks are read from the main loop, that must never block
+        if not stat.S_ISREG(os.fstat(fd).st_mode):
+            if owned:
+                os.close(fd)
+            raise ValueError("only regular files can be sent")
+        self._stdin_queue.append((fd, owned))
+        self._stdin_wants_drain = True
+        ecore_main_fd_handler_active_set(self._stdin_handler,
+                                         enums.ECORE_FD_WRITE)
+
+    def drain(self):
+        """Waits until more data can be written to stdin, with asyncio.
+
+        This is the awaitable version of :py:meth:`on_drain_event_add`, to be
+        used with the :mod:`efl.ecore_asyncio` event loop::
+
+            async def feed(exe, chunks):
+                for chunk in chunks:
+                    if not exe.write(chunk):
+                        await exe.drain()
+                exe.close_stdin()
+
+        :return: a future, done at once if nothing is waiting to be written,
+            or failing with ValueError if the stdin of the child is closed.
+        :rtype: :class:`asyncio.Future`
+
+        .. versionadded:: 1.27
+
+        """
+        import asyncio
+
+        self._stdin_check()
+        fut = asyncio.get_running_loop().create_future()
+        if self._stdin_wants_drain:
+            self._drain_waiters.append(fut)
+        else:
+            fut.set_result(None)
+        return fut
+
+    property stdin_pending:
+        """The number of bytes queued to the stdin of the child process.
+
+        Files given to :py:meth:`send_file` count only for the chunk being
+        written.
+
+        :type: int
+
+        .. versionadded:: 1.27
+
+        """
+        def __get__(self):
+            return self._stdin_pending
+
+    def stdin_watermarks_set(self, Py_ssize_t high, Py_ssize_t low):
+        """Sets the limits of the data pending to the child process stdin.
+
+        :param high: :py:meth:`write` returns False when this many bytes
+            are pending, defaults to 65536.
+        :param low: the drain callbacks are called when the pending data
+            drops to this size, defaults to 16384.
+        :raise ValueError: if low is not between 0 and high.
+
+        .. versionadded:: 1.27
+
+        """
+        if low < 0 or low > high:
+            raise ValueError("low watermark must be between 0 and %d" % high)
+        self._stdin_high = high
+        self._stdin_low = low
+
+    def stdin_watermarks_get(self):
+        """Gets the limits of the data pending to the child process stdin.
+
+        :rtype: tuple of int (high, low)
+
+        .. versionadded:: 1.27
+
+        """
+        return (self._stdin_high, self._stdin_low)
+
+    property stdin_watermarks:
+        """The high and low limits of the data pending to the child stdin.
+
+        :type: (int **high**, int **low**)
+
+        .. versionadded:: 1.27
+
+        """
+        def __set__(self, value):
+            self.stdin_watermarks_set(*value)
+
+        def __get__(self):
+            return self.stdin_watermarks_get()
+
     def close_stdin(self):
         """Close executed process' stdin.
 
@@ -446,7 +840,12 @@ cdef class Exe(object):
         immediately. Instead it will be closed when the write buffer
         is empty.
         """
-        ecore_exe_close_stdin(self.exe)
+        if self._stdin_queue is None:
+            ecore_exe_close_stdin(self.exe)
+        elif self._stdin_fd != -1:
+            self._stdin_closing = True
+            if not self._stdin_queue:
+                self._stdin_close()
 
     def auto_limits_set(self, int start_bytes, int end_bytes,
                         int start_lines, int end_lines):
@@ -475,7 +874,8 @@ cdef class Exe(object):
         """
         cdef const char *cmd = ecore_exe_cmd_get(self.exe)
         if cmd != NULL:
-            return cmd
+            # without the redirection added for stdin_stream
+            return cmd + self._cmd_skip
         return None
 
     property cmd:
@@ -772,6 +1172,43 @@ cdef class Exe(object):
             self.__callbacks[enums.ECORE_EXE_EVENT_ERROR] = filter
         filter.callback_add(func, args, kargs)
 
+    def on_drain_event_add(self, func, *args, **kargs):
+        """Adds a listener to know when more data can be written to stdin.
+
+        The given function is called with the following signature once the
+        data pending to the stdin of the child drops to the low watermark,
+        after :py:meth:`write` returned False or :py:meth:`send_file` was
+        called::
+
+            func(exe, *args, **kargs)
+
+        :see: on_drain_event_del()
+        :see: stdin_watermarks_set()
+
+        .. versionadded:: 1.27
+
+        """
+        self._drain_callbacks = self._drain_callbacks + [(func, args, kargs)]
+
+    def on_drain_event_del(self, func, *args, **kargs):
+        """Removes the listener registered with :py:meth:`on_drain_event_add`.
+
+        Parameters must be exactly the same.
+
+        :raise ValueError: if parameters don't match an already
+                           registered callback.
+
+        .. versionadded:: 1.27
+
+        """
+        cdef list callbacks = list(self._drain_callbacks)
+        try:
+            callbacks.remove((func, args, kargs))
+        except ValueError:
+            raise ValueError("callback not registered %s, args=%s, kargs=%s" %
+                             (func, args, kargs))
+        self._drain_callbacks = callbacks
+
     def on_error_event_del(self, func, *args, **kargs):
         """Removes the event listener registered with :py:func:`on_error_event_add()`.
 
@@ -854,38 +1291,138 @@ cdef class EventExeData(Event):
     This event is issued by :py:class:`Exe` instances created with flags that
     allow reading from either stdout or stderr.
 
+    The output of the child is only read from the C event when asked for,
+    and is only available during the event callbacks, unless it was
+    already read as :py:attr:`bytes`. The event supports the buffer
+    protocol, ``memoryview(event)`` gives the raw output as it's stored in
+    :py:attr:`bytes`. :py:meth:`readinto` copies it into a buffer given by
+    the caller, avoiding any allocation::
+
+        buf = bytearray(65536)
+
+        def on_data(exe, event):
+            n = event.readinto(buf)
+            process(buf, n)
+
     :ivar Exe exe: Instance of :py:class:`Exe` that created this event.
-    :ivar string ~EventExeData.data: The raw string buffer with binary data from child process.
-    :ivar int ~EventExeData.size: The size of **data** (same as ``len(data)``)
-    :ivar list lines: List of strings with all text lines
+    :ivar int ~EventExeData.size: The size of the output in bytes
+
+    .. versionchanged:: 1.27
+        The output is read lazily, binary safe, and available as bytes or
+        through the buffer protocol
+
     """
     cdef int _set_obj(self, void *o) except 0:
         cdef Ecore_Exe_Event_Data *obj
-        cdef int i
         obj = <Ecore_Exe_Event_Data*>o
         self.exe = _ecore_exe_event_mapping.get(<uintptr_t>obj.exe)
         if self.exe is None:
             return -1
-        self.data = PyUnicode_FromStringAndSize(<char*>obj.data, obj.size)
+        self.obj = obj
         self.size = obj.size
-        self.lines = []
+        return 1
 
-        line_append = self.lines.append
-        if obj.lines:
-            i = 0
-            while obj.lines[i].line != NULL:
-                line_append(PyUnicode_FromStringAndSize(
-                        obj.lines[i].line, obj.lines[i].size))
-                i += 1
+    cdef void _unset_obj(self):
+        self.obj = NULL
 
+    cdef int _check(self) except 0:
+        if self.obj == NULL:
+            raise ValueError("the output of the child is only available "
+                             "during the event callbacks")
         return 1
 
+    property bytes:
+        """The output of the child process.
+
+        :type: bytes
+
+        .. versionadded:: 1.27
+
+        """
+        def __get__(self):
+            if self._bytes is None:
+                self._check()
+                self._bytes = (<char *>self.obj.data)[:self.obj.size]
+            return self._bytes
+
+    property data:
+        """The output of the child process, as text.
+
+        It's decoded from UTF-8, invalid bytes are replaced by U+FFFD.
+
+        :type: str
+
+        """
+        def __get__(self):
+            if self._data is None:
+                if self._bytes is None:
+                    self._check()
+                    self._data = (<char *>self.obj.data)[:self.obj.size] \
+                        .decode("UTF-8", "replace")
+                else:
+                    self._data = self._bytes.decode("UTF-8", "replace")
+            return self._data
+
+    property lines:
+        """The text lines of the output.
+
+        Only filled if the :py:class:`Exe` was created with one of the line
+        buffered flags, empty otherwise.
+
+        :type: list of str
+
+        """
+        def __get__(self):
+            cdef int i
+            if self._lines is None:
+                self._check()
+                lines = []
+                i = 0
+                while self.obj.lines != NULL and \
+                        self.obj.lines[i].line != NULL:
+                    lines.append(self.obj.lines[i].line[
+                        :self.obj.lines[i].size].decode("UTF-8", "replace"))
+                    i += 1
+                self._lines = lines
+            return self._lines
+
+    def readinto(self, buf, Py_ssize_t offset=0):
+        """Copy the output of the child process into a buffer.
+
+        :param buf: A writable object supporting the buffer protocol, like a
+            :class:`bytearray` or a ring buffer ``memoryview``, with room for
+            the output after **offset**.
+        :param int offset: Where to copy the output in **buf**.
+        :return: The number of bytes copied, the size of the output.
+        :raise ValueError: if the output doesn't fit in **buf**.
+
+        .. versionadded:: 1.27
+
+        """
+        cdef Py_buffer view
+
+        self._check()
+        PyObject_GetBuffer(buf, &view, PyBUF_WRITABLE)
+        try:
+            if offset < 0 or offset + self.obj.size > view.len:
+                raise ValueError("%d bytes don't fit in %d bytes at %d" %
+                                 (self.obj.size, view.len, offset))
+            memcpy(<char *>view.buf + offset, self.obj.data, self.obj.size)
+        finally:
+            PyBuffer_Release(&view)
+        return self.obj.size
+
+    def __getbuffer__(self, Py_buffer *view, int flags):
+        # the C data is freed after the callbacks, the views may outlive it
+        cdef bytes data = self.bytes
+        PyBuffer_FillInfo(view, self, <char *>data, len(data), 1, flags)
+
     def __repr__(self):
-        if self.lines is None:
+        if self._lines is None:
             count = None
         else:
-            count = len(self.lines)
-        return "<%s(size=%d, lines=#%d, exe=%r)>" % \
+            count = len(self._lines)
+        return "<%s(size=%d, lines=#%s, exe=%r)>" % \
             (self.__class__.__name__, self.size, count, self.exe)
 
 
@@ -900,7 +1437,11 @@ cdef class EventHandlerExe(EventHandler):
         e = self.event_cls()
         if e._set_obj(event) == -1: # no exe
             return True
-        return bool(self.func(e, *self.args, **self.kargs))
+        try:
+            return bool(self.func(e, *self.args, **self.kargs))
+        finally:
+            if isinstance(e, EventExeData):
+                (<EventExeData>e)._unset_obj()
 
 
 def on_exe_add_event_add(func, *args, **kargs):
@@ -0,0 +1,205 @@
+# Copyright (C) 2007-2022 various contributors (see AUTHORS)
+#
+# This file is part of Python-EFL.
+#
+# Python-EFL is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 3 of the License, or (at your option) any later version.
+#
+# Python-EFL is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this Python-EFL.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections import deque
+
+try:
+    import concurrent.futures as futures
+except ImportError:  # python 2 without the "futures" backport
+    futures = None
+
+
+# Calls queued by call_async(), shared by all the threads. deque append
+# and popleft are atomic, the GIL protects _async_wakeup_pending.
+cdef object _async_queue = deque()
+cdef bint _async_wakeup_pending = False
+
+
+cdef void _async_queue_flush_cb(void *data) with gil:
+    global _async_wakeup_pending
+
+    # new calls queued while flushing will schedule another wakeup
+    _async_wakeup_pending = False
+
+    cdef Py_ssize_t ntodo = len(_async_queue)
+    while ntodo > 0:
+        ntodo -= 1
+        func, args, kargs = _async_queue.popleft()
+        try:
+            func(*args, **kargs)
+        except Exception:
+            traceback.print_exc()
+
+
+cdef class _SyncCall(object):
+    cdef object func, args, kargs, result, exc
+
+    def __cinit__(self, func, args, kargs):
+        self.func = func
+        self.args = args
+        self.kargs = kargs
+
+
+cdef void *_sync_call_cb(void *data) with gil:
+    cdef _SyncCall call = <_SyncCall>data
+    try:
+        call.result = call.func(*call.args, **call.kargs)
+    except BaseException as e:
+        call.exc = e
+    return NULL
+
+
+def call_async(func, *args, **kargs):
+    """Call the given function in the main loop thread.
+
+    :param func: function to call in the main loop.
+    :type func: callable
+    :param \*args: All the remaining arguments will be passed
+                   to the function.
+    :param \**kwargs: All the remaining keyword arguments will be passed
+                      to the function.
+
+    This function can be called from any thread and returns immediately, the
+    function will be called later from the main loop. Calls are performed in
+    the same order they have been queued.
+
+    Queued calls are delivered in batches: all the calls queued before the
+    main loop wakes up are performed in a single main loop wakeup, without
+    any other syscall.
+
+    Exceptions raised by **func** are printed and ignored, the return value
+    is ignored too, use :func:`call_sync` or a :class:`ThreadPoolExecutor`
+    if you need the result.
+
+    .. note:: When called from the main loop thread the call may be
+        performed immediately, as ecore does, or later with the calls
+        already waiting for a main loop wakeup. Don't rely on either.
+
+    .. versionadded:: 1.27
+
+    """
+    global _async_wakeup_pending
+
+    if not callable(func):
+        raise TypeError("Parameter 'func' must be callable")
+
+    _async_queue.append((func, args, kargs))
+    if not _async_wakeup_pending:
+        _async_wakeup_pending = True
+        with nogil:
+            ecore_main_loop_thread_safe_call_async(_async_queue_flush_cb, NULL)
+
+
+def call_sync(func, *args, **kargs):
+    """Call the given function in the main loop thread and wait for it.
+
+    :param func: function to call in the main loop.
+    :type func: callable
+    :param \*args: All the remaining arguments will be passed
+                   to the function.
+    :param \**kwargs: All the remaining keyword arguments will be passed
+                      to the function.
+
+    :return: the value returned by **func**
+
+    The calling thread is blocked until the main loop thread performed the
+    call. Exceptions raised by **func** are raised again in the calling
+    thread.
+
+    .. warning:: Never call this from a thread while the main loop thread is
+        waiting for that thread (ie: joining it), it will deadlock.
+
+    .. versionadded:: 1.27
+
+    """
+    if not callable(func):
+        raise TypeError("Parameter 'func' must be callable")
+
+    cdef _SyncCall call = _SyncCall(func, args, kargs)
+    with nogil:
+        ecore_main_loop_thread_safe_call_sync(_sync_call_cb, <void *>call)
+
+    if call.exc is not None:
+        raise call.exc
+    return call.result
+
+
+if futures is not None:
+
+    class ThreadPoolExecutor(futures.Executor):
+        """
+
+        An executor that runs calls in a pool of worker threads and
+        resolves their futures in the main loop thread.
+
+        This is a :class:`concurrent.futures.Executor`, thus it can be used
+        exactly as the ones from the standard library, but the returned
+        futures are completed using :func:`call_async`. This means that the
+        done callbacks of the futures are always called from the main loop,
+        so it's safe to update the UI from them::
+
+            def decode(path):
+                ...  # heavy work in a worker thread
+                return pixels
+
+            def decoded(future):
+                img.image_data_set(future.result())  # in the main loop
+
+            pool = ThreadPoolExecutor(max_workers=4)
+            pool.submit(decode, path).add_done_callback(decoded)
+
+        .. warning:: As futures are resolved in the main loop, waiting for
+            them from the main loop thread (ie: calling ``result()`` on a
+            pending future) will deadlock.
+
+        .. versionadded:: 1.27
+
+        """
+        def __init__(self, max_workers=None, thread_name_prefix="efl-worker"):
+            """
+
+            :param max_workers: The maximum number of worker threads, see
+                :class:`concurrent.futures.ThreadPoolExecutor`.
+            :param thread_name_prefix: Prefix for the worker threads names.
+
+            """
+            self._pool = futures.ThreadPoolExecutor(max_workers,
+                                                    thread_name_prefix)
+
+        def submit(self, fn, *args, **kwargs):
+            inner = self._pool.submit(fn, *args, **kwargs)
+            outer = futures.Future()
+            inner.add_done_callback(
+                lambda f: call_async(_future_chain, f, outer))
+            outer.add_done_callback(
+                lambda f: inner.cancel() if f.cancelled() else None)
+            return outer
+
+        def shutdown(self, wait=True, **kwargs):
+            self._pool.shutdown(wait, **kwargs)
+
+
+    def _future_chain(inner, outer):
+        """Copy the state of the worker future into the user one."""
+        if outer.done():  # cancelled by the user
+            return
+        if inner.cancelled():
+            outer.cancel()
+        elif inner.exception() is not None:
+            outer.set_exception(inner.exception())
+        else:
+            outer.set_result(inner.result())
@@ -0,0 +1,356 @@
+# Copyright (C) 2007-2022 various contributors (see AUTHORS)
+#
+# This file is part of Python-EFL.
+#
+# Python-EFL is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 3 of the License, or (at your option) any later version.
+#
+# Python-EFL is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this Python-EFL.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+asyncio integration for the Ecore main loop.
+
+This module provide an :class:`asyncio event loop<asyncio.AbstractEventLoop>`
+that runs on top of the Ecore main loop, so that coroutines and EFL callbacks
+can share the same thread, without any polling::
+
+    import asyncio
+    from efl import elementary as elm
+    from efl.ecore_asyncio import EcoreEventLoopPolicy
+
+    asyncio.set_event_loop_policy(EcoreEventLoopPolicy())
+
+    async def main():
+        win = elm.StandardWindow("test", "asyncio test", autodel=True)
+        win.callback_delete_request_add(lambda o: loop.stop())
+        win.show()
+        ...
+
+    loop = asyncio.get_event_loop()
+    loop.create_task(main())
+    loop.run_forever()
+
+The scheduler of the loop is implemented with ecore primitives:
+
+- :meth:`~asyncio.loop.call_later` and :meth:`~asyncio.loop.call_at` use an
+  :class:`efl.ecore.Timer` for each callback.
+- readers and writers (and so sockets, transports and subprocess pipes) use
+  an :class:`efl.ecore.FdHandler` for each file descriptor.
+- callbacks scheduled with :meth:`~asyncio.loop.call_soon` are collected and
+  run in batches by an :class:`efl.ecore.Idler`.
+
+:meth:`~asyncio.loop.run_forever` and
+:meth:`~asyncio.loop.run_until_complete` run the Ecore main loop, thus they
+can be used in place of :func:`efl.ecore.main_loop_begin` or
+:func:`efl.elementary.run`. As ecore has only one main loop only one
+:class:`EcoreEventLoop` can run at a time.
+
+.. versionadded:: 1.27
+
+"""
+
+import asyncio
+import selectors
+import threading
+import sys
+
+from asyncio import events
+
+from efl import ecore
+
+
+def _fileobj_to_fd(fileobj):
+    if isinstance(fileobj, int):
+        fd = fileobj
+    else:
+        try:
+            fd = int(fileobj.fileno())
+        except (AttributeError, TypeError, ValueError):
+            raise ValueError("Invalid file object: %r" % (fileobj,))
+    if fd < 0:
+        raise ValueError("Invalid file descriptor: %d" % (fd,))
+    return fd
+
+
+class _EcoreSelectorMapping(dict):
+    """Mapping of file objects (or fds) to selector keys."""
+
+    def __getitem__(self, fileobj):
+        return dict.__getitem__(self, _fileobj_to_fd(fileobj))
+
+    def get(self, fileobj, default=None):
+        try:
+            return self[fileobj]
+        except (KeyError, ValueError):
+            return default
+
+    def __contains__(self, fileobj):
+        return self.get(fileobj) is not None
+
+
+class _EcoreSelector(selectors.BaseSelector):
+    """A selector that watch file descriptors using ecore FdHandler.
+
+    Ready events are not collected by :meth:`select`, instead they are
+    delivered to the ``dispatch`` function as soon as ecore notice them.
+
+    """
+
+    def __init__(self, dispatch):
+        self._dispatch = dispatch
+        self._map = _EcoreSelectorMapping()
+        self._handlers = {}
+
+    @staticmethod
+    def _ecore_flags(events):
+        flags = ecore.ECORE_FD_ERROR
+        if events & selectors.EVENT_READ:
+            flags |= ecore.ECORE_FD_READ
+        if events & selectors.EVENT_WRITE:
+            flags |= ecore.ECORE_FD_WRITE
+        return flags
+
+    def _fd_cb(self, fdh, fd):
+        key = self._map.get(fd)
+        if key is None:
+            return ecore.ECORE_CALLBACK_CANCEL
+
+        mask = 0
+        if fdh.has_error():
+            # let the reader/writer discover the error by itself
+            mask = key.events
+        else:
+            if fdh.can_read():
+                mask |= selectors.EVENT_READ
+            if fdh.can_write():
+                mask |= selectors.EVENT_WRITE
+        if mask & key.events:
+            self._dispatch(key, mask & key.events)
+        return ecore.ECORE_CALLBACK_RENEW
+
+    def register(self, fileobj, events, data=None):
+        if not events or events & ~(selectors.EVENT_READ |
+                                    selectors.EVENT_WRITE):
+            raise ValueError("Invalid events: %r" % (events,))
+
+        fd = _fileobj_to_fd(fileobj)
+        if fd in self._handlers:
+            raise KeyError("%r (FD %d) is already registered" % (fileobj, fd))
+
+        key = selectors.SelectorKey(fileobj, fd, events, data)
+        dict.__setitem__(self._map, fd, key)
+        self._handlers[fd] = ecore.FdHandler(fd, self._ecore_flags(events),
+                                             self._fd_cb, fd)
+        return key
+
+    def unregister(self, fileobj):
+        fd = _fileobj_to_fd(fileobj)
+        try:
+            key = dict.pop(self._map, fd)
+        except KeyError:
+            raise KeyError("%r is not registered" % (fileobj,))
+        self._handlers.pop(fd).delete()
+        return key
+
+    def modify(self, fileobj, events, data=None):
+        fd = _fileobj_to_fd(fileobj)
+        try:
+            key = dict.__getitem__(self._map, fd)
+        except KeyError:
+            raise KeyError("%r is not registered" % (fileobj,))
+
+        if events != key.events:
+            self._handlers[fd].active_set(self._ecore_flags(events))
+        key = key._replace(events=events, data=data)
+        dict.__setitem__(self._map, fd, key)
+        return key
+
+    def select(self, timeout=None):
+        # required by BaseSelector, but the loop doesn't poll: ready file
+        # descriptors are dispatched from the FdHandler callbacks
+        raise RuntimeError("the ecore main loop dispatches the file "
+                           "descriptors itself, it can't be polled; run "
+                           "the loop with run_forever() or "
+                           "run_until_complete()")
+
+    def get_key(self, fileobj):
+        try:
+            return self._map[fileobj]
+        except KeyError:
+            raise KeyError("%r is not registered" % (fileobj,))
+
+    def get_map(self):
+        return self._map
+
+    def close(self):
+        for fdh in self._handlers.values():
+            fdh.delete()
+        self._handlers.clear()
+        dict.clear(self._map)
+
+
+class EcoreEventLoop(asyncio.SelectorEventLoop):
+    """An asyncio event loop running on the Ecore main loop.
+
+    All the features of the default :class:`asyncio.SelectorEventLoop` are
+    available (sockets, transports, subprocesses, executors, ...), only the
+    scheduling is delegated to ecore.
+
+    .. versionadded:: 1.27
+
+    """
+
+    def __init__(self):
+        self._timers = {}
+        self._ready_idler = None
+        super().__init__(_EcoreSelector(self._process_fd_event))
+
+    def __repr__(self):
+        return "<%s running=%s closed=%s debug=%s>" % (
+            self.__class__.__name__, self.is_running(), self.is_closed(),
+            self.get_debug())
+
+    # Ready queue (call_soon)
+
+    def _call_soon(self, callback, args, context):
+        handle = super()._call_soon(callback, args, context)
+        # call_soon_threadsafe() from other threads wake up the loop using
+        # the self-pipe, the idler will be added from the reader callback.
+        # Before the loop runs, run_forever() schedules what is ready.
+        if self._thread_id == threading.get_ident():
+            self._schedule_ready()
+        return handle
+
+    def _schedule_ready(self):
+        if self._ready_idler is None and (self._ready or self._stopping):
+            self._ready_idler = ecore.Idler(self._process_ready)
+
+    def _process_ready(self):
+        self._ready_idler = None
+
+        # only run the callbacks that are ready now, the new ones
+        # will be processed in the next batch
+        ntodo = len(self._ready)
+        for _ in range(ntodo):
+            handle = self._ready.popleft()
+            if not handle._cancelled:
+                handle._run()
+        handle = None  # break cycles when exception occurs
+
+        if self._stopping:
+            ecore.main_loop_quit()
+        else:
+            self._schedule_ready()
+        return ecore.ECORE_CALLBACK_CANCEL
+
+    # Timers (call_later, call_at)
+
+    def call_at(self, when, callback, *args, context=None):
+        self._check_closed()
+        if self._debug:
+            self._check_thread()
+            self._check_callback(callback, "call_at")
+
+        handle = events.TimerHandle(when, callback, args, self, context)
+        if handle._source_traceback:
+            del handle._source_traceback[-1]
+        handle._scheduled = True
+        self._timers[handle] = ecore.Timer(max(0.0, when - self.time()),
+                                           self._timer_cb, handle)
+        return handle
+
+    def _timer_cb(self, handle):
+        self._timers.pop(handle, None)
+        handle._scheduled = False
+        if not handle._cancelled:
+            handle._run()
+        self._schedule_ready()
+        return ecore.ECORE_CALLBACK_CANCEL
+
+    def _timer_handle_cancelled(self, handle):
+        timer = self._timers.pop(handle, None)
+        if timer is not None:
+            timer.delete()
+
+    # File descriptors (add_reader, add_writer and internals)
+
+    def _process_fd_event(self, key, mask):
+        reader, writer = key.data
+        if mask & selectors.EVENT_READ and reader is not None:
+            if reader._cancelled:
+                self._remove_reader(key.fd)
+            else:
+                reader._run()
+        if mask & selectors.EVENT_WRITE and writer is not None:
+            if writer._cancelled:
+                self._remove_writer(key.fd)
+            else:
+                writer._run()
+        self._schedule_ready()
+
+    # Running and stopping
+
+    def run_forever(self):
+        """Run the Ecore main loop until :meth:`stop` is called."""
+        self._check_closed()
+        if self.is_running():
+            raise RuntimeError("This event loop is already running")
+        if events._get_running_loop() is not None:
+            raise RuntimeError(
+                "Cannot run the event loop while another loop is running")
+
+        old_agen_hooks = sys.get_asyncgen_hooks()
+        try:
+            self._thread_id = threading.get_ident()
+            sys.set_asyncgen_hooks(firstiter=self._asyncgen_firstiter_hook,
+                                   finalizer=self._asyncgen_finalizer_hook)
+            events._set_running_loop(self)
+            self._schedule_ready()
+            ecore.main_loop_begin()
+        finally:
+            self._stopping = False
+            self._thread_id = None
+            events._set_running_loop(None)
+            sys.set_asyncgen_hooks(*old_agen_hooks)
+
+    def stop(self):
+        """Stop the loop after the currently ready callbacks are run."""
+        super().stop()
+        if self.is_running():
+            self._schedule_ready()
+
+    def close(self):
+        if self.is_running():
+            raise RuntimeError("Cannot close a running event loop")
+        if self.is_closed():
+            return
+        for timer in self._timers.values():
+            timer.delete()
+        self._timers.clear()
+        if self._ready_idler is not None:
+            self._ready_idler.delete()
+            self._ready_idler = None
+        super().close()
+
+
+class EcoreEventLoopPolicy(asyncio.DefaultEventLoopPolicy):
+    """Event loop policy that creates :class:`EcoreEventLoop` instances.
+
+    Install it with :func:`asyncio.set_event_loop_policy` before creating
+    any event loop.
+
+    .. versionadded:: 1.27
+
+    """
+
+    def new_event_loop(self):
+        return EcoreEventLoop()
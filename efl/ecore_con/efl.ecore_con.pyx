@@ -171,7 +171,7 @@ import atexit
 
 
 from efl.ecore cimport _event_mapping_register, _event_mapping_get, \
-    ecore_event_handler_add, ecore_event_handler_del
+    ecore_event_handler_add, ecore_loop_time_get, ecore_time_get
 
 cimport efl.ecore_con.enums as enums
 
@@ -202,6 +202,10 @@ ECORE_CON_URL_HTTP_VERSION_1_1 = enums.ECORE_CON_URL_HTTP_VERSION_1_1
 
 cdef int _con_events_registered = 0
 
+# the Url objects by Ecore_Con_Url address, the events of the handles not
+# created by a Url (like the ones of FileDownload) are ignored
+cdef dict _url_mapping = {}
+
 
 def init():
     """Initialize the Ecore Con library
@@ -241,40 +245,69 @@ def shutdown():
 cdef Eina_Bool _con_event_filter_cb(void *data, int ev_type, void *ev) with gil:
     cdef:
         ConEventFilter filter = <ConEventFilter>data
+        Ecore_Con_Event_Url_Data *url_data
+        Ecore_Con_Event_Url_Progress *progress
+        Url url
+        _UrlSink sink
         object event_cls
         Event py_event
+        dict objs
         list cbs
-        Eo obj
-        object func
-        tuple args
-        dict kargs
-
-    # create correct "EventAbc" python object, using the global mapping
-    event_cls = _event_mapping_get(ev_type)
-    if event_cls:
-        py_event = event_cls()
+        double now
 
-        # object_from_instance can fail in _set_obj if the event is
-        # generated from an object not managed by us, so just ignore it.
-        try:
-            py_event._set_obj(ev)
-        except:
+    try:
+        # all the Url events start with the Ecore_Con_Url
+        url = _url_mapping.get(
+            <uintptr_t>(<Ecore_Con_Event_Url_Complete *>ev).url_con)
+        if url is None:
             return 1
 
+        # the data of get_to_file(), get_into() and get_chunks() is handled
+        # here, without creating any event object
+        if ev_type == ECORE_CON_EVENT_URL_DATA:
+            if url._sink is not None:
+                url_data = <Ecore_Con_Event_Url_Data *>ev
+                url._sink._feed(url_data.data, url_data.size)
+        elif ev_type == ECORE_CON_EVENT_URL_COMPLETE:
+            if url._sink is not None:
+                sink = url._sink
+                url._sink = None
+                sink._finish((<Ecore_Con_Event_Url_Complete *>ev).status)
+        elif ev_type == ECORE_CON_EVENT_URL_PROGRESS and \
+                url._progress_interval > 0:
+            progress = <Ecore_Con_Event_Url_Progress *>ev
+            now = ecore_loop_time_get()
+            if now - url._progress_last < url._progress_interval and not \
+                    (0 < progress.down.total <= progress.down.now):
+                return 1
+            url._progress_last = now
+
         # do we have callbacks for this object/event ?
-        try:
-            obj = py_event._get_obj()
-            cbs = filter.callbacks.get(ev_type).get(obj)
-        except:
-            cbs = None
+        objs = filter.callbacks.get(ev_type)
+        if not objs:
+            return 1
+        cbs = objs.get(url)
+        if not cbs:
+            return 1
 
-        if cbs:
-            cbs = cbs[:] # copy, so we can change filter.callbacks
-            for func, args, kargs in cbs:
-                try:
-                    func(py_event, *args, **kargs)
-                except Exception:
-                    traceback.print_exc()
+        # create correct "EventAbc" python object, using the global mapping
+        event_cls = _event_mapping_get(ev_type)
+        if not event_cls:
+            return 1
+        py_event = event_cls()
+        py_event._set_obj(ev)
+
+        # the callbacks lists are replaced, never changed, on add and del
+        for func, args, kargs in cbs:
+            try:
+                func(py_event, *args, **kargs)
+            except Exception:
+                traceback.print_exc()
+
+        if isinstance(py_event, EventUrlData):
+            (<EventUrlData>py_event)._unset_obj()
+    except Exception:
+        traceback.print_exc()
 
     return 1 # always return true, no matter what
 
@@ -294,46 +327,41 @@ cdef class ConEventFilter(object):
         self.callbacks = {}
         self.handlers = {}
 
-    cdef callback_add(self, int ev_type, Eo obj, object func, tuple args, dict kargs):
-        # store the function in the callbacks dict
-        if not ev_type in self.callbacks:
-            self.callbacks[ev_type] = {}
-        if not obj in self.callbacks[ev_type]:
-            self.callbacks[ev_type][obj] = []
-        self.callbacks[ev_type][obj].append((func,args,kargs))
-
-        # connect a single ecore signal, one per event_type
+    cdef int handler_add(self, int ev_type) except 0:
+        # connect a single ecore signal, one per event_type, kept forever
         cdef Ecore_Event_Handler* ee
         if not ev_type in self.handlers:
             ee = ecore_event_handler_add(ev_type, _con_event_filter_cb,
                                          <void *>self)
             self.handlers[ev_type] = <uintptr_t><void *>ee
+        return 1
+
+    cdef callback_add(self, int ev_type, Eo obj, object func, tuple args, dict kargs):
+        # store the function in the callbacks dict
+        if not ev_type in self.callbacks:
+            self.callbacks[ev_type] = {}
+        cbs = self.callbacks[ev_type].get(obj, [])
+        self.callbacks[ev_type][obj] = cbs + [(func, args, kargs)]
+        self.handler_add(ev_type)
 
     cdef callback_del(self, int ev_type, Eo obj, object func, tuple args, dict kargs):
+        cdef list cbs = list(self.callbacks.get(ev_type, {}).get(obj, []))
         try:
-            self.callbacks[ev_type][obj].remove((func, args, kargs))
+            cbs.remove((func, args, kargs))
         except ValueError:
             raise ValueError(
                 "callback is not registered: %s, args=%s, kargs=%s" %
                 (func, args, kargs))
 
-        # can delete the ecore handler?
-        if self.callbacks.get(ev_type) and self.callbacks.get(ev_type).get(obj):
-            return
-        if ev_type in self.handlers:
-            handler = self.handlers.pop(ev_type)
-            ecore_event_handler_del(<Ecore_Event_Handler *><uintptr_t>handler)
+        if cbs:
+            self.callbacks[ev_type][obj] = cbs
+        else:
+            del self.callbacks[ev_type][obj]
 
     cdef callback_del_full(self, Eo obj):
         for ev_type in self.callbacks:
-            if obj in self.callbacks[ev_type]:
-                # remove all the cbs for the obj
-                self.callbacks[ev_type].pop(obj, None)
-
-                # can delete the ecore handler?
-                if len(self.callbacks[ev_type]) < 1 and ev_type in self.handlers:
-                    handler = self.handlers.pop(ev_type)
-                    ecore_event_handler_del(<Ecore_Event_Handler *><uintptr_t>handler)
+            # remove all the cbs for the obj
+            self.callbacks[ev_type].pop(obj, None)
 
 # name suggestions are welcome for this unusual "singleton" instance
 cdef ConEventFilter GEF = ConEventFilter()
@@ -341,6 +369,7 @@ cdef ConEventFilter GEF = ConEventFilter()
 
 include "efl.ecore_con_lookup.pxi"
 include "efl.ecore_con_url.pxi"
+include "efl.ecore_con_url_pool.pxi"
 
 
 init()
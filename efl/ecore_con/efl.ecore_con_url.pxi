@@ -18,6 +18,21 @@
 # from efl.ecore cimport EventHandler
 # from efl.utils.conversions cimport _ctouni as _charp_to_str
 
+from libc.stdlib cimport realloc, free
+from libc.string cimport memcpy
+from cpython cimport PyBytes_FromStringAndSize, PyObject_GetBuffer, \
+    PyBuffer_Release, PyBUF_WRITABLE
+
+cdef extern from "Python.h":
+    int PyBuffer_FillInfo(Py_buffer *view, obj, void *buf, Py_ssize_t len,
+                          int readonly, int flags) except -1
+
+cdef extern from "Ecore.h":
+    int ecore_main_loop_iterate_may_block(int may_block) nogil
+
+import os
+from collections import deque
+
 
 
 cdef class EventUrlProgress(Event):
@@ -77,11 +92,19 @@ cdef class EventUrlData(Event):
         The data attribute is a raw series of bytes, map to ``str`` in python2
         and ``bytes`` in python3.
 
+    The data is only copied in a new bytes object when the ``data``
+    attribute is read. During the callbacks the event also supports the
+    buffer protocol, ``memoryview(event)`` gives the data as it's stored
+    in ``data``.
+
     attributes:
         * url (:class:`Url`): the object that generate the event
         * size(int): the size of the current received data (in bytes)
         * data(bytes): the data received on this event
 
+    .. versionchanged:: 1.27
+        The data is copied lazily, and available through the buffer protocol
+
     """
     cdef int _set_obj(self, void *ev) except 0:
         cdef Ecore_Con_Event_Url_Data *event
@@ -89,12 +112,184 @@ cdef class EventUrlData(Event):
 
         self.url = <Url>ecore_con_url_data_get(event.url_con)
         self.size = event.size
-        self.data = event.data[:event.size] #raw string copy
+        self._buf = event.data
         return 1
-    
+
+    cdef void _unset_obj(self):
+        self._buf = NULL
+
     cdef object _get_obj(self):
         return self.url
 
+    property data:
+        def __get__(self):
+            if self._data is None:
+                if self._buf == NULL:
+                    raise ValueError("the data of the event is only "
+                                     "available during the callbacks")
+                self._data = self._buf[:self.size] #raw string copy
+            return self._data
+
+    def __getbuffer__(self, Py_buffer *view, int flags):
+        # the C data is freed after the callbacks, the views may outlive it
+        cdef bytes data = self.data
+        PyBuffer_FillInfo(view, self, <char *>data, len(data), 1, flags)
+
+
+cdef class _UrlSink(object):
+    """Receives the data of a request, in place of the data events."""
+
+    cdef int _feed(self, const unsigned char *data, int size) except -1:
+        return 0
+
+    cdef int _finish(self, int status) except 0:
+        return 1
+
+
+cdef class _UrlFileSink(_UrlSink):
+    cdef Url url
+    cdef int fd
+
+    cdef int _finish(self, int status) except 0:
+        if self.fd != -1:
+            if self.url.obj2 != NULL:
+                ecore_con_url_fd_set(self.url.obj2, -1)
+            os.close(self.fd)
+            self.fd = -1
+        return 1
+
+
+cdef class _UrlBufferSink(_UrlSink):
+    cdef Py_buffer view
+    cdef bint held
+    cdef Py_ssize_t pos
+
+    def __dealloc__(self):
+        if self.held:
+            PyBuffer_Release(&self.view)
+
+    cdef int _feed(self, const unsigned char *data, int size) except -1:
+        cdef Py_ssize_t n = min(size, self.view.len - self.pos)
+        if n > 0:
+            memcpy(<char *>self.view.buf + self.pos, data, n)
+            self.pos += n
+        return 0
+
+    cdef int _finish(self, int status) except 0:
+        if self.held:
+            PyBuffer_Release(&self.view)
+            self.held = False
+        return 1
+
+
+cdef class UrlChunks(_UrlSink):
+    """Iterator over the data received by :meth:`Url.get_chunks`.
+
+    The data is delivered as bytes objects, received chunks are joined up
+    to the *coalesce* size given to :meth:`Url.get_chunks`, so that large
+    downloads don't create a lot of small objects.
+
+    It can be iterated with both ``for`` and ``async for``. A plain ``for``
+    runs the main loop until more data arrives, so it must not be used from
+    inside the main loop callbacks; use ``async for`` with the
+    :mod:`efl.ecore_asyncio` event loop there::
+
+        for chunk in url.get_chunks(65536):
+            out.write(chunk)
+
+        async def download(url):
+            async for chunk in url.get_chunks(65536):
+                out.write(chunk)
+
+    :ivar int status: the status of the completed request, 0 if the request
+        didn't complete yet or was deleted.
+
+    .. versionadded:: 1.27
+
+    """
+    cdef object ready
+    cdef object waiter
+    cdef char *buf
+    cdef Py_ssize_t buf_len, buf_size, coalesce
+    cdef bint done
+    cdef readonly int status
+
+    def __cinit__(self):
+        self.ready = deque()
+        self.buf = NULL
+        self.buf_len = 0
+        self.buf_size = 0
+
+    def __dealloc__(self):
+        free(self.buf)
+
+    cdef int _push(self, bytes chunk) except 0:
+        waiter, self.waiter = self.waiter, None
+        if waiter is not None and not waiter.done():
+            waiter.set_result(chunk)
+        else:
+            self.ready.append(chunk)
+        return 1
+
+    cdef int _feed(self, const unsigned char *data, int size) except -1:
+        cdef char *buf
+        if self.coalesce <= 0:
+            self._push(PyBytes_FromStringAndSize(<char *>data, size))
+            return 0
+
+        if self.buf_len + size > self.buf_size:
+            buf = <char *>realloc(self.buf,
+                                  max(self.coalesce, self.buf_len + size))
+            if buf == NULL:
+                raise MemoryError
+            self.buf = buf
+            self.buf_size = max(self.coalesce, self.buf_len + size)
+        memcpy(self.buf + self.buf_len, data, size)
+        self.buf_len += size
+        if self.buf_len >= self.coalesce:
+            self._push(PyBytes_FromStringAndSize(self.buf, self.buf_len))
+            self.buf_len = 0
+        return 0
+
+    cdef int _finish(self, int status) except 0:
+        if self.buf_len > 0:
+            self._push(PyBytes_FromStringAndSize(self.buf, self.buf_len))
+            self.buf_len = 0
+        self.status = status
+        self.done = True
+        waiter, self.waiter = self.waiter, None
+        if waiter is not None and not waiter.done():
+            waiter.set_exception(StopAsyncIteration())
+        return 1
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        while not self.ready:
+            if self.done:
+                raise StopIteration
+            with nogil:
+                ecore_main_loop_iterate_may_block(1)
+        return self.ready.popleft()
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        import asyncio
+
+        fut = asyncio.get_running_loop().create_future()
+        if self.ready:
+            fut.set_result(self.ready.popleft())
+        elif self.done:
+            fut.set_exception(StopAsyncIteration())
+        elif self.waiter is not None and not self.waiter.done():
+            raise RuntimeError("already waiting for the next chunk")
+        else:
+            self.waiter = fut
+        return fut
+
 
 cdef class Url(Eo):
     """
@@ -186,6 +381,12 @@ cdef class Url(Eo):
         u = ecore.Url('http://example.com', fd=fd.fileno())
         u.get()
 
+    or more simply :func:`get_to_file`. Large downloads can also be received
+    in a preallocated buffer with :func:`get_into`, or iterated in chunks of
+    a given size with :func:`get_chunks`, without creating an event object
+    for each chunk. The :attr:`progress_interval` property limits the rate
+    of the progress events.
+
     .. seealso::
         If you just need to download a file please consider using the
         simpler :class:`efl.ecore.FileDownload` class instead.
@@ -226,6 +427,7 @@ cdef class Url(Eo):
                 <const char *>custom_request if custom_request is not None else NULL)
 
         ecore_con_url_data_set(self.obj2, <void *>self)
+        _url_mapping[<uintptr_t>self.obj2] = self
         Py_INCREF(self)
         self._set_properties_from_keyword_args(kargs)
 
@@ -242,6 +444,11 @@ cdef class Url(Eo):
 
         """
         GEF.callback_del_full(self)
+        if self._sink is not None:
+            sink = self._sink
+            self._sink = None
+            sink._finish(0)
+        _url_mapping.pop(<uintptr_t>self.obj2, None)
         ecore_con_url_free(self.obj2)
         self.obj2 = NULL
         Py_DECREF(self)
@@ -286,6 +493,107 @@ cdef class Url(Eo):
         """
         return bool(ecore_con_url_get(self.obj2))
 
+    cdef int _sink_get(self, _UrlSink sink) except 0:
+        # -1 if the request could not be sent, the sink is left to the
+        # caller to finish
+        if self._sink is not None:
+            raise ValueError("a request is already in progress")
+        GEF.handler_add(ECORE_CON_EVENT_URL_DATA)
+        GEF.handler_add(ECORE_CON_EVENT_URL_COMPLETE)
+        self._sink = sink
+        if not ecore_con_url_get(self.obj2):
+            self._sink = None
+            return -1
+        return 1
+
+    def get_to_file(self, path):
+        """Send a GET request, writing the response data in a file.
+
+        The file is created, or truncated, and the data written to it
+        directly by ecore, no :class:`EventUrlData` events are emitted. The
+        file is closed when the request completes, before the
+        :class:`EventUrlComplete` callbacks are called.
+
+        :param path: the path of the file to write.
+        :type path: string
+        :return: ``True`` on success, ``False`` on error.
+        :raise ValueError: if a request is already in progress.
+
+        .. versionadded:: 1.27
+
+        """
+        cdef _UrlFileSink sink
+
+        # the fd of a running request must not be replaced
+        if self._sink is not None:
+            raise ValueError("a request is already in progress")
+        sink = _UrlFileSink()
+        sink.url = self
+        sink.fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        ecore_con_url_fd_set(self.obj2, sink.fd)
+        ok = False
+        try:
+            ok = self._sink_get(sink) == 1
+        finally:
+            if not ok:
+                # closes the file
+                sink._finish(0)
+        return ok
+
+    def get_into(self, buf, Py_ssize_t offset=0):
+        """Send a GET request, copying the response data in a buffer.
+
+        The data is copied in **buf** as it is received, no
+        :class:`EventUrlData` events are emitted. Data that doesn't fit in
+        **buf** is discarded, :attr:`received_bytes` tells how much was
+        received.
+
+        :param buf: a writable object supporting the buffer protocol, like a
+            :class:`bytearray`, kept until the request completes.
+        :param offset: where to copy the data in **buf**.
+        :type offset: int
+        :return: ``True`` on success, ``False`` on error.
+        :raise ValueError: if a request is already in progress, or if
+            **offset** is out of **buf**.
+
+        .. versionadded:: 1.27
+
+        """
+        cdef _UrlBufferSink sink
+
+        if self._sink is not None:
+            raise ValueError("a request is already in progress")
+        sink = _UrlBufferSink()
+        PyObject_GetBuffer(buf, &sink.view, PyBUF_WRITABLE)
+        sink.held = True
+        if offset < 0 or offset > sink.view.len:
+            raise ValueError("offset %d is out of the buffer" % offset)
+        sink.pos = offset
+        if self._sink_get(sink) != 1:
+            sink._finish(0)
+            return False
+        return True
+
+    def get_chunks(self, Py_ssize_t coalesce=0):
+        """Send a GET request, returning an iterator over the response data.
+
+        :param coalesce: the received data is joined in chunks of at least
+            this size, the last one excepted. With 0 every chunk received is
+            given as is.
+        :type coalesce: int
+        :return: an iterator over bytes objects, see :class:`UrlChunks`.
+        :rtype: :class:`UrlChunks`
+        :raise SystemError: if the request can't be sent.
+
+        .. versionadded:: 1.27
+
+        """
+        cdef UrlChunks chunks = UrlChunks()
+        chunks.coalesce = coalesce
+        if self._sink_get(chunks) != 1:
+            raise SystemError("could not send the GET request")
+        return chunks
+
     def head(self):
         """Send a HEAD request.
 
@@ -615,6 +923,24 @@ cdef class Url(Eo):
         def __set__(self, double timeout):
             ecore_con_url_timeout_set(self.obj2, timeout)
 
+    property progress_interval:
+        """The minimal interval between two progress events, in seconds.
+
+        The :class:`EventUrlProgress` events received more often are
+        skipped, except the one of a completed download. Defaults to 0,
+        every progress event is delivered.
+
+        :type: double
+
+        .. versionadded:: 1.27
+
+        """
+        def __set__(self, double interval):
+            self._progress_interval = interval
+
+        def __get__(self):
+            return self._progress_interval
+
     property http_version:
         """The HTTP version used for the request.
 
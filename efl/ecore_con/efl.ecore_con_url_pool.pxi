@@ -0,0 +1,424 @@
+# Copyright (C) 2007-2022 various contributors (see AUTHORS)
+#
+# This file is part of Python-EFL.
+#
+# Python-EFL is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 3 of the License, or (at your option) any later version.
+#
+# Python-EFL is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this Python-EFL.  If not, see <http://www.gnu.org/licenses/>.
+
+from heapq import heappush, heappop
+
+
+cdef class UrlRequest(_UrlSink):
+    """A GET request queued in an :class:`UrlPool`.
+
+    Returned by :meth:`UrlPool.get`, it receives the response data and
+    notifies its completion to the callback given to :meth:`UrlPool.get`,
+    and to the futures of :meth:`future`. With the :mod:`efl.ecore_asyncio`
+    event loop the request can be awaited directly::
+
+        request = await pool.get("http://example.com/tile.png")
+        if request.status == 200:
+            image.data = request.data
+
+    :ivar string url: the requested URL.
+    :ivar int priority: the priority given to :meth:`UrlPool.get`.
+    :ivar int status: the HTTP status code, 0 until the request completes
+        or if it failed.
+    :ivar bool done: whether the request completed or was cancelled.
+    :ivar bool cancelled: whether the request was cancelled.
+    :ivar int size: the number of bytes received so far.
+
+    .. versionadded:: 1.27
+
+    """
+    cdef UrlPool pool
+    cdef Url handle
+    cdef readonly object url
+    cdef readonly int priority
+    cdef readonly int status
+    cdef readonly bint done, cancelled
+    cdef readonly Py_ssize_t size
+    cdef object func, args, kargs, waiters
+    cdef bytes _data
+    cdef char *buf
+    cdef Py_ssize_t buf_size
+
+    def __cinit__(self):
+        self.waiters = []
+        self.buf = NULL
+        self.buf_size = 0
+
+    def __dealloc__(self):
+        free(self.buf)
+
+    def __repr__(self):
+        return "<%s(url=%r, priority=%d, status=%d, size=%d, done=%s)>" % (
+            self.__class__.__name__, self.url, self.priority, self.status,
+            self.size, self.done)
+
+    cdef int _feed(self, const unsigned char *data, int size) except -1:
+        cdef char *buf
+        if self.size + size > self.buf_size:
+            buf = <char *>realloc(self.buf,
+                                  max(2 * self.buf_size, self.size + size))
+            if buf == NULL:
+                raise MemoryError
+            self.buf = buf
+            self.buf_size = max(2 * self.buf_size, self.size + size)
+        memcpy(self.buf + self.size, data, size)
+        self.size += size
+        if self.pool is not None:
+            self.pool._bytes_received += size
+        return 0
+
+    cdef int _finish(self, int status) except 0:
+        cdef UrlPool pool = self.pool
+        if pool is None:
+            # cancelled
+            return 1
+        self.pool = None
+        self.status = status
+        self._data = PyBytes_FromStringAndSize(self.buf, self.size)
+        free(self.buf)
+        self.buf = NULL
+        self.buf_size = 0
+        # done before the next requests start, their callbacks may cancel us
+        self.done = True
+
+        # the next request starts before the callbacks are called
+        pool._request_done(self)
+
+        waiters, self.waiters = self.waiters, []
+        for fut in waiters:
+            if not fut.done():
+                fut.set_result(self)
+        if self.func is not None:
+            try:
+                self.func(self, *self.args, **self.kargs)
+            except Exception:
+                traceback.print_exc()
+        return 1
+
+    property data:
+        """The response data, once the request completed.
+
+        :type: bytes or None
+
+        """
+        def __get__(self):
+            return self._data
+
+    def cancel(self):
+        """Cancel the request.
+
+        A queued request is removed from the queue, a running one is
+        aborted. The callback is not called, the futures are cancelled.
+
+        :return: ``False`` if the request was already done.
+        :rtype: bool
+
+        """
+        cdef UrlPool pool = self.pool
+        if self.done:
+            return False
+        self.pool = None
+        self.cancelled = True
+        self.done = True
+        free(self.buf)
+        self.buf = NULL
+        self.buf_size = 0
+        pool._request_cancel(self)
+        waiters, self.waiters = self.waiters, []
+        for fut in waiters:
+            fut.cancel()
+        return True
+
+    def future(self):
+        """Get an asyncio future done when the request completes.
+
+        :return: a future with this request as result.
+        :rtype: :class:`asyncio.Future`
+
+        """
+        import asyncio
+
+        fut = asyncio.get_running_loop().create_future()
+        if self.cancelled:
+            fut.cancel()
+        elif self.done:
+            fut.set_result(self)
+        else:
+            self.waiters.append(fut)
+        return fut
+
+    def __await__(self):
+        return self.future().__await__()
+
+
+cdef class UrlPool(object):
+    """A pool running many GET requests with a limited concurrency.
+
+    Fetching a lot of small resources with one :class:`Url` per request
+    means creating, tracking and deleting all of them, and starting all the
+    requests at once. An :class:`UrlPool` queues the requests given to
+    :meth:`get` and runs at most **max_active** of them at a time, higher
+    priorities first, reusing the same :class:`Url` handles for the
+    successive requests. The response data is received without creating
+    any event object::
+
+        def on_tile(request, x, y):
+            if request.status == 200:
+                tiles[x, y] = request.data
+
+        pool = ecore_con.UrlPool(max_active=4, timeout=30.0)
+        for x, y in visible_tiles:
+            pool.get(tile_url(x, y), on_tile, x, y, priority=zoom)
+
+    Enabling HTTP pipelining with :func:`url_pipeline_set` also lets the
+    requests to the same server share the connections.
+
+    .. warning::
+        Call :meth:`close` when the pool is no more needed, it deletes the
+        :class:`Url` handles kept for the next requests.
+
+    :param max_active: the maximum number of requests running at a time.
+    :type max_active: int
+    :param \\**kargs: properties set on each :class:`Url` of the pool, like
+        timeout or ssl_verify_peer.
+    :raise AttributeError: if :class:`Url` has no such property.
+
+    .. versionadded:: 1.27
+
+    """
+    cdef int _max_active
+    cdef dict kargs
+    cdef list queue, idle, running
+    cdef Py_ssize_t seq, n_queued
+    cdef readonly long completed, failed
+    cdef long long _bytes_received
+    cdef double busy_time, busy_start
+    cdef bint closed, running_queue
+
+    def __cinit__(self):
+        self.queue = []
+        self.idle = []
+        self.running = []
+
+    def __init__(self, int max_active=6, **kargs):
+        if max_active < 1:
+            raise ValueError("max_active must be at least 1")
+        for name in kargs:
+            if not hasattr(Url, name):
+                raise AttributeError("Url has no property %r" % (name,))
+        self._max_active = max_active
+        self.kargs = kargs
+
+    def __repr__(self):
+        return ("<%s(max_active=%d, active=%d, queued=%d, completed=%d, "
+                "failed=%d, bytes_per_second=%.0f)>") % (
+            self.__class__.__name__, self._max_active, len(self.running),
+            self.n_queued, self.completed, self.failed,
+            self.bytes_per_second)
+
+    def get(self, url, func=None, *args, int priority=0, **kargs):
+        """Queue a GET request.
+
+        The given function will be called with the following signature when
+        the request completes::
+
+            func(request, *args, **kargs)
+
+        :param url: the URL to get.
+        :type url: string
+        :param func: the function to call on completion, or None.
+        :param priority: requests with higher priorities are started first,
+            in the order they were queued for equal priorities.
+        :type priority: int
+        :return: the request.
+        :rtype: :class:`UrlRequest`
+        :raise ValueError: if the pool is closed.
+
+        """
+        cdef UrlRequest request
+
+        if self.closed:
+            raise ValueError("the pool is closed")
+        request = UrlRequest()
+        request.pool = self
+        request.url = url
+        request.priority = priority
+        request.func = func
+        request.args = args
+        request.kargs = kargs
+        heappush(self.queue, (-priority, self.seq, request))
+        self.seq += 1
+        self.n_queued += 1
+        self._run()
+        return request
+
+    cdef int _run(self) except 0:
+        cdef UrlRequest request
+        if self.running_queue:
+            # a request finished by the loop below, or its callback
+            return 1
+        self.running_queue = True
+        try:
+            while self.n_queued > 0 and len(self.running) < self._max_active:
+                request = heappop(self.queue)[2]
+                if request.cancelled:
+                    continue
+                self.n_queued -= 1
+                if not self._start(request):
+                    request._finish(0)
+        finally:
+            self.running_queue = False
+        return 1
+
+    cdef int _start(self, UrlRequest request) except -1:
+        # 0 if the request could not be started
+        cdef Url handle
+        if self.idle:
+            handle = self.idle.pop()
+            try:
+                handle.url = request.url
+            except Exception:
+                traceback.print_exc()
+                self.idle.append(handle)
+                return 0
+        else:
+            try:
+                handle = Url(request.url)
+            except Exception:
+                # like an invalid url
+                traceback.print_exc()
+                return 0
+            try:
+                for name, value in self.kargs.items():
+                    setattr(handle, name, value)
+            except Exception:
+                # like an invalid pool property value
+                traceback.print_exc()
+                handle.delete()
+                return 0
+        if not self.running:
+            self.busy_start = ecore_time_get()
+        self.running.append(request)
+        request.handle = handle
+        return handle._sink_get(request) == 1
+
+    cdef int _handle_release(self, UrlRequest request) except 0:
+        cdef Url handle = request.handle
+        request.handle = None
+        self.running.remove(request)
+        if not self.running:
+            self.busy_time += ecore_time_get() - self.busy_start
+        return 1
+
+    cdef int _request_done(self, UrlRequest request) except 0:
+        cdef Url handle = request.handle
+        if 200 <= request.status < 400:
+            self.completed += 1
+        else:
+            self.failed += 1
+        # no handle if its Url could not be created
+        if handle is not None:
+            self._handle_release(request)
+            if self.closed or len(self.idle) >= self._max_active:
+                handle.delete()
+            else:
+                self.idle.append(handle)
+        self._run()
+        return 1
+
+    cdef int _request_cancel(self, UrlRequest request) except 0:
+        cdef Url handle = request.handle
+        if handle is None:
+            # still queued, it's skipped when popped
+            self.n_queued -= 1
+            return 1
+        self._handle_release(request)
+        handle.delete()
+        self._run()
+        return 1
+
+    def close(self):
+        """Cancel all the requests and delete the :class:`Url` handles.
+
+        The pool can't be used anymore after this.
+
+        """
+        self.closed = True
+        for item in self.queue:
+            item[2].cancel()
+        self.queue = []
+        for request in list(self.running):
+            request.cancel()
+        for handle in self.idle:
+            handle.delete()
+        self.idle = []
+
+    property max_active:
+        """The maximum number of requests running at a time.
+
+        :type: int
+
+        """
+        def __set__(self, int max_active):
+            if max_active < 1:
+                raise ValueError("max_active must be at least 1")
+            self._max_active = max_active
+            self._run()
+
+        def __get__(self):
+            return self._max_active
+
+    property active:
+        """The number of requests running.
+
+        :type: int
+
+        """
+        def __get__(self):
+            return len(self.running)
+
+    property queued:
+        """The number of requests waiting to be started.
+
+        :type: int
+
+        """
+        def __get__(self):
+            return self.n_queued
+
+    property bytes_received:
+        """The number of bytes received by all the requests.
+
+        :type: int
+
+        """
+        def __get__(self):
+            return self._bytes_received
+
+    property bytes_per_second:
+        """The download rate, over the time some requests were running.
+
+        :type: float
+
+        """
+        def __get__(self):
+            cdef double busy = self.busy_time
+            if self.running:
+                busy += ecore_time_get() - self.busy_start
+            if busy <= 0:
+                return 0.0
+            return self._bytes_received / busy
@@ -31,19 +31,24 @@ Classes
 """
 
 from cpython cimport PyMem_Malloc, PyMem_Free, PyUnicode_AsUTF8String
+from cpython.buffer cimport PyObject_CheckBuffer, PyObject_GetBuffer, \
+    PyBuffer_Release, PyBUF_FORMAT, PyBUF_C_CONTIGUOUS
 cimport libc.stdlib
 from libc.stdint cimport uintptr_t
+from libc.string cimport memcpy
 
 from efl.eina cimport eina_list_free, eina_stringshare_del, Eina_Stringshare
 from efl.eo cimport _object_mapping_register, object_from_instance, \
     _register_decorated_callbacks
 
-from efl.utils.conversions cimport _ctouni, _touni, \
-    eina_list_strings_to_python_list
+from efl.utils.conversions cimport _ctouni, _touni, _ctouni_cached, \
+    _tobytes_cached, eina_list_strings_to_python_list
 
 import traceback
 import warnings
 import atexit
+import fnmatch
+import re
 
 cimport efl.edje.enums as enums
 
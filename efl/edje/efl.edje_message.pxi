@@ -16,12 +16,48 @@
 # along with this Python-EFL.  If not, see <http://www.gnu.org/licenses/>.
 
 
+from cpython.buffer cimport Py_buffer, PyBUF_WRITABLE, PyBUF_FORMAT, \
+    PyBUF_ND, PyBUF_STRIDES
+from cpython.bytes cimport PyBytes_FromStringAndSize
+
+
+cdef int _message_buffer_get(Message msg, Py_buffer *view, int flags,
+                             const void *buf, int count, Py_ssize_t itemsize,
+                             char *fmt) except -1:
+    # Edje frees the message after the handler, the views may outlive it:
+    # the values are copied once into the message and exported from there.
+    # The shape and strides point to the message, not to the caller's view.
+    if flags & PyBUF_WRITABLE:
+        raise BufferError("message values are read-only")
+    if msg._data is None:
+        if buf == NULL:
+            raise ValueError("Object uninitialized")
+        msg._data = PyBytes_FromStringAndSize(<const char *>buf,
+                                              count * itemsize)
+        msg._count = count
+        msg._stride = itemsize
+    view.buf = <char *>msg._data
+    view.len = msg._count * msg._stride
+    view.readonly = 1
+    view.itemsize = msg._stride
+    view.format = fmt if flags & PyBUF_FORMAT else NULL
+    view.ndim = 1
+    view.shape = &msg._count if flags & PyBUF_ND else NULL
+    view.strides = &msg._stride if flags & PyBUF_STRIDES else NULL
+    view.suboffsets = NULL
+    view.internal = NULL
+    return 0
+
+
 cdef class Message:
     """Base class to represent Edje messages.
 
     :ivar type: message type.
     :ivar id: message id.
     """
+    cdef void _unset_obj(self):
+        pass
+
     property type:
         def __get__(self):
             return self._type
@@ -37,6 +73,9 @@ cdef class MessageString(Message):
     :ivar str: message contents.
     :ivar val: same as str.
     """
+    cdef void _unset_obj(self):
+        self.obj = NULL
+
     property str:
         def __get__(self):
             if self.obj == NULL:
@@ -57,6 +96,9 @@ cdef class MessageInt(Message):
 
     :ivar val: message contents.
     """
+    cdef void _unset_obj(self):
+        self.obj = NULL
+
     property val:
         def __get__(self):
             if self.obj == NULL:
@@ -69,6 +111,9 @@ cdef class MessageFloat(Message):
 
     :ivar val: message contents.
     """
+    cdef void _unset_obj(self):
+        self.obj = NULL
+
     property val:
         def __get__(self):
             if self.obj == NULL:
@@ -81,6 +126,9 @@ cdef class MessageStringSet(Message):
 
     :ivar val: message contents.
     """
+    cdef void _unset_obj(self):
+        self.obj = NULL
+
     property val:
         def __get__(self):
             cdef int i
@@ -109,7 +157,18 @@ cdef class MessageIntSet(Message):
     """Integer set message.
 
     :ivar val: message contents.
+
+    The values can also be accessed through the buffer protocol, for
+    example ``memoryview(msg)``. They are copied from the Edje message on
+    the first export, so the views stay valid after the handler returns.
+    Format is ``i`` (int).
+
+    .. versionchanged:: 1.27
+        Support for the buffer protocol
     """
+    cdef void _unset_obj(self):
+        self.obj = NULL
+
     property val:
         def __get__(self):
             cdef int i
@@ -132,12 +191,31 @@ cdef class MessageIntSet(Message):
             raise IndexError("list index out of range")
         return self.obj.val[index]
 
+    def __getbuffer__(self, Py_buffer *view, int flags):
+        if self.obj == NULL:
+            _message_buffer_get(self, view, flags, NULL, 0, sizeof(int), "i")
+        else:
+            _message_buffer_get(self, view, flags, <void *>self.obj.val,
+                                self.obj.count, sizeof(int), "i")
+        view.obj = self
+
 
 cdef class MessageFloatSet(Message):
     """Float set message.
 
     :ivar val: message contents.
+
+    The values can also be accessed through the buffer protocol, for
+    example ``memoryview(msg)``. They are copied from the Edje message on
+    the first export, so the views stay valid after the handler returns.
+    Format is ``d`` (double).
+
+    .. versionchanged:: 1.27
+        Support for the buffer protocol
     """
+    cdef void _unset_obj(self):
+        self.obj = NULL
+
     property val:
         def __get__(self):
             cdef int i
@@ -160,6 +238,14 @@ cdef class MessageFloatSet(Message):
             raise IndexError("list index out of range")
         return self.obj.val[index]
 
+    def __getbuffer__(self, Py_buffer *view, int flags):
+        if self.obj == NULL:
+            _message_buffer_get(self, view, flags, NULL, 0, sizeof(double), "d")
+        else:
+            _message_buffer_get(self, view, flags, <void *>self.obj.val,
+                                self.obj.count, sizeof(double), "d")
+        view.obj = self
+
 
 cdef class MessageStringInt(Message):
     """String + Integer message.
@@ -167,6 +253,9 @@ cdef class MessageStringInt(Message):
     :ivar str: string.
     :ivar val: integer.
     """
+    cdef void _unset_obj(self):
+        self.obj = NULL
+
     property str:
         def __get__(self):
             if self.obj == NULL:
@@ -187,6 +276,9 @@ cdef class MessageStringFloat(Message):
     :ivar str: string.
     :ivar val: float.
     """
+    cdef void _unset_obj(self):
+        self.obj = NULL
+
     property str:
         def __get__(self):
             if self.obj == NULL:
@@ -206,7 +298,18 @@ cdef class MessageStringIntSet(Message):
 
     :ivar str: string.
     :ivar val: integer list.
+
+    The values can also be accessed through the buffer protocol, for
+    example ``memoryview(msg)``. They are copied from the Edje message on
+    the first export, so the views stay valid after the handler returns.
+    Format is ``i`` (int).
+
+    .. versionchanged:: 1.27
+        Support for the buffer protocol
     """
+    cdef void _unset_obj(self):
+        self.obj = NULL
+
     property str:
         def __get__(self):
             if self.obj == NULL:
@@ -236,13 +339,32 @@ cdef class MessageStringIntSet(Message):
             raise IndexError("list index out of range")
         return self.obj.val[index]
 
+    def __getbuffer__(self, Py_buffer *view, int flags):
+        if self.obj == NULL:
+            _message_buffer_get(self, view, flags, NULL, 0, sizeof(int), "i")
+        else:
+            _message_buffer_get(self, view, flags, <void *>self.obj.val,
+                                self.obj.count, sizeof(int), "i")
+        view.obj = self
+
 
 cdef class MessageStringFloatSet(Message):
     """String + Float set message.
 
     :ivar str: string.
     :ivar val: float list.
+
+    The values can also be accessed through the buffer protocol, for
+    example ``memoryview(msg)``. They are copied from the Edje message on
+    the first export, so the views stay valid after the handler returns.
+    Format is ``d`` (double).
+
+    .. versionchanged:: 1.27
+        Support for the buffer protocol
     """
+    cdef void _unset_obj(self):
+        self.obj = NULL
+
     property str:
         def __get__(self):
             if self.obj == NULL:
@@ -272,6 +394,14 @@ cdef class MessageStringFloatSet(Message):
             raise IndexError("list index out of range")
         return self.obj.val[index]
 
+    def __getbuffer__(self, Py_buffer *view, int flags):
+        if self.obj == NULL:
+            _message_buffer_get(self, view, flags, NULL, 0, sizeof(double), "d")
+        else:
+            _message_buffer_get(self, view, flags, <void *>self.obj.val,
+                                self.obj.count, sizeof(double), "d")
+        view.obj = self
+
 
 cdef Message MessageString_from_ptr(void *msg):
     cdef MessageString m
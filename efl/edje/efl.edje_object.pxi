@@ -16,6 +16,8 @@
 # along with this Python-EFL.  If not, see <http://www.gnu.org/licenses/>.
 
 from efl.evas cimport Object
+from efl.utils.conversions cimport buffer_format_code
+
 
 cdef void text_change_cb(void *data,
                          Evas_Object *obj,
@@ -36,26 +38,109 @@ cdef void message_handler_cb(void *data,
                              Edje_Message_Type type,
                              int id, void *msg) with gil:
     cdef Edje self
+    cdef Message m
     self = <Edje>data
     if self._message_handler_cb is None:
         return
     func, args, kargs = self._message_handler_cb
+    m = Message_from_type(type, id, msg)
     try:
-        func(self, Message_from_type(type, id, msg), *args, **kargs)
+        func(self, m, *args, **kargs)
     except Exception:
         traceback.print_exc()
+    if m is not None:
+        # edje frees the message when the handler returns
+        m._unset_obj()
+
+
+cdef object _signal_pattern_compile(pattern):
+    """
+
+    A pattern as used by _EdjeSignalCallbacks.match(): None matches
+    everything, a string only itself, otherwise a compiled glob.
+
+    """
+    if pattern is None:
+        return u""
+    if isinstance(pattern, bytes):
+        pattern = pattern.decode("UTF-8")
+    if pattern == u"*":
+        return None
+    if not any(c in pattern for c in u"*?["):
+        return pattern
+    return re.compile(fnmatch.translate(pattern))
+
+
+cdef class _EdjeSignalCallbacks:
+    """The callbacks of an (emission, source) pair"""
+    cdef:
+        Edje obj
+        object emission_pattern, source_pattern
+        bint glob
+        list callbacks
+
+    def __cinit__(self, Edje obj, emission, source):
+        self.obj = obj
+        self.emission_pattern = _signal_pattern_compile(emission)
+        self.source_pattern = _signal_pattern_compile(source)
+        self.glob = not isinstance(self.emission_pattern, unicode) or \
+            not isinstance(self.source_pattern, unicode)
+        self.callbacks = []
+
+    cdef bint match(self, emission, source):
+        cdef object p
+        p = self.emission_pattern
+        if p is not None:
+            if isinstance(p, unicode):
+                if p != emission:
+                    return 0
+            elif p.match(emission) is None:
+                return 0
+        p = self.source_pattern
+        if p is not None:
+            if isinstance(p, unicode):
+                if p != source:
+                    return 0
+            elif p.match(source) is None:
+                return 0
+        return 1
+
+    cdef int call(self, emission, source) except 0:
+        # the list is replaced, not changed in place, when callbacks are
+        # added or removed
+        for func, args, kargs in self.callbacks:
+            try:
+                if args or kargs:
+                    func(self.obj, emission, source, *args, **kargs)
+                else:
+                    func(self.obj, emission, source)
+            except Exception:
+                traceback.print_exc()
+        return 1
 
 
 cdef void signal_cb(void *data, Evas_Object *obj,
                     const char *emission, const char *source) with gil:
-    cdef Edje self
-    self = object_from_instance(obj)
-    lst = tuple(<object>data)
-    for func, args, kargs in lst:
-        try:
-            func(self, _ctouni(emission), _ctouni(source), *args, **kargs)
-        except Exception:
-            traceback.print_exc()
+    cdef _EdjeSignalCallbacks cbs = <_EdjeSignalCallbacks>data
+    try:
+        cbs.call(_ctouni_cached(emission), _ctouni_cached(source))
+    except Exception:
+        traceback.print_exc()
+
+
+cdef void signal_glob_cb(void *data, Evas_Object *obj,
+                         const char *emission, const char *source) with gil:
+    cdef:
+        Edje self = <Edje>data
+        _EdjeSignalCallbacks cbs
+    try:
+        em = _ctouni_cached(emission)
+        src = _ctouni_cached(source)
+        for cbs in self._signal_globs:
+            if cbs.match(em, src):
+                cbs.call(em, src)
+    except Exception:
+        traceback.print_exc()
 
 
 class EdjeLoadError(Exception):
@@ -103,6 +188,7 @@ cdef class Edje(Object):
     """
     def __cinit__(self, *a, **ka):
         self._signal_callbacks = {}
+        self._signal_globs = []
 
     def __init__(self, Canvas canvas not None, file=None, group=None, size=None,
                  geometry=None, **kwargs):
@@ -134,6 +220,7 @@ cdef class Edje(Object):
 
     def __free_wrapper_resources(self, ed):
         self._signal_callbacks.clear()
+        self._signal_globs = []
         self._text_change_cb = None
         self._message_handler_cb = None
 
@@ -596,7 +683,7 @@ cdef class Edje(Object):
 
     def part_exists(self, part):
         """:rtype: bool"""
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         return bool(edje_object_part_exists(self.obj,
                         <const char *>part if part is not None else NULL))
 
@@ -611,7 +698,7 @@ cdef class Edje(Object):
 
         """
         cdef Evas_Object *obj
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         obj = <Evas_Object*>edje_object_part_object_get(self.obj,
                             <const char *>part if part is not None else NULL)
         return object_from_instance(obj)
@@ -619,7 +706,7 @@ cdef class Edje(Object):
     def part_geometry_get(self, part):
         """:rtype: tuple of int"""
         cdef int x, y, w, h
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         edje_object_part_geometry_get(self.obj,
                             <const char *>part if part is not None else NULL,
                             &x, &y, &w, &h)
@@ -628,7 +715,7 @@ cdef class Edje(Object):
     def part_size_get(self, part):
         """:rtype: tuple of int"""
         cdef int w, h
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         edje_object_part_geometry_get(self.obj,
             <const char *>part if part is not None else NULL,
             NULL, NULL, &w, &h)
@@ -637,7 +724,7 @@ cdef class Edje(Object):
     def part_pos_get(self, part):
         """:rtype: tuple of int"""
         cdef int x, y
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         edje_object_part_geometry_get(self.obj,
             <const char *>part if part is not None else NULL,
             &x, &y, NULL, NULL)
@@ -669,7 +756,7 @@ cdef class Edje(Object):
         :param text: the new text to set
 
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         if isinstance(text, unicode): text = PyUnicode_AsUTF8String(text)
         edje_object_part_text_set(self.obj,
             <const char *>part if part is not None else NULL,
@@ -683,19 +770,19 @@ cdef class Edje(Object):
 
         """
         cdef const char *s
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         return _ctouni(edje_object_part_text_get(self.obj,
                         <const char *>part if part is not None else NULL))
 
     def part_text_select_all(self, part):
         """Select all the text of the given TEXT or TEXTBLOCK part"""
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         edje_object_part_text_select_all(self.obj,
             <const char *>part if part is not None else NULL)
 
     def part_text_select_none(self, part):
         """Deselect all the text of the given TEXT or TEXTBLOCK part"""
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         edje_object_part_text_select_none(self.obj,
             <const char *>part if part is not None else NULL)
 
@@ -709,7 +796,7 @@ cdef class Edje(Object):
         :see: part_text_set()
         :see: part_text_unescaped_get()
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         if isinstance(text_to_escape, unicode):
             text_to_escape = PyUnicode_AsUTF8String(text_to_escape)
         edje_object_part_text_unescaped_set(self.obj,
@@ -726,7 +813,7 @@ cdef class Edje(Object):
         :see: part_text_unescaped_set()
         """
         cdef char *s
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         s = edje_object_part_text_unescaped_get(self.obj,
                 <const char *>part if part is not None else NULL)
         if s == NULL:
@@ -748,7 +835,7 @@ cdef class Edje(Object):
         .. versionadded:: 1.12
 
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         edje_object_part_text_input_hint_set(self.obj,
                             <const char *>part if part is not None else NULL,
                             input_hints)
@@ -763,7 +850,7 @@ cdef class Edje(Object):
 
         """
 
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         return edje_object_part_text_input_hint_get(self.obj,
                             <const char *>part if part is not None else NULL)
 
@@ -780,7 +867,7 @@ cdef class Edje(Object):
         .. versionadded:: 1.20
 
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         if isinstance(hint, unicode): hint = PyUnicode_AsUTF8String(hint)
         edje_object_part_text_prediction_hint_set(self.obj,
             <const char *>part if part is not None else NULL,
@@ -803,7 +890,7 @@ cdef class Edje(Object):
         .. versionadded:: 1.21
 
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         if isinstance(key, unicode): key = PyUnicode_AsUTF8String(key)
         if isinstance(value, unicode): value = PyUnicode_AsUTF8String(value)
         edje_object_part_text_prediction_hint_hash_set(self.obj,
@@ -825,7 +912,7 @@ cdef class Edje(Object):
         .. versionadded:: 1.21
 
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         if isinstance(key, unicode): key = PyUnicode_AsUTF8String(key)
         edje_object_part_text_prediction_hint_hash_del(self.obj,
             <const char *>part if part is not None else NULL,
@@ -847,7 +934,7 @@ cdef class Edje(Object):
         :type obj: efl.evas.Object
 
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         edje_object_part_swallow(self.obj,
             <const char *>part if part is not None else NULL, obj.obj)
 
@@ -857,13 +944,13 @@ cdef class Edje(Object):
 
     def part_swallow_get(self, part):
         """:rtype: efl.evas.Object"""
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         return object_from_instance(edje_object_part_swallow_get(
                     self.obj, <const char *>part if part is not None else NULL))
 
     def part_external_object_get(self, part):
         """:rtype: efl.evas.Object"""
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         return object_from_instance(edje_object_part_external_object_get(
                     self.obj, <const char *>part if part is not None else NULL))
 
@@ -978,7 +1065,7 @@ cdef class Edje(Object):
         :param obj: the efl.evas.Object to append
         :rtype: bool
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         return bool(edje_object_part_box_append(self.obj,
                      <const char *>part if part is not None else NULL, obj.obj))
 
@@ -993,7 +1080,7 @@ cdef class Edje(Object):
         :param obj: the efl.evas.Object to append
         :rtype: bool
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         return bool(edje_object_part_box_prepend(self.obj,
                      <const char *>part if part is not None else NULL, obj.obj))
 
@@ -1006,7 +1093,7 @@ cdef class Edje(Object):
         :param pos: the position to append the object
         :rtype: bool
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         return bool(edje_object_part_box_insert_at(self.obj,
             <const char *>part if part is not None else NULL, obj.obj, pos))
 
@@ -1018,7 +1105,7 @@ cdef class Edje(Object):
         :param reference: the efl.evas.Object used as reference
         :rtype: bool
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         return bool(edje_object_part_box_insert_before(self.obj,
                         <const char *>part if part is not None else NULL,
                         obj.obj, reference.obj))
@@ -1034,7 +1121,7 @@ cdef class Edje(Object):
         .. versionadded:: 1.18
 
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         return bool(edje_object_part_box_insert_after(self.obj,
                         <const char *>part if part is not None else NULL,
                         obj.obj, reference.obj))
@@ -1051,7 +1138,7 @@ cdef class Edje(Object):
         :rtype: efl.evas.Object or *None*
 
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         return object_from_instance(edje_object_part_box_remove(self.obj,
                     <const char *>part if part is not None else NULL, obj.obj))
 
@@ -1066,7 +1153,7 @@ cdef class Edje(Object):
         :return: the removed object
         :rtype: efl.evas.Object or None
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         return object_from_instance(edje_object_part_box_remove_at(self.obj,
                         <const char *>part if part is not None else NULL, pos))
 
@@ -1080,7 +1167,7 @@ cdef class Edje(Object):
 
         :rtype: bool
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         return bool(edje_object_part_box_remove_all(self.obj,
                      <const char *>part if part is not None else NULL, clear))
 
@@ -1096,7 +1183,7 @@ cdef class Edje(Object):
 
         :rtype: bool
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         return bool(edje_object_part_table_pack(self.obj,
                         <const char *>part if part is not None else NULL,
                         child.obj, col, row, colspan, rowspan))
@@ -1109,7 +1196,7 @@ cdef class Edje(Object):
 
         :rtype: bool
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         return bool(edje_object_part_table_unpack(self.obj,
                         <const char *>part if part is not None else NULL,
                         child.obj))
@@ -1122,7 +1209,7 @@ cdef class Edje(Object):
         :rtype: tuple of int
         """
         cdef int c, r
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         edje_object_part_table_col_row_size_get(self.obj,
             <const char *>part if part is not None else NULL, &c, &r)
         return (c, r)
@@ -1137,7 +1224,7 @@ cdef class Edje(Object):
 
         :rtype: bool
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         return bool(edje_object_part_table_clear(self.obj,
                      <const char *>part if part is not None else NULL, clear))
 
@@ -1151,7 +1238,7 @@ cdef class Edje(Object):
         :return: the object ath the given position
         :rtype: efl.evas.Object
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         return object_from_instance(edje_object_part_table_child_get(self.obj,
                  <const char *>part if part is not None else NULL, row, column))
 
@@ -1159,14 +1246,14 @@ cdef class Edje(Object):
         """:rtype: (name, value)"""
         cdef double sv
         cdef const char *sn
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         sn = edje_object_part_state_get(self.obj,
                  <const char *>part if part is not None else NULL, &sv)
         return (_ctouni(sn), sv)
 
     def part_drag_dir_get(self, part):
         """:rtype: int"""
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         return edje_object_part_drag_dir_get(self.obj,
                     <const char *>part if part is not None else NULL)
 
@@ -1175,14 +1262,14 @@ cdef class Edje(Object):
         :param dx:
         :param dy:
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         edje_object_part_drag_value_set(self.obj,
             <const char *>part if part is not None else NULL, dx, dy)
 
     def part_drag_value_get(self, part):
         """:rtype: tuple of float"""
         cdef double dx, dy
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         edje_object_part_drag_value_get(self.obj,
             <const char *>part if part is not None else NULL, &dx, &dy)
         return (dx, dy)
@@ -1192,14 +1279,14 @@ cdef class Edje(Object):
         :param dw:
         :param dh:
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         edje_object_part_drag_size_set(self.obj,
             <const char *>part if part is not None else NULL, dw, dh)
 
     def part_drag_size_get(self, part):
         """:rtype: tuple of float"""
         cdef double dw, dh
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         edje_object_part_drag_size_get(self.obj,
             <const char *>part if part is not None else NULL, &dw, &dh)
         return (dw, dh)
@@ -1209,38 +1296,38 @@ cdef class Edje(Object):
         :param dx:
         :param dy:
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         edje_object_part_drag_step_set(self.obj,
             <const char *>part if part is not None else NULL, dx, dy)
 
     def part_drag_step_get(self, part):
         """:rtype: tuple of float"""
         cdef double dx, dy
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         edje_object_part_drag_step_get(self.obj,
             <const char *>part if part is not None else NULL, &dx, &dy)
         return (dx, dy)
 
     def part_drag_step(self, part, double dx, double dy):
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         edje_object_part_drag_step(self.obj,
             <const char *>part if part is not None else NULL, dx, dy)
 
     def part_drag_page_set(self, part, double dx, double dy):
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         edje_object_part_drag_page_set(self.obj,
             <const char *>part if part is not None else NULL, dx, dy)
 
     def part_drag_page_get(self, part):
         """:rtype: tuple of float"""
         cdef double dx, dy
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         edje_object_part_drag_page_get(self.obj,
             <const char *>part if part is not None else NULL, &dx, &dy)
         return (dx, dy)
 
     def part_drag_page(self, part, double dx, double dy):
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         edje_object_part_drag_page(self.obj,
             <const char *>part if part is not None else NULL, dx, dy)
 
@@ -1397,6 +1484,53 @@ cdef class Edje(Object):
                 else:
                     self.message_send_str_float_set(id, head, data[2:])
 
+    cdef message_send_buffer(self, int id, data):
+        cdef Py_buffer view
+        cdef char code
+        cdef Py_ssize_t count
+        cdef Edje_Message_Int_Set *mi
+        cdef Edje_Message_Float_Set *mf
+
+        PyObject_GetBuffer(data, &view, PyBUF_FORMAT | PyBUF_C_CONTIGUOUS)
+        try:
+            # only native byte order can be copied as is
+            code = buffer_format_code(&view)
+            if code == 0 or view.itemsize == 0:
+                raise TypeError("invalid message buffer format '%s'" %
+                                _ctouni(view.format))
+
+            count = view.len // view.itemsize
+            if count == 0:
+                return
+
+            if (code == c'i' or code == c'l') and \
+               view.itemsize == sizeof(int):
+                mi = <Edje_Message_Int_Set*>PyMem_Malloc(
+                    sizeof(Edje_Message_Int_Set) + (count - 1) * sizeof(int))
+                if mi == NULL:
+                    raise MemoryError
+                mi.count = count
+                memcpy(mi.val, view.buf, view.len)
+                edje_object_message_send(self.obj,
+                    enums.EDJE_MESSAGE_INT_SET, id, <void*>mi)
+                PyMem_Free(mi)
+            elif code == c'd' and view.itemsize == sizeof(double):
+                mf = <Edje_Message_Float_Set*>PyMem_Malloc(
+                    sizeof(Edje_Message_Float_Set) +
+                    (count - 1) * sizeof(double))
+                if mf == NULL:
+                    raise MemoryError
+                mf.count = count
+                memcpy(mf.val, view.buf, view.len)
+                edje_object_message_send(self.obj,
+                    enums.EDJE_MESSAGE_FLOAT_SET, id, <void*>mf)
+                PyMem_Free(mf)
+            else:
+                raise TypeError("invalid message buffer format '%s'" %
+                                _ctouni(view.format))
+        finally:
+            PyBuffer_Release(&view)
+
     def message_send(self, int id, data):
         """Send message with given id and data.
 
@@ -1406,11 +1540,18 @@ cdef class Edje(Object):
         - list of long, int, float, str
         - str and one of long, int, float
         - str and a list of one of long, int, float
+        - objects supporting the buffer protocol of C ``int`` or
+          ``double`` (``array.array('i')``, ``array.array('d')``,
+          numpy arrays, ...), sent as an int or float set with a single
+          copy of the values
 
         Messages sent will **NOT** be available at Python-side (ie:
         message_handler_set()), but just at Embryo-side.
 
         :raise TypeError: if data has no supported EdjeMessage counterpart.
+
+        .. versionchanged:: 1.27
+            Support for objects supporting the buffer protocol
         """
         if isinstance(data, (long, int)):
             self.message_send_int(id, data)
@@ -1418,6 +1559,8 @@ cdef class Edje(Object):
             self.message_send_float(id, data)
         elif isinstance(data, str):
             self.message_send_str(id, data)
+        elif PyObject_CheckBuffer(data) and not isinstance(data, bytes):
+            self.message_send_buffer(id, data)
         elif isinstance(data, (tuple, list)):
             if len(data) < 1:
                 return
@@ -1476,33 +1619,50 @@ cdef class Edje(Object):
             signal_callback_add().
 
         :raise TypeError: if func is not callable.
+
+        .. versionchanged:: 1.27
+            The callbacks of the patterns containing ``*``, ``?`` or
+            ``[...]`` are dispatched from a single Edje callback, matching
+            them with :py:mod:`fnmatch` rules.
         """
         if not callable(func):
             raise TypeError("func must be callable")
 
+        cdef _EdjeSignalCallbacks cbs
+
         d = self._signal_callbacks.setdefault(emission, {})
-        lst = d.setdefault(source, [])
-        if not lst:
-            if isinstance(emission, unicode): emission = PyUnicode_AsUTF8String(emission)
-            if isinstance(source, unicode): source = PyUnicode_AsUTF8String(source)
-            edje_object_signal_callback_add(self.obj,
-                <const char *>emission if emission is not None else NULL,
-                <const char *>source if source is not None else NULL,
-                signal_cb, <void*>lst)
-        lst.append((func, args, kargs))
+        cbs = d.get(source)
+        if cbs is None:
+            cbs = _EdjeSignalCallbacks(self, emission, source)
+            d[source] = cbs
+            if cbs.glob:
+                # all the patterns are matched by a single catch-all
+                if not self._signal_globs:
+                    edje_object_signal_callback_add(self.obj, "*", "*",
+                        signal_glob_cb, <void*>self)
+                self._signal_globs = self._signal_globs + [cbs]
+            else:
+                if isinstance(emission, unicode): emission = PyUnicode_AsUTF8String(emission)
+                if isinstance(source, unicode): source = PyUnicode_AsUTF8String(source)
+                edje_object_signal_callback_add(self.obj,
+                    <const char *>emission if emission is not None else NULL,
+                    <const char *>source if source is not None else NULL,
+                    signal_cb, <void*>cbs)
+        cbs.callbacks = cbs.callbacks + [(func, args, kargs)]
 
     def signal_callback_del(self, emission, source, func):
         """Remove the callable associated with given emission and source."""
+        cdef _EdjeSignalCallbacks cbs
         try:
             d = self._signal_callbacks[emission]
-            lst = d[source]
+            cbs = d[source]
         except KeyError:
             raise ValueError(("function %s not associated with "
                               "emission %r, source %r") %
                              (func, emission, source))
 
         i = -1
-        for i, (f, a, k) in enumerate(lst):
+        for i, (f, a, k) in enumerate(cbs.callbacks):
             if func == f:
                 break
         else:
@@ -1510,12 +1670,19 @@ cdef class Edje(Object):
                               "emission %r, source %r") %
                              (func, emission, source))
 
-        lst.pop(i)
-        if lst:
+        cbs.callbacks = cbs.callbacks[:i] + cbs.callbacks[i + 1:]
+        if cbs.callbacks:
             return
         d.pop(source)
         if not d:
             self._signal_callbacks.pop(emission)
+        if cbs.glob:
+            self._signal_globs = [c for c in self._signal_globs
+                                  if c is not cbs]
+            if not self._signal_globs:
+                edje_object_signal_callback_del(self.obj, "*", "*",
+                                                signal_glob_cb)
+            return
         if isinstance(emission, unicode): emission = PyUnicode_AsUTF8String(emission)
         if isinstance(source, unicode): source = PyUnicode_AsUTF8String(source)
         edje_object_signal_callback_del(self.obj,
@@ -1525,8 +1692,8 @@ cdef class Edje(Object):
 
     def signal_emit(self, emission, source):
         """Emit signal with ``emission`` and ``source``"""
-        if isinstance(emission, unicode): emission = PyUnicode_AsUTF8String(emission)
-        if isinstance(source, unicode): source = PyUnicode_AsUTF8String(source)
+        emission = _tobytes_cached(emission)
+        source = _tobytes_cached(source)
         edje_object_signal_emit(self.obj,
             <const char *>emission if emission is not None else NULL,
             <const char *>source if source is not None else NULL)
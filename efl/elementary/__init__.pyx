@@ -703,10 +703,11 @@ def init():
     """
     EINA_LOG_DOM_INFO(PY_EFL_ELM_LOG_DOMAIN, "Initializing efl.elementary")
 
-    # Force Edje object type to be always available, since we cannot
+    # Make the Edje object type always available, since we cannot
     # anticipate when Elementary is going to return a pointer to one.
+    # The efl.edje module is only imported when the first one is wrapped.
 
-    import efl.edje
+    _object_mapping_register_lazy("Efl.Canvas.Layout", "efl.edje")
 
     # argc and argv are currently used by EFL to support app restart
     # and binary relocation. These are probably not useful to us but we
@@ -1190,10 +1191,11 @@ from cpython cimport PyObject_GetBuffer, PyBuffer_Release, PyBUF_SIMPLE, \
 
 from efl.utils.deprecated import DEPRECATED
 from efl.utils.conversions cimport *
-from efl.eo cimport Eo, object_from_instance
+from efl.eo cimport Eo, object_from_instance, _object_mapping_register_lazy
 from efl.evas cimport SmartObject, EventKeyDown, EventKeyUp, EventMouseWheel
 
 from datetime import date, datetime
+from collections import OrderedDict
 
 
 cdef object _cb_string_conv(void *addr):
@@ -1247,7 +1249,6 @@ include "label.pxi"
 #include "layout_class.pxi"
 include "layout.pxi"
 include "list.pxi"
-include "map.pxi"
 include "mapbuf.pxi"
 include "menu.pxi"
 include "multibuttonentry.pxi"
@@ -1259,7 +1260,6 @@ include "object_item.pxi"
 include "panel.pxi"
 include "panes.pxi"
 include "photo.pxi"
-include "photocam.pxi"
 include "plug.pxi"
 include "popup.pxi"
 include "progressbar.pxi"
@@ -1276,6 +1276,50 @@ include "theme.pxi"
 include "thumb.pxi"
 include "toolbar.pxi"
 include "transit.pxi"
-include "video.pxi"
-include "web.pxi"
 include "window.pxi"
+
+
+# Widgets that are built as separate modules, these are only loaded when
+# they are accessed from this module or when Elementary gives us one of them.
+
+cdef dict _lazy_modules = {
+    "Web": "web",
+    "WebWindowFeatures": "web",
+    "Map": "map",
+    "MapRoute": "map",
+    "MapName": "map",
+    "MapOverlay": "map",
+    "MapOverlayClass": "map",
+    "MapOverlayBubble": "map",
+    "MapOverlayLine": "map",
+    "MapOverlayPolygon": "map",
+    "MapOverlayCircle": "map",
+    "MapOverlayScale": "map",
+    "MapOverlayRoute": "map",
+    "Photocam": "photocam",
+    "PhotocamProgressInfo": "photocam",
+    "PhotocamErrorInfo": "photocam",
+    "Video": "video",
+    "Player": "video",
+    }
+
+_object_mapping_register_lazy("Elm.Web", "efl.elementary.web")
+_object_mapping_register_lazy("Elm.Map", "efl.elementary.map")
+_object_mapping_register_lazy("Efl.Ui.Image_Zoomable_Legacy",
+                              "efl.elementary.photocam")
+_object_mapping_register_lazy("Efl.Ui.Video_Legacy", "efl.elementary.video")
+_object_mapping_register_lazy("Elm.Player", "efl.elementary.video")
+
+
+def __getattr__(name):
+    """Import on first access the widgets that live in their own module.
+
+    .. versionadded:: 1.27
+
+    """
+    module = _lazy_modules.get(name)
+    if module is None:
+        raise AttributeError(
+            "module 'efl.elementary' has no attribute '%s'" % (name,))
+    module = __import__("efl.elementary." + module, fromlist=[name])
+    return getattr(module, name)
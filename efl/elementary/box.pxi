@@ -50,21 +50,6 @@ cdef Evas_Object_Box_Layout _py_elm_box_layout_resolv(int layout) with gil:
         return evas_object_box_layout_stack
     return evas_object_box_layout_vertical
 
-cdef class BoxIterator(object):
-    cdef const Eina_List *lst
-    def __cinit__(self, Box box):
-        self.lst = elm_box_children_get(box.obj)
-
-    def __iter__(self):
-        return self
-
-    def __next__(self):
-        if self.lst == NULL:
-            raise StopIteration
-        cdef cEo *ret = <cEo *>self.lst.data
-        self.lst = self.lst.next
-        return object_from_instance(ret)
-
 cdef class Box(Object):
     """
 
@@ -87,7 +72,8 @@ cdef class Box(Object):
         self._set_properties_from_keyword_args(kwargs)
 
     def __iter__(self):
-        return BoxIterator(self)
+        return eina_list_objects_to_python_iterator(
+            elm_box_children_get(self.obj))
 
     property horizontal:
         """The horizontal orientation.
@@ -239,7 +225,7 @@ cdef class Box(Object):
 
         """
         def __get__(self):
-            return eina_list_objects_to_python_list(elm_box_children_get(self.obj))
+            return self.children_get()
 
         #def __set__(self, value):
             #TODO: unpack_all() and then get the objects from value and pack_end() them.
@@ -248,7 +234,10 @@ cdef class Box(Object):
             elm_box_clear(self.obj)
 
     def children_get(self):
-        return eina_list_objects_to_python_list(elm_box_children_get(self.obj))
+        cdef Eina_List *lst = elm_box_children_get(self.obj)
+        ret = eina_list_objects_to_python_list(lst)
+        eina_list_free(lst)
+        return ret
 
     property padding:
         """The space (padding) between the box's elements.
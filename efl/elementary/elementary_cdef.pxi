@@ -1,6 +1,6 @@
 from efl.c_eo cimport Eo as cEo, Efl_Class, efl_add
 from efl.eina cimport Eina_Rectangle, Eina_Compare_Cb, \
-    eina_list_free, eina_list_append, eina_stringshare_del
+    eina_list_free, eina_list_append, eina_list_count, eina_stringshare_del
 from efl.evas cimport Eina_List, Eina_Bool, Evas_Object, Evas_Font_Size, \
     Evas_Coord, Evas_Callback_Type, Evas_Smart_Cb, Evas_Event_Flags, \
     Evas_Load_Error, Evas_Image_Orient, \
@@ -21,29 +21,19 @@ include "gengrid_cdef.pxi"
 cdef char *_py_elm_gengrid_item_text_get(void *data, Evas_Object *obj, const char *part) with gil:
     cdef:
         GengridItem item = <GengridItem>data
-        unicode u = _ctouni(part)
+        GengridItemClass itc = item.item_class
 
-    func = item.item_class._text_get_func
+    func = itc._text_get_func
     if func is None:
         return NULL
 
-    try:
-        o = object_from_instance(obj)
-        ret = func(o, u, item.item_data)
-    except Exception:
-        traceback.print_exc()
-        return NULL
-
-    if ret is not None:
-        if isinstance(ret, unicode): ret = PyUnicode_AsUTF8String(ret)
-        return strdup(ret)
-    else:
-        return NULL
+    return _item_text_get(item, item.item_data, itc._text_cache, func,
+                          obj, part)
 
 cdef Evas_Object *_py_elm_gengrid_item_content_get(void *data, Evas_Object *obj, const char *part) with gil:
     cdef:
         GengridItem item = <GengridItem>data
-        unicode u = _ctouni(part)
+        unicode u = _ctouni_cached(part)
         evasObject icon
 
     func = item.item_class._content_get_func
@@ -66,7 +56,7 @@ cdef Evas_Object *_py_elm_gengrid_item_content_get(void *data, Evas_Object *obj,
 cdef Eina_Bool _py_elm_gengrid_item_state_get(void *data, Evas_Object *obj, const char *part) with gil:
     cdef:
         GengridItem item = <GengridItem>data
-        unicode u = _ctouni(part)
+        unicode u = _ctouni_cached(part)
 
     func = item.item_class._state_get_func
     if func is None:
@@ -87,6 +77,9 @@ cdef void _py_elm_gengrid_object_item_del(void *data, Evas_Object *obj) with gil
     if item is None:
         return
 
+    if item.item_class._text_cache is not None:
+        item.item_class._text_cache.invalidate(item)
+
     func = item.item_class._del_func
 
     if func is not None:
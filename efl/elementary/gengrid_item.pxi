@@ -21,6 +21,11 @@ cdef class GengridItem(ObjectItem):
         assert self.item != NULL, "Object must wrap something"
         self.item = NULL
 
+    cdef int _text_cache_invalidate(self) except -1:
+        if self.item_class._text_cache is not None:
+            self.item_class._text_cache.invalidate(self)
+        return 0
+
     def __init__(self, GengridItemClass item_class not None, item_data = None, \
         func = None, func_data = None, *args, **kwargs):
         """
@@ -52,7 +57,8 @@ cdef class GengridItem(ObjectItem):
         self.item_data = item_data
         self.func_data = func_data
         self.args = args
-        self.kwargs = kwargs
+        # don't keep a dict for each item when there are no kwargs
+        self.kwargs = kwargs if kwargs else None
 
     def __repr__(self):
         return ("<%s(%#x, refcount=%d, Elm_Object_Item=%#x, "
@@ -269,6 +275,7 @@ cdef class GengridItem(ObjectItem):
         reflected.
 
         """
+        self._text_cache_invalidate()
         elm_gengrid_item_update(self.item)
 
     property selected:
@@ -20,6 +20,7 @@ cdef class GengridItemClass:
         object _state_get_func
         object _del_func
         object _item_style
+        _ItemTextCache _text_cache
 
     def __cinit__(self):
         self.cls = elm_gengrid_item_class_new()
@@ -34,7 +35,8 @@ cdef class GengridItemClass:
         self.cls = NULL
 
     def __init__(self, item_style=None, text_get_func=None,
-                 content_get_func=None, state_get_func=None, del_func=None):
+                 content_get_func=None, state_get_func=None, del_func=None,
+                 unsigned int text_cache_size=0):
         """
 
         :param item_style: the string that defines the gengrid item
@@ -68,6 +70,12 @@ cdef class GengridItemClass:
             and similar. This function should have the signature:
             ``func(obj, item_data)``
 
+        :param text_cache_size: if greater than zero, the texts returned by
+            ``text_get_func`` are cached for this number of items, and the
+            function is called again for an item only after it has been
+            updated with :py:meth:`GengridItem.update`. Use this when the texts
+            only depend on ``item_data``. (since 1.27)
+
         .. note:: In all these signatures, 'obj' means Gengrid and
             'item_data' is the value given to Gengrid item append/prepend
             methods, it should represent your item model as you want.
@@ -107,6 +115,8 @@ cdef class GengridItemClass:
             except AttributeError:
                 pass
 
+        self.text_cache_size = text_cache_size
+
         if item_style is not None:
             if isinstance(item_style, unicode):
                 item_style = PyUnicode_AsUTF8String(item_style)
@@ -162,6 +172,46 @@ cdef class GengridItemClass:
             self._item_style = style
             self.cls.item_style = <char *>style if style is not None else NULL
 
+    property text_cache_size:
+        """The number of items whose texts are cached.
+
+        When greater than zero the texts returned by the text_get function
+        are remembered, for each item and part, and reused when the item is
+        realized again, without calling the function. The least recently
+        used items are dropped first when the cache is full.
+
+        The texts of an item are discarded when it is updated with
+        :py:meth:`GengridItem.update`, when
+        :py:meth:`Gengrid.realized_items_update` is called and when it is
+        deleted. Set to 0 (the default) to disable the cache.
+
+        :type: int
+
+        .. versionadded:: 1.27
+
+        """
+        def __get__(self):
+            return self._text_cache.size if self._text_cache is not None else 0
+
+        def __set__(self, unsigned int size):
+            if size == 0:
+                self._text_cache = None
+            elif self._text_cache is None:
+                self._text_cache = _ItemTextCache(size)
+            else:
+                self._text_cache.resize(size)
+
+    def text_cache_clear(self):
+        """Discard all the cached texts.
+
+        .. seealso:: :py:attr:`text_cache_size`
+
+        .. versionadded:: 1.27
+
+        """
+        if self._text_cache is not None:
+            self._text_cache.clear()
+
     def text_get(self, evasObject obj, part, item_data):
         """To be called by Gengrid for each item to get its label.
 
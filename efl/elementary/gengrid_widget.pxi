@@ -251,10 +251,28 @@ cdef class Gengrid(Object):
 
         """
         def __get__(self):
-            return _object_item_list_to_python(elm_gengrid_realized_items_get(self.obj))
+            return self.realized_items_get()
 
     def realized_items_get(self):
-        return _object_item_list_to_python(elm_gengrid_realized_items_get(self.obj))
+        cdef Eina_List *lst = elm_gengrid_realized_items_get(self.obj)
+        ret = _object_item_list_to_python(lst)
+        eina_list_free(lst)
+        return ret
+
+    def realized_items_iter(self):
+        """Iterate over the realized items.
+
+        Like :py:attr:`realized_items`, but the items are only looked up
+        when reached. ``len()`` of the returned iterator is the number of
+        realized items.
+
+        :rtype: iterator of :py:class:`GengridItem`
+
+        .. versionadded:: 1.27
+
+        """
+        return eina_list_to_python_iterator(
+            elm_gengrid_realized_items_get(self.obj), _object_item_from_data)
 
     def realized_items_update(self):
         """This updates all realized items by calling all the item class
@@ -267,6 +285,18 @@ cdef class Gengrid(Object):
         .. seealso:: :py:attr:`realized_items` :py:func:`GengridItem.update()`
 
         """
+        cdef:
+            Eina_List *lst = elm_gengrid_realized_items_get(self.obj)
+            Eina_List *l = lst
+            void *data
+
+        while l != NULL:
+            data = elm_object_item_data_get(<Elm_Object_Item *>l.data)
+            if data != NULL:
+                (<GengridItem>data)._text_cache_invalidate()
+            l = l.next
+        eina_list_free(lst)
+
         elm_gengrid_realized_items_update(self.obj)
 
     property first_item:
@@ -651,9 +681,9 @@ cdef class Gengrid(Object):
         if itemgetcb is not None:
             if not callable(itemgetcb):
                 raise TypeError("itemgetcb must be callable.")
-            self.internal_data["xy_item_get_cb"] = itemgetcb
+            self.internal_data_get()["xy_item_get_cb"] = itemgetcb
 
-        self.internal_data["item_container_data_get_cb"] = data_get
+        self.internal_data_get()["item_container_data_get_cb"] = data_get
 
         if not elm_drag_item_container_add(self.obj,
             tm_to_anim,
@@ -702,10 +732,10 @@ cdef class Gengrid(Object):
         if itemgetcb is not None:
             if not callable(itemgetcb):
                 raise TypeError("itemgetcb must be callable.")
-            self.internal_data["xy_item_get_cb"] = itemgetcb
+            self.internal_data_get()["xy_item_get_cb"] = itemgetcb
 
-        self.internal_data["drag_item_container_pos"] = poscb
-        self.internal_data["drop_item_container_cb"] = dropcb
+        self.internal_data_get()["drag_item_container_pos"] = poscb
+        self.internal_data_get()["drop_item_container_cb"] = dropcb
 
         if not elm_drop_item_container_add(self.obj,
             format,
@@ -20,29 +20,19 @@ include "genlist_cdef.pxi"
 cdef char *_py_elm_genlist_item_text_get(void *data, Evas_Object *obj, const char *part) with gil:
     cdef:
         GenlistItem item = <GenlistItem>data
-        unicode u = _ctouni(part)
+        GenlistItemClass itc = item.item_class
 
-    func = item.item_class._text_get_func
+    func = itc._text_get_func
     if func is None:
         return NULL
 
-    try:
-        o = object_from_instance(obj)
-        ret = func(o, u, item.item_data)
-    except Exception:
-        traceback.print_exc()
-        return NULL
-
-    if ret is not None:
-        if isinstance(ret, unicode): ret = PyUnicode_AsUTF8String(ret)
-        return strdup(ret)
-    else:
-        return NULL
+    return _item_text_get(item, item.item_data, itc._text_cache, func,
+                          obj, part)
 
 cdef Evas_Object *_py_elm_genlist_item_content_get(void *data, Evas_Object *obj, const char *part) with gil:
     cdef:
         GenlistItem item = <GenlistItem>data
-        unicode u = _ctouni(part)
+        unicode u = _ctouni_cached(part)
         evasObject icon
 
     func = item.item_class._content_get_func
@@ -65,7 +55,7 @@ cdef Evas_Object *_py_elm_genlist_item_content_get(void *data, Evas_Object *obj,
 cdef Evas_Object *_py_elm_genlist_item_reusable_content_get(void *data, Evas_Object *obj, const char *part, Evas_Object *old) with gil:
     cdef:
         GenlistItem item = <GenlistItem>data
-        unicode u = _ctouni(part)
+        unicode u = _ctouni_cached(part)
         evasObject icon
 
     func = item.item_class._reusable_content_get_func
@@ -89,7 +79,7 @@ cdef Evas_Object *_py_elm_genlist_item_reusable_content_get(void *data, Evas_Obj
 cdef Eina_Bool _py_elm_genlist_item_state_get(void *data, Evas_Object *obj, const char *part) with gil:
     cdef:
         GenlistItem item = <GenlistItem>data
-        unicode u = _ctouni(part)
+        unicode u = _ctouni_cached(part)
         bint ret
         Genlist o
 
@@ -132,6 +122,9 @@ cdef void _py_elm_genlist_object_item_del(void *data, Evas_Object *obj) with gil
     if item is None:
         return
 
+    if item.item_class._text_cache is not None:
+        item.item_class._text_cache.invalidate(item)
+
     func = item.item_class._del_func
 
     if func is not None:
@@ -62,7 +62,8 @@ cdef class GenlistItem(ObjectItem):
         self.cb_func = func
         self.func_data = func_data
         self.args = args
-        self.kwargs = kwargs
+        # don't keep a dict for each item when there are no kwargs
+        self.kwargs = kwargs if kwargs else None
 
     def __dealloc__(self):
         self.parent_item = NULL
@@ -79,6 +80,11 @@ cdef class GenlistItem(ObjectItem):
         Py_DECREF(self)
         return 1
 
+    cdef int _text_cache_invalidate(self) except -1:
+        if self.item_class._text_cache is not None:
+            self.item_class._text_cache.invalidate(self)
+        return 0
+
     def __repr__(self):
         return ("<%s(%#x, refcount=%d, Elm_Object_Item=%#x, "
                 "item_class=%s, func=%s, item_data=%r)>") % (
@@ -366,6 +372,7 @@ cdef class GenlistItem(ObjectItem):
         .. seealso:: :py:func:`Genlist.realized_items_update()`
 
         """
+        self._text_cache_invalidate()
         elm_genlist_item_update(self.item)
 
     def item_class_update(self, GenlistItemClass itc not None):
@@ -376,6 +383,8 @@ cdef class GenlistItem(ObjectItem):
         :type itc: :py:class:`GenlistItemClass`
 
         """
+        self._text_cache_invalidate()
+        self.item_class = itc
         elm_genlist_item_item_class_update(self.item, itc.cls)
 
     # TODO: def item_class_get(self):
@@ -530,6 +539,9 @@ cdef class GenlistItem(ObjectItem):
         .. seealso:: :py:func:`update()`
 
         """
+        if itf == enums.ELM_GENLIST_ITEM_FIELD_ALL or \
+           itf & enums.ELM_GENLIST_ITEM_FIELD_TEXT:
+            self._text_cache_invalidate()
         if isinstance(parts, unicode): parts = PyUnicode_AsUTF8String(parts)
         elm_genlist_item_fields_update(self.item,
             <const char *>parts if parts is not None else NULL,
@@ -640,3 +652,22 @@ cdef class GenlistItem(ObjectItem):
     def select_mode_get(self):
         return elm_genlist_item_select_mode_get(self.item)
 
+
+
+cdef GenlistItem _genlist_item_new(GenlistItemClass item_class, item_data,
+                                   Elm_Object_Item *parent_item, int flags,
+                                   func):
+    """Fast GenlistItem creation for the bulk insertion methods.
+
+    Same as ``GenlistItem(item_class, item_data, parent_item, flags, func,
+    item_data)`` without the argument checking.
+
+    """
+    cdef GenlistItem item = GenlistItem.__new__(GenlistItem)
+    item.item_class = item_class
+    item.parent_item = parent_item
+    item.flags = flags
+    item.item_data = item_data
+    item.cb_func = func
+    item.func_data = item_data
+    return item
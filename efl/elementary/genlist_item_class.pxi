@@ -25,6 +25,7 @@ cdef class GenlistItemClass(object):
         object _item_style
         object _decorate_item_style
         object _decorate_all_item_style
+        _ItemTextCache _text_cache
 
     def __cinit__(self):
         self.cls = elm_genlist_item_class_new()
@@ -44,7 +45,7 @@ cdef class GenlistItemClass(object):
                  content_get_func=None, state_get_func=None, del_func=None,
                  decorate_item_style=None, decorate_all_item_style=None,
                  filter_get_func=None, reusable_content_get_func=None,
-                 *args, **kwargs):
+                 unsigned int text_cache_size=0, *args, **kwargs):
 
         """
 
@@ -87,6 +88,13 @@ cdef class GenlistItemClass(object):
             This function should have the signature:
             ``func(obj, part, item_data, old_content) -> obj``
 
+        :param text_cache_size: if greater than zero, the texts returned by
+            ``text_get_func`` are cached for this number of items, and the
+            function is called again for an item only after it has been
+            updated with :py:meth:`GenlistItem.update` or
+            :py:meth:`GenlistItem.fields_update`. Use this when the texts
+            only depend on ``item_data``. (since 1.27)
+
         .. note:: In all these signatures, 'obj' means Genlist and
             'item_data' is the value given to Genlist item append/prepend
             methods, it should represent your row model as you want.
@@ -146,6 +154,8 @@ cdef class GenlistItemClass(object):
             except AttributeError:
                 pass
 
+        self.text_cache_size = text_cache_size
+
         a1 = item_style
         a2 = decorate_item_style
         a3 = decorate_all_item_style
@@ -231,6 +241,47 @@ cdef class GenlistItemClass(object):
             self._decorate_all_item_style = style
             self.cls.decorate_all_item_style = <char *>style if style is not None else NULL
 
+    property text_cache_size:
+        """The number of items whose texts are cached.
+
+        When greater than zero the texts returned by the text_get function
+        are remembered, for each item and part, and reused when the item is
+        realized again, without calling the function. The least recently
+        used items are dropped first when the cache is full.
+
+        The texts of an item are discarded when it is updated with
+        :py:meth:`GenlistItem.update`,
+        :py:meth:`GenlistItem.fields_update`, when
+        :py:meth:`Genlist.realized_items_update` is called and when it is
+        deleted. Set to 0 (the default) to disable the cache.
+
+        :type: int
+
+        .. versionadded:: 1.27
+
+        """
+        def __get__(self):
+            return self._text_cache.size if self._text_cache is not None else 0
+
+        def __set__(self, unsigned int size):
+            if size == 0:
+                self._text_cache = None
+            elif self._text_cache is None:
+                self._text_cache = _ItemTextCache(size)
+            else:
+                self._text_cache.resize(size)
+
+    def text_cache_clear(self):
+        """Discard all the cached texts.
+
+        .. seealso:: :py:attr:`text_cache_size`
+
+        .. versionadded:: 1.27
+
+        """
+        if self._text_cache is not None:
+            self._text_cache.clear()
+
     def text_get(self, evasObject obj, part, item_data):
         """To be called by Genlist for each row to get its label.
 
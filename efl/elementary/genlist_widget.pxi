@@ -1,7 +1,20 @@
 from efl.eo cimport _object_mapping_register, PY_REFCOUNT
+from efl.c_eo cimport efl_event_freeze, efl_event_thaw
+
+from functools import cmp_to_key
 
 #include "cnp_callbacks.pxi"
 
+cdef bint _genlist_item_is_descendant(Elm_Object_Item *it,
+                                     Elm_Object_Item *parent):
+    it = elm_genlist_item_parent_get(it)
+    while it != NULL:
+        if it == parent:
+            return 1
+        it = elm_genlist_item_parent_get(it)
+    return 0
+
+
 cdef class Genlist(Object):
     """
 
@@ -320,6 +333,199 @@ cdef class Genlist(Object):
         return GenlistItem(item_class, item_data, parent_item, flags, func, item_data)\
                           .sorted_insert(self, comparison_func)
 
+    cdef list _items_append(self, GenlistItemClass item_class, iterator,
+                            Elm_Object_Item *parent, int flags, func,
+                            Py_ssize_t count):
+        """Append at most count items, all of them if count is negative."""
+        cdef:
+            list items = []
+            GenlistItem item
+            Elm_Object_Item *it
+            Evas_Smart_Cb cb = NULL
+
+        if func is not None:
+            cb = _py_elm_genlist_item_func
+
+        efl_event_freeze(self.obj)
+        try:
+            for item_data in iterator:
+                item = _genlist_item_new(item_class, item_data, parent,
+                                         flags, func)
+                it = elm_genlist_item_append(self.obj, item_class.cls,
+                    <void *>item, parent, <Elm_Genlist_Item_Type>flags,
+                    cb, <void *>item)
+                if it == NULL:
+                    raise RuntimeError(
+                        "The item could not be added to the widget.")
+                item._set_obj(it)
+                items.append(item)
+                if len(items) == count:
+                    break
+        finally:
+            efl_event_thaw(self.obj)
+
+        return items
+
+    def items_extend(self, GenlistItemClass item_class not None, items_data,
+                     int flags=enums.ELM_GENLIST_ITEM_NONE,
+                     ObjectItem parent_item=None, func=None,
+                     int chunk_size=0, done_cb=None):
+        """Append many items (add as last rows) to this genlist.
+
+        This is the same as calling :py:meth:`item_append` for every value
+        of ``items_data``, but much faster as event propagation is frozen
+        during the insertion and all the items are inserted in one go.
+
+        Very big (or slow to generate) datasets can be inserted a bit at a
+        time using ``chunk_size``: each time the main loop is idle
+        ``chunk_size`` items are appended, keeping the application
+        responsive while the items stream in.
+
+        :param item_class: a valid instance that defines the behavior of
+            the rows. See :py:class:`GenlistItemClass`.
+        :param items_data: an iterable (or a generator) of values, one for
+            each row to add. See the ``item_data`` param of
+            :py:meth:`item_append`.
+        :param flags: the flags of the items, see :py:meth:`item_append`.
+        :param parent_item: the parent of the items, if they are the
+            children of a tree item.
+        :param func: if not None, called back when any of the items is
+            selected, see :py:meth:`item_append`.
+        :param chunk_size: if greater than zero the items are inserted
+            this number at a time, from an :py:class:`efl.ecore.Idler`.
+        :param done_cb: if not None, called with the signature
+            ``func(genlist, items)`` when all the items have been inserted,
+            if ``chunk_size`` is given.
+
+        :return: the list of added :py:class:`GenlistItem`, or when
+            ``chunk_size`` is given, the :py:class:`efl.ecore.Idler` doing
+            the work: delete it to stop the insertion.
+
+        .. versionadded:: 1.27
+
+        """
+        cdef Elm_Object_Item *parent = NULL
+
+        if func is not None and not callable(func):
+            raise TypeError("func is not None or callable")
+        if parent_item is not None:
+            parent = _object_item_from_python(parent_item)
+
+        iterator = iter(items_data)
+        if chunk_size <= 0:
+            return self._items_append(item_class, iterator, parent, flags,
+                                      func, -1)
+
+        from efl.ecore import Idler
+        items = []
+
+        def _insert_chunk():
+            if self.obj == NULL:
+                return False
+            chunk = self._items_append(item_class, iterator, parent, flags,
+                                       func, chunk_size)
+            items.extend(chunk)
+            if len(chunk) < chunk_size:
+                if done_cb is not None:
+                    done_cb(self, items)
+                return False
+            return True
+
+        return Idler(_insert_chunk)
+
+    def items_sorted_extend(self, GenlistItemClass item_class not None,
+                            items_data, comparison_func not None,
+                            int flags=enums.ELM_GENLIST_ITEM_NONE,
+                            ObjectItem parent_item=None, func=None):
+        """Insert many items in a sorted genlist.
+
+        Like calling :py:meth:`item_sorted_insert` for every value of
+        ``items_data``, but the new items are sorted first and then merged
+        with the ones already in the genlist, with a single pass and with
+        event propagation frozen.
+
+        :param item_class: a valid instance that defines the behavior of
+            the rows. See :py:class:`GenlistItemClass`.
+        :param items_data: an iterable (or a generator) of values, one for
+            each row to add.
+        :param comparison_func: The function called for the sort, with the
+            signature ``func(item1, item2) -> int``. It must return a
+            negative value if ``item1`` comes before ``item2``, 0 if the
+            two items are equal or a positive value otherwise.
+        :param flags: the flags of the items, see :py:meth:`item_append`.
+        :param parent_item: the parent of the items, if they are the
+            children of a tree item.
+        :param func: if not None, called back when any of the items is
+            selected, see :py:meth:`item_append`.
+
+        :return: the list of added :py:class:`GenlistItem`, sorted.
+
+        .. note:: The items already in the genlist (with the same parent)
+            must be sorted with the same ``comparison_func``.
+
+        .. versionadded:: 1.27
+
+        """
+        cdef:
+            list items
+            GenlistItem item
+            Elm_Object_Item *parent = NULL
+            Elm_Object_Item *cur
+            Elm_Object_Item *it
+            Evas_Smart_Cb cb = NULL
+
+        if not callable(comparison_func):
+            raise TypeError("comparison_func is not callable")
+        if func is not None:
+            if not callable(func):
+                raise TypeError("func is not None or callable")
+            cb = _py_elm_genlist_item_func
+        if parent_item is not None:
+            parent = _object_item_from_python(parent_item)
+
+        items = [_genlist_item_new(item_class, item_data, parent, flags, func)
+                 for item_data in items_data]
+        for item in items:
+            item.comparison_func = comparison_func
+        items.sort(key=cmp_to_key(comparison_func))
+
+        if parent != NULL:
+            cur = elm_genlist_item_next_get(parent)
+        else:
+            cur = elm_genlist_first_item_get(self.obj)
+
+        efl_event_freeze(self.obj)
+        try:
+            for item in items:
+                # skip the existing siblings that come before the new item
+                while cur != NULL:
+                    if parent != NULL and \
+                       not _genlist_item_is_descendant(cur, parent):
+                        cur = NULL
+                    elif elm_genlist_item_parent_get(cur) != parent or \
+                         comparison_func(item,
+                            _object_item_to_python(cur)) >= 0:
+                        cur = elm_genlist_item_next_get(cur)
+                    else:
+                        break
+
+                if cur == NULL:
+                    it = elm_genlist_item_append(self.obj, item_class.cls,
+                        <void *>item, parent, <Elm_Genlist_Item_Type>flags,
+                        cb, <void *>item)
+                else:
+                    it = elm_genlist_item_insert_before(self.obj,
+                        item_class.cls, <void *>item, parent, cur,
+                        <Elm_Genlist_Item_Type>flags, cb, <void *>item)
+                if it == NULL:
+                    raise RuntimeError(
+                        "The item could not be added to the widget.")
+                item._set_obj(it)
+        finally:
+            efl_event_thaw(self.obj)
+
+        return items
+
     property selected_item:
         """This gets the selected item in the list (if multi-selection is
         enabled, only the item that was first selected in the list is
@@ -374,12 +580,28 @@ cdef class Genlist(Object):
 
         """
         def __get__(self):
-            return _object_item_list_to_python(elm_genlist_realized_items_get(self.obj))
-            # FIXME: Free the list! We could return a custom list-like object here
-            #        that frees the C list in its __dealloc__
+            return self.realized_items_get()
 
     def realized_items_get(self):
-        return _object_item_list_to_python(elm_genlist_realized_items_get(self.obj))
+        cdef Eina_List *lst = elm_genlist_realized_items_get(self.obj)
+        ret = _object_item_list_to_python(lst)
+        eina_list_free(lst)
+        return ret
+
+    def realized_items_iter(self):
+        """Iterate over the realized items.
+
+        Like :py:attr:`realized_items`, but the items are only looked up
+        when reached. ``len()`` of the returned iterator is the number of
+        realized items.
+
+        :rtype: iterator of :py:class:`GenlistItem`
+
+        .. versionadded:: 1.27
+
+        """
+        return eina_list_to_python_iterator(
+            elm_genlist_realized_items_get(self.obj), _object_item_from_data)
 
     property first_item:
         """This returns the first item in the list.
@@ -417,6 +639,18 @@ cdef class Genlist(Object):
         .. seealso:: :py:attr:`realized_items`
 
         """
+        cdef:
+            Eina_List *lst = elm_genlist_realized_items_get(self.obj)
+            Eina_List *l = lst
+            void *data
+
+        while l != NULL:
+            data = elm_object_item_data_get(<Elm_Object_Item *>l.data)
+            if data != NULL:
+                (<GenlistItem>data)._text_cache_invalidate()
+            l = l.next
+        eina_list_free(lst)
+
         elm_genlist_realized_items_update(self.obj)
 
     def _items_count(self):
@@ -742,17 +976,17 @@ cdef class Genlist(Object):
 
         """
         def __set__(self, object key):
-            self.internal_data['__filterkeyref'] = key # keep a reference for key
+            self.internal_data_get()['__filterkeyref'] = key # keep a reference for key
             elm_genlist_filter_set(self.obj, <void *>key if key is not None else NULL)
 
         def __get__(self):
-            return self.internal_data['__filterkeyref']
+            return self.internal_data_get()['__filterkeyref']
 
     def filter_set(self, key):
-        self.internal_data['__filterkeyref'] = key
+        self.internal_data_get()['__filterkeyref'] = key
         elm_genlist_filter_set(self.obj, <void*>key if key is not None else NULL)
     def filter_get(self):
-        return self.internal_data['__filterkeyref']
+        return self.internal_data_get()['__filterkeyref']
 
     def filtered_items_count(self):
         """Return how many items have passed the filter currently.
@@ -790,9 +1024,9 @@ cdef class Genlist(Object):
         if itemgetcb is not None:
             if not callable(itemgetcb):
                 raise TypeError("itemgetcb must be callable.")
-            self.internal_data["xy_item_get_cb"] = itemgetcb
+            self.internal_data_get()["xy_item_get_cb"] = itemgetcb
 
-        self.internal_data["item_container_data_get_cb"] = data_get
+        self.internal_data_get()["item_container_data_get_cb"] = data_get
 
         if not elm_drag_item_container_add(self.obj,
             tm_to_anim,
@@ -841,10 +1075,10 @@ cdef class Genlist(Object):
         if itemgetcb is not None:
             if not callable(itemgetcb):
                 raise TypeError("itemgetcb must be callable.")
-            self.internal_data["xy_item_get_cb"] = itemgetcb
+            self.internal_data_get()["xy_item_get_cb"] = itemgetcb
 
-        self.internal_data["drag_item_container_pos"] = poscb
-        self.internal_data["drop_item_container_cb"] = dropcb
+        self.internal_data_get()["drag_item_container_pos"] = poscb
+        self.internal_data_get()["drop_item_container_cb"] = dropcb
 
         if not elm_drop_item_container_add(self.obj,
             format,
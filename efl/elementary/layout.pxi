@@ -35,7 +35,7 @@ cdef class LayoutClass(Object):
 
     """
 
-    cdef dict _elm_layout_signal_cbs
+    # c globals declared in efl.elementary.pxd
 
     def __cinit__(self):
         self._elm_layout_signal_cbs = {}
@@ -110,7 +110,7 @@ cdef class LayoutClass(Object):
             Raises RuntimeError if setting the text fails
 
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         if isinstance(text, unicode): text = PyUnicode_AsUTF8String(text)
         if text is None:
             # In this case we're guessing the user wants the only arg used
@@ -133,7 +133,7 @@ cdef class LayoutClass(Object):
 
         """
         # With part=None it should do the same as elm_object_text_get
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         return _ctouni(elm_layout_text_get(self.obj,
             <const char *>part if part is not None else NULL))
 
@@ -259,8 +259,8 @@ cdef class LayoutClass(Object):
         :type source: string
 
         """
-        if isinstance(emission, unicode): emission = PyUnicode_AsUTF8String(emission)
-        if isinstance(source, unicode): source = PyUnicode_AsUTF8String(source)
+        emission = _tobytes_cached(emission)
+        source = _tobytes_cached(source)
         elm_layout_signal_emit(self.obj,
             <const char *>emission if emission is not None else NULL,
             <const char *>source if source is not None else NULL)
@@ -370,7 +370,7 @@ cdef class LayoutClass(Object):
             Raises RuntimeError if adding the child fails
 
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         if not elm_layout_box_append(self.obj,
             <const char *>part if part is not None else NULL,
             child.obj):
@@ -401,7 +401,7 @@ cdef class LayoutClass(Object):
             Raises RuntimeError if adding the child fails
 
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         if not elm_layout_box_prepend(self.obj,
             <const char *>part if part is not None else NULL,
             child.obj):
@@ -434,7 +434,7 @@ cdef class LayoutClass(Object):
             Raises RuntimeError if adding the child fails
 
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         if not elm_layout_box_insert_before(self.obj,
             <const char *>part if part is not None else NULL,
             child.obj, reference.obj):
@@ -467,7 +467,7 @@ cdef class LayoutClass(Object):
             Raises RuntimeError if adding the child fails
 
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         if not elm_layout_box_insert_at(self.obj,
             <const char *>part if part is not None else NULL,
             child.obj, pos):
@@ -493,7 +493,7 @@ cdef class LayoutClass(Object):
         :rtype: :py:class:`~efl.evas.Object`
 
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         return object_from_instance(elm_layout_box_remove(self.obj,
             <const char *>part if part is not None else NULL,
             child.obj))
@@ -522,7 +522,7 @@ cdef class LayoutClass(Object):
             Raises RuntimeError if removing the children fails
 
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         if not elm_layout_box_remove_all(self.obj,
             <const char *>part if part is not None else NULL,
             clear):
@@ -563,7 +563,7 @@ cdef class LayoutClass(Object):
             Raises RuntimeError if adding the child fails
 
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         if not elm_layout_table_pack(self.obj,
             <const char *>part if part is not None else NULL,
             child_obj.obj, col, row, colspan, rowspan):
@@ -589,7 +589,7 @@ cdef class LayoutClass(Object):
         :rtype: :py:class:`~efl.evas.Object`
 
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         return object_from_instance(elm_layout_table_unpack(self.obj,
             <const char *>part if part is not None else NULL,
             child_obj.obj))
@@ -618,7 +618,7 @@ cdef class LayoutClass(Object):
             Raises RuntimeError if clearing the table fails
 
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         if not elm_layout_table_clear(self.obj,
             <const char *>part if part is not None else NULL,
             clear):
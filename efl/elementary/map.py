@@ -1,29 +0,0 @@
-from . import Map, MapRoute, MapName, MapOverlay, MapOverlayClass, \
-    MapOverlayBubble, MapOverlayLine, MapOverlayPolygon, MapOverlayCircle, \
-    MapOverlayScale, MapOverlayRoute
-
-from . import ELM_MAP_OVERLAY_TYPE_NONE
-from . import ELM_MAP_OVERLAY_TYPE_DEFAULT
-from . import ELM_MAP_OVERLAY_TYPE_CLASS
-from . import ELM_MAP_OVERLAY_TYPE_GROUP
-from . import ELM_MAP_OVERLAY_TYPE_BUBBLE
-from . import ELM_MAP_OVERLAY_TYPE_ROUTE
-from . import ELM_MAP_OVERLAY_TYPE_LINE
-from . import ELM_MAP_OVERLAY_TYPE_POLYGON
-from . import ELM_MAP_OVERLAY_TYPE_CIRCLE
-from . import ELM_MAP_OVERLAY_TYPE_SCALE
-
-from . import ELM_MAP_ROUTE_METHOD_FASTEST
-from . import ELM_MAP_ROUTE_METHOD_SHORTEST
-
-from . import ELM_MAP_ROUTE_TYPE_MOTOCAR
-from . import ELM_MAP_ROUTE_TYPE_BICYCLE
-from . import ELM_MAP_ROUTE_TYPE_FOOT
-
-from . import ELM_MAP_SOURCE_TYPE_TILE
-from . import ELM_MAP_SOURCE_TYPE_ROUTE
-from . import ELM_MAP_SOURCE_TYPE_NAME
-
-from . import ELM_MAP_ZOOM_MODE_MANUAL
-from . import ELM_MAP_ZOOM_MODE_AUTO_FIT
-from . import ELM_MAP_ZOOM_MODE_AUTO_FILL
@@ -0,0 +1,76 @@
+# Copyright (C) 2007-2022 various contributors (see AUTHORS)
+#
+# This file is part of Python-EFL.
+#
+# Python-EFL is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 3 of the License, or (at your option) any later version.
+#
+# Python-EFL is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this Python-EFL.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+The :class:`Map` widget and its overlays, built as a separate module so
+that their code is only loaded when they are actually used.
+
+.. versionadded:: 1.27
+
+"""
+
+from cpython cimport PyUnicode_AsUTF8String, Py_INCREF, Py_DECREF
+
+from efl.eina cimport Eina_Bool, Eina_List, eina_list_append, eina_list_free
+from efl.evas cimport Evas_Object, Evas_Coord, Object as evasObject
+from efl.eo cimport _object_mapping_register, object_from_instance
+from efl.utils.conversions cimport _ctouni
+from efl.utils.deprecated import DEPRECATED
+
+from efl.elementary cimport Object
+from efl.elementary.enums cimport Elm_Scroller_Policy
+
+cdef extern from "Elementary.h":
+    # used by the deprecated scroller methods
+    void elm_scroller_policy_set(Evas_Object *obj,
+                                 Elm_Scroller_Policy policy_h,
+                                 Elm_Scroller_Policy policy_v)
+    void elm_scroller_policy_get(const Evas_Object *obj,
+                                 Elm_Scroller_Policy *policy_h,
+                                 Elm_Scroller_Policy *policy_v)
+    void elm_scroller_bounce_set(Evas_Object *obj, Eina_Bool h_bounce,
+                                 Eina_Bool v_bounce)
+    void elm_scroller_bounce_get(const Evas_Object *obj, Eina_Bool *h_bounce,
+                                 Eina_Bool *v_bounce)
+
+import traceback
+
+from efl.elementary import ELM_MAP_OVERLAY_TYPE_NONE
+from efl.elementary import ELM_MAP_OVERLAY_TYPE_DEFAULT
+from efl.elementary import ELM_MAP_OVERLAY_TYPE_CLASS
+from efl.elementary import ELM_MAP_OVERLAY_TYPE_GROUP
+from efl.elementary import ELM_MAP_OVERLAY_TYPE_BUBBLE
+from efl.elementary import ELM_MAP_OVERLAY_TYPE_ROUTE
+from efl.elementary import ELM_MAP_OVERLAY_TYPE_LINE
+from efl.elementary import ELM_MAP_OVERLAY_TYPE_POLYGON
+from efl.elementary import ELM_MAP_OVERLAY_TYPE_CIRCLE
+from efl.elementary import ELM_MAP_OVERLAY_TYPE_SCALE
+from efl.elementary import ELM_MAP_ROUTE_METHOD_FASTEST
+from efl.elementary import ELM_MAP_ROUTE_METHOD_SHORTEST
+from efl.elementary import ELM_MAP_ROUTE_TYPE_MOTOCAR
+from efl.elementary import ELM_MAP_ROUTE_TYPE_BICYCLE
+from efl.elementary import ELM_MAP_ROUTE_TYPE_FOOT
+from efl.elementary import ELM_MAP_SOURCE_TYPE_TILE
+from efl.elementary import ELM_MAP_SOURCE_TYPE_ROUTE
+from efl.elementary import ELM_MAP_SOURCE_TYPE_NAME
+from efl.elementary import ELM_MAP_ZOOM_MODE_MANUAL
+from efl.elementary import ELM_MAP_ZOOM_MODE_AUTO_FIT
+from efl.elementary import ELM_MAP_ZOOM_MODE_AUTO_FILL
+
+
+include "map.pxi"
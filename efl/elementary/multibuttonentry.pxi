@@ -43,7 +43,7 @@ cdef Eina_Bool _multibuttonentry_filter_callback(Evas_Object *obj, \
 
 cdef char * _multibuttonentry_format_cb(int count, void *data) with gil:
     cdef MultiButtonEntry obj = <MultiButtonEntry>data
-    (callback, a, ka) = obj.internal_data["multibuttonentry_format_cb"]
+    (callback, a, ka) = obj.internal_data_get()["multibuttonentry_format_cb"]
 
     try:
         s = callback(count, *a, **ka)
@@ -562,12 +562,12 @@ cdef class MultiButtonEntry(Object):
 
         """
         if func is None:
-            self.internal_data["multibuttonentry_format_cb"] = None
+            self.internal_data_get()["multibuttonentry_format_cb"] = None
             elm_multibuttonentry_format_function_set(self.obj, NULL, NULL)
             return
 
         cbdata = (func, args, kwargs)
-        self.internal_data["multibuttonentry_format_cb"] = cbdata
+        self.internal_data_get()["multibuttonentry_format_cb"] = cbdata
 
         elm_multibuttonentry_format_function_set(self.obj,
                                                 _multibuttonentry_format_cb,
@@ -98,10 +98,7 @@ cdef class Object(SmartObject):
 
     """
 
-    cdef:
-        list _elm_event_cbs, _elm_signal_cbs
-        object cnp_drop_cb, cnp_drop_data
-        object cnp_selection_loss_cb, cnp_selection_loss_data
+    # c globals declared in efl.elementary.pxd
 
     def __init__(self, *args, **kwargs):
         if type(self) is Object:
@@ -121,7 +118,7 @@ cdef class Object(SmartObject):
         :type text: string
 
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         if isinstance(text, unicode): text = PyUnicode_AsUTF8String(text)
         elm_object_part_text_set(self.obj,
             <const char *>part if part is not None else NULL,
@@ -138,7 +135,7 @@ cdef class Object(SmartObject):
         :rtype: string
 
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         return _ctouni(elm_object_part_text_get(self.obj,
             <const char *>part if part is not None else NULL))
 
@@ -178,7 +175,7 @@ cdef class Object(SmartObject):
         :type content: :py:class:`efl.evas.Object`
 
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         elm_object_part_content_set(self.obj,
             <const char *>part if part is not None else NULL, content.obj)
 
@@ -193,7 +190,7 @@ cdef class Object(SmartObject):
         :rtype: :py:class:`efl.evas.Object`
 
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         return object_from_instance(elm_object_part_content_get(self.obj,
             <const char *>part if part is not None else NULL))
 
@@ -207,7 +204,7 @@ cdef class Object(SmartObject):
         :type part: string
 
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         return object_from_instance(elm_object_part_content_unset(self.obj,
             <const char *>part if part is not None else NULL))
 
@@ -394,9 +391,8 @@ cdef class Object(SmartObject):
         :type source: string
 
         """
-        if isinstance(emission, unicode):
-            emission = PyUnicode_AsUTF8String(emission)
-        if isinstance(source, unicode): source = PyUnicode_AsUTF8String(source)
+        emission = _tobytes_cached(emission)
+        source = _tobytes_cached(source)
         elm_object_signal_emit(self.obj,
             <const char *>emission if emission is not None else NULL,
             <const char *>source if source is not None else NULL)
@@ -1449,7 +1445,7 @@ cdef class Object(SmartObject):
     @DEPRECATED("1.8", "Use :py:func:`domain_translatable_part_text_set` instead.")
     def domain_translatable_text_part_set(self, part, domain, text):
         """domain_translatable_text_part_set(part, domain, text)"""
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         if isinstance(domain, unicode): domain = PyUnicode_AsUTF8String(domain)
         if isinstance(text, unicode): text = PyUnicode_AsUTF8String(text)
         elm_object_domain_translatable_part_text_set(self.obj,
@@ -1482,7 +1478,7 @@ cdef class Object(SmartObject):
         .. versionadded:: 1.8
 
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         if isinstance(domain, unicode): domain = PyUnicode_AsUTF8String(domain)
         if isinstance(text, unicode): text = PyUnicode_AsUTF8String(text)
         elm_object_domain_translatable_part_text_set(self.obj,
@@ -1501,7 +1497,7 @@ cdef class Object(SmartObject):
 
     def translatable_part_text_set(self, part, text):
         """A convenience function."""
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         if isinstance(text, unicode): text = PyUnicode_AsUTF8String(text)
         elm_object_translatable_part_text_set(self.obj,
             <const char *>part if part is not None else NULL,
@@ -1509,7 +1505,7 @@ cdef class Object(SmartObject):
 
     @DEPRECATED("1.8", "Use :py:func:`translatable_part_text_get` instead.")
     def translatable_text_part_get(self, part):
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         return _ctouni(elm_object_translatable_part_text_get(self.obj,
             <const char *>part if part is not None else NULL))
 
@@ -1532,7 +1528,7 @@ cdef class Object(SmartObject):
         .. versionadded:: 1.8
 
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         return _ctouni(elm_object_translatable_part_text_get(self.obj,
             <const char *>part if part is not None else NULL))
 
@@ -1556,7 +1552,7 @@ cdef class Object(SmartObject):
         .. versionadded:: 1.8
 
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         if isinstance(domain, unicode): domain = PyUnicode_AsUTF8String(domain)
         elm_object_domain_part_text_translatable_set(self.obj,
             <const char *>part,
@@ -1565,7 +1561,7 @@ cdef class Object(SmartObject):
 
     def part_text_translatable_set(self, part, bint translatable):
         """A convenience function."""
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         elm_object_part_text_translatable_set(self.obj,
             part, translatable)
 
@@ -60,6 +60,9 @@ cdef _object_item_to_python(Elm_Object_Item *it):
 
     return item
 
+cdef object _object_item_from_data(void *data):
+    return _object_item_to_python(<Elm_Object_Item *>data)
+
 cdef _object_item_list_to_python(const Eina_List *lst):
     cdef Elm_Object_Item *it
     ret = []
@@ -96,17 +99,95 @@ cdef void _object_item_callback2(void *data, Evas_Object *obj, void *event_info)
     except Exception:
         traceback.print_exc()
 
-cdef class ObjectItem(object):
+cdef object _text_cache_miss = object()
+
+cdef class _ItemTextCache(object):
+    """LRU cache of the texts given by the text_get function of an item class.
+
+    Texts are stored already encoded, for each item and part, and the
+    cache keeps the texts of at most ``size`` items.
+
     """
+    cdef:
+        object entries
+        unsigned int size
+
+    def __cinit__(self, unsigned int size):
+        self.entries = OrderedDict()
+        self.size = size
+
+    cdef object lookup(self, ObjectItem item, const char *part):
+        cdef:
+            uintptr_t key = <uintptr_t><void *>item
+            dict texts = self.entries.pop(key, None)
+
+        if texts is None:
+            return _text_cache_miss
+        self.entries[key] = texts
+        return texts.get(<bytes>part, _text_cache_miss)
+
+    cdef int store(self, ObjectItem item, const char *part, object text) except -1:
+        cdef:
+            uintptr_t key = <uintptr_t><void *>item
+            dict texts = self.entries.pop(key, None)
+
+        if texts is None:
+            texts = {}
+            while len(self.entries) >= self.size:
+                self.entries.popitem(last=False)
+        texts[<bytes>part] = text
+        self.entries[key] = texts
+        return 0
+
+    cdef int invalidate(self, ObjectItem item) except -1:
+        self.entries.pop(<uintptr_t><void *>item, None)
+        return 0
+
+    cdef int clear(self) except -1:
+        self.entries.clear()
+        return 0
+
+    cdef int resize(self, unsigned int size) except -1:
+        self.size = size
+        while len(self.entries) > size:
+            self.entries.popitem(last=False)
+        return 0
+
+    def __len__(self):
+        return len(self.entries)
+
+
+cdef char *_item_text_get(ObjectItem item, object item_data,
+                          _ItemTextCache cache, object func,
+                          Evas_Object *obj, const char *part):
+    """Common implementation of the genlist and gengrid text_get."""
+    cdef char *text = NULL
+
+    if cache is not None:
+        ret = cache.lookup(item, part)
+        if ret is not _text_cache_miss:
+            return strdup(ret) if ret is not None else NULL
 
-    A generic item for the widgets. This is the base class for all the other
-    widget items.
+    try:
+        o = object_from_instance(obj)
+        ret = func(o, _ctouni_cached(part), item_data)
+    except Exception:
+        traceback.print_exc()
+        return NULL
 
-    .. py:attribute:: data
+    if isinstance(ret, unicode): ret = PyUnicode_AsUTF8String(ret)
+    if ret is not None:
+        text = strdup(ret)
+    if cache is not None:
+        cache.store(item, part, ret)
+    return text
 
-        :type: dict
 
-        A dictionary object that holds user data.
+cdef class ObjectItem(object):
+    """
+
+    A generic item for the widgets. This is the base class for all the other
+    widget items.
 
     """
 
@@ -116,7 +197,7 @@ cdef class ObjectItem(object):
         object cb_data
         tuple args
         dict kwargs
-        readonly dict data
+        dict _data
         int _set_obj(self, Elm_Object_Item *item) except 0
 
     # Notes to bindings' developers:
@@ -127,9 +208,6 @@ cdef class ObjectItem(object):
     # a pointer to Elm_Object_Item.
     #
 
-    def __cinit__(self):
-        self.data = dict()
-
     def __dealloc__(self):
         if self.item != NULL:
             elm_object_item_del_cb_set(self.item, NULL)
@@ -140,6 +218,22 @@ cdef class ObjectItem(object):
         if type(self) is ObjectItem:
             raise TypeError("Must not instantiate ObjectItem, but subclasses")
 
+    property data:
+        """A dictionary object that holds user data.
+
+        The dictionary is only created the first time it is accessed.
+
+        :type: dict
+
+        .. versionchanged:: 1.27
+            The dictionary is created on first access
+
+        """
+        def __get__(self):
+            if self._data is None:
+                self._data = {}
+            return self._data
+
     cdef int _set_obj(self, Elm_Object_Item *item) except 0:
         assert self.item == NULL, "Object must be clean"
         self.item = item
@@ -168,7 +262,8 @@ cdef class ObjectItem(object):
 
     @DEPRECATED("1.8", "Use the data attribute (dict) instead.")
     def data_get(self):
-        return (self.args, self.kwargs)
+        return (self.args if self.args is not None else (),
+                self.kwargs if self.kwargs is not None else {})
 
     @DEPRECATED("1.8", "Use the data attribute (dict) instead.")
     def data_set(self, *args, **kwargs):
@@ -204,7 +299,7 @@ cdef class ObjectItem(object):
         :param content: The new content of the object item
 
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         elm_object_item_part_content_set(self.item,
             <const char *>part if part is not None else NULL, content.obj)
 
@@ -220,7 +315,7 @@ cdef class ObjectItem(object):
         :rtype: :py:class:`~efl.evas.Object`
 
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         return object_from_instance(elm_object_item_part_content_get(self.item,
             <const char *>part if part is not None else NULL))
 
@@ -234,7 +329,7 @@ cdef class ObjectItem(object):
         :type part: string
 
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         return object_from_instance(elm_object_item_part_content_unset(self.item,
             <const char *>part if part is not None else NULL))
 
@@ -267,7 +362,7 @@ cdef class ObjectItem(object):
         :type text: string
 
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         if isinstance(text, unicode): text = PyUnicode_AsUTF8String(text)
         elm_object_item_part_text_set(self.item,
             <const char *>part if part is not None else NULL,
@@ -284,7 +379,7 @@ cdef class ObjectItem(object):
         :rtype: string
 
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         return _ctouni(elm_object_item_part_text_get(self.item,
             <const char *>part if part is not None else NULL))
 
@@ -310,7 +405,7 @@ cdef class ObjectItem(object):
         .. versionadded:: 1.8
 
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         if isinstance(domain, unicode): domain = PyUnicode_AsUTF8String(domain)
         if isinstance(text, unicode): text = PyUnicode_AsUTF8String(text)
         elm_object_item_domain_translatable_part_text_set(self.item,
@@ -332,7 +427,7 @@ cdef class ObjectItem(object):
         .. versionadded:: 1.8
 
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         return _ctouni(elm_object_item_translatable_part_text_get(self.item,
             <const char *>part if part is not None else NULL))
 
@@ -357,7 +452,7 @@ cdef class ObjectItem(object):
         .. versionadded:: 1.8
 
         """
-        if isinstance(part, unicode): part = PyUnicode_AsUTF8String(part)
+        part = _tobytes_cached(part)
         if isinstance(domain, unicode): domain = PyUnicode_AsUTF8String(domain)
         elm_object_item_domain_part_text_translatable_set(self.item,
             <const char *>part,
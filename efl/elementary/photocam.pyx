@@ -0,0 +1,59 @@
+# Copyright (C) 2007-2022 various contributors (see AUTHORS)
+#
+# This file is part of Python-EFL.
+#
+# Python-EFL is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 3 of the License, or (at your option) any later version.
+#
+# Python-EFL is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this Python-EFL.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+The :class:`Photocam` widget, built as a separate module so that its code
+is only loaded when it is actually used.
+
+.. versionadded:: 1.27
+
+"""
+
+from cpython cimport PyUnicode_AsUTF8String
+
+from efl.eina cimport Eina_Bool
+from efl.evas cimport Evas_Object, Evas_Load_Error, \
+    Evas_Image_Orient, Object as evasObject
+from efl.eo cimport _object_mapping_register, object_from_instance
+from efl.utils.conversions cimport _ctouni
+from efl.utils.deprecated import DEPRECATED
+
+from efl.elementary cimport Object
+from efl.elementary.enums cimport Elm_Scroller_Policy
+
+cdef extern from "Elementary.h":
+    # used by the deprecated scroller methods
+    void elm_scroller_policy_set(Evas_Object *obj,
+                                 Elm_Scroller_Policy policy_h,
+                                 Elm_Scroller_Policy policy_v)
+    void elm_scroller_policy_get(const Evas_Object *obj,
+                                 Elm_Scroller_Policy *policy_h,
+                                 Elm_Scroller_Policy *policy_v)
+    void elm_scroller_bounce_set(Evas_Object *obj, Eina_Bool h_bounce,
+                                 Eina_Bool v_bounce)
+    void elm_scroller_bounce_get(const Evas_Object *obj, Eina_Bool *h_bounce,
+                                 Eina_Bool *v_bounce)
+
+from efl.elementary import ELM_PHOTOCAM_ZOOM_MODE_MANUAL
+from efl.elementary import ELM_PHOTOCAM_ZOOM_MODE_AUTO_FIT
+from efl.elementary import ELM_PHOTOCAM_ZOOM_MODE_AUTO_FILL
+from efl.elementary import ELM_PHOTOCAM_ZOOM_MODE_AUTO_FIT_IN
+from efl.elementary import ELM_PHOTOCAM_ZOOM_MODE_LAST
+
+
+include "photocam.pxi"
@@ -0,0 +1,37 @@
+# Copyright (C) 2007-2022 various contributors (see AUTHORS)
+#
+# This file is part of Python-EFL.
+#
+# Python-EFL is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 3 of the License, or (at your option) any later version.
+#
+# Python-EFL is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this Python-EFL.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+The :class:`Video` and :class:`Player` widgets, built as a separate module
+so that their code is only loaded when they are actually used.
+
+.. versionadded:: 1.27
+
+"""
+
+from cpython cimport PyUnicode_AsUTF8String
+
+from efl.eina cimport Eina_Bool
+from efl.evas cimport Evas_Object, Object as evasObject
+from efl.eo cimport _object_mapping_register, object_from_instance
+from efl.utils.conversions cimport _ctouni
+
+from efl.elementary cimport LayoutClass
+
+
+include "video.pxi"
@@ -1,12 +0,0 @@
-from . import Web
-
-from . import ELM_WEB_WINDOW_FEATURE_TOOLBAR
-from . import ELM_WEB_WINDOW_FEATURE_STATUSBAR
-from . import ELM_WEB_WINDOW_FEATURE_SCROLLBARS
-from . import ELM_WEB_WINDOW_FEATURE_MENUBAR
-from . import ELM_WEB_WINDOW_FEATURE_LOCATIONBAR
-from . import ELM_WEB_WINDOW_FEATURE_FULLSCREEN
-
-from . import ELM_WEB_ZOOM_MODE_MANUAL
-from . import ELM_WEB_ZOOM_MODE_AUTO_FIT
-from . import ELM_WEB_ZOOM_MODE_AUTO_FILL
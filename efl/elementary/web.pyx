@@ -0,0 +1,50 @@
+# Copyright (C) 2007-2022 various contributors (see AUTHORS)
+#
+# This file is part of Python-EFL.
+#
+# Python-EFL is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 3 of the License, or (at your option) any later version.
+#
+# Python-EFL is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this Python-EFL.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+The :class:`Web` widget, built as a separate module so that its code is
+only loaded when it is actually used.
+
+.. versionadded:: 1.27
+
+"""
+
+from cpython cimport PyUnicode_AsUTF8String
+
+from efl.eina cimport Eina_Bool, Eina_List
+from efl.evas cimport Evas_Object, Evas_Coord, Object as evasObject
+from efl.eo cimport _object_mapping_register, object_from_instance
+from efl.utils.conversions cimport _ctouni
+from efl.utils.deprecated import DEPRECATED
+
+from efl.elementary cimport Object
+
+import traceback
+
+from efl.elementary import ELM_WEB_WINDOW_FEATURE_TOOLBAR, \
+    ELM_WEB_WINDOW_FEATURE_STATUSBAR, ELM_WEB_WINDOW_FEATURE_SCROLLBARS, \
+    ELM_WEB_WINDOW_FEATURE_MENUBAR, ELM_WEB_WINDOW_FEATURE_LOCATIONBAR, \
+    ELM_WEB_WINDOW_FEATURE_FULLSCREEN, ELM_WEB_ZOOM_MODE_MANUAL, \
+    ELM_WEB_ZOOM_MODE_AUTO_FIT, ELM_WEB_ZOOM_MODE_AUTO_FILL
+
+
+cdef object _cb_string_conv(void *addr):
+    return _ctouni(<const char *>addr) if addr is not NULL else None
+
+
+include "web.pxi"
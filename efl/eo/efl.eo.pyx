@@ -29,7 +29,8 @@ Classes
 
 """
 
-from cpython cimport PyObject, Py_INCREF, Py_DECREF, PyUnicode_AsUTF8String
+from cpython cimport PyObject, Py_INCREF, Py_DECREF, PyUnicode_AsUTF8String, \
+    PY_VERSION_HEX
 
 from libc.stdint cimport uintptr_t
 from efl.eina cimport Eina_Bool, \
@@ -44,7 +45,7 @@ from efl.c_eo cimport Eo as cEo, efl_object_init, efl_object_shutdown, efl_del,
     efl_event_freeze, efl_event_thaw, efl_event_freeze_count_get, \
     efl_event_global_freeze, efl_event_global_thaw, \
     efl_event_global_freeze_count_get, efl_event_callback_stop, \
-    efl_children_iterator_new, Efl_Event
+    efl_children_iterator_new, Efl_Event, efl_isa
 
 from efl.utils.logger cimport add_logger
 
@@ -56,6 +57,7 @@ cdef int PY_REFCOUNT(object o):
     return obj.ob_refcnt
 
 import atexit
+import weakref
 
 ######################################################################
 
@@ -87,8 +89,13 @@ Object mapping is an Eina Hash table into which object type names can be
 registered. These can be used to find a bindings class for an object using
 the function object_from_instance.
 
+Modules that are expensive to load can instead register lazily the name of
+the module that provide the class, the module is then imported the first
+time an object of that type must be wrapped.
+
 """
 cdef Eina_Hash *object_mapping = eina_hash_string_superfast_new(NULL)
+cdef dict object_mapping_lazy = dict()
 
 
 cdef void _object_mapping_register(char *name, object cls) except *:
@@ -108,6 +115,31 @@ cdef void _object_mapping_unregister(char *name):
     eina_hash_del(object_mapping, name, NULL)
 
 
+cdef void _object_mapping_register_lazy(char *name, object module) except *:
+
+    if eina_hash_find(object_mapping, name) != NULL:
+        return
+
+    if isinstance(module, unicode): module = PyUnicode_AsUTF8String(module)
+
+    EINA_LOG_DOM_DBG(PY_EFL_EO_LOG_DOMAIN,
+        "REGISTER LAZY: %s => %s", <char *>name, <char *>module)
+    object_mapping_lazy[<bytes>name] = module
+
+
+cdef void *_object_mapping_lazy_find(const char *name) except? NULL:
+    cdef object module = object_mapping_lazy.pop(<bytes>name, None)
+
+    if module is None:
+        return NULL
+
+    EINA_LOG_DOM_DBG(PY_EFL_EO_LOG_DOMAIN,
+        "Importing %s for Eo type %s.", <char *>module, name)
+    if not isinstance(module, str): module = module.decode("UTF-8")
+    __import__(module)
+    return eina_hash_find(object_mapping, name)
+
+
 cdef api object object_from_instance(cEo *obj):
     """ Create a python object from a C Eo object pointer. """
     cdef:
@@ -133,7 +165,9 @@ cdef api object object_from_instance(cEo *obj):
     cls_ret = eina_hash_find(object_mapping, cls_name)
 
     if cls_ret == NULL:
-        # TODO: Add here a last ditch effort to import the class from a module
+        cls_ret = _object_mapping_lazy_find(cls_name)
+
+    if cls_ret == NULL:
         raise ValueError(
             "Eo object at %#x of type %s does not have a mapping!" % (
                 <uintptr_t>obj, cls_name)
@@ -158,6 +192,60 @@ cdef api cEo *instance_from_object(object obj):
     return o.obj
 
 
+cdef extern from "Python.h":
+    ctypedef struct _PyTypeObject "PyTypeObject":
+        unsigned long tp_flags
+        unsigned int tp_version_tag
+    unsigned long Py_TPFLAGS_VALID_VERSION_TAG
+
+
+# The decorated callbacks of each class, as (version tag, callbacks)
+cdef object decorated_callbacks_cache = weakref.WeakKeyDictionary()
+
+
+cdef unsigned int _type_version_tag(type cls):
+    """
+
+    The version tag of a type, or 0 if it is not valid. The tag changes
+    every time the type (or one of its bases) is modified.
+
+    Since Python 3.10 modifying a type resets its tag to 0, and 3.13 no
+    more sets Py_TPFLAGS_VALID_VERSION_TAG, so the flag is only checked
+    before 3.10.
+
+    """
+    cdef _PyTypeObject *t = <_PyTypeObject *>cls
+    if PY_VERSION_HEX < 0x030A0000 and \
+       not t.tp_flags & Py_TPFLAGS_VALID_VERSION_TAG:
+        return 0
+    return t.tp_version_tag
+
+
+cdef tuple _decorated_callbacks_get(type cls):
+    cdef:
+        tuple cached = decorated_callbacks_cache.get(cls)
+        unsigned int tag
+        list callbacks = []
+        object attrib, func_name
+
+    if cached is not None and cached[0] != 0 and \
+       cached[0] == _type_version_tag(cls):
+        return cached[1]
+
+    for attrib in cls.__dict__.values():
+        for (func_name, *args) in getattr(attrib,
+                                          "__decorated_callbacks__", ()):
+            callbacks.append((func_name, tuple(args)))
+
+    # an attribute lookup on the type make sure it has a valid version tag
+    getattr(cls, "__decorated_callbacks__", None)
+    tag = _type_version_tag(cls)
+
+    cached = (tag, tuple(callbacks))
+    decorated_callbacks_cache[cls] = cached
+    return cached[1]
+
+
 cdef void _register_decorated_callbacks(Eo obj):
     """
 
@@ -166,17 +254,14 @@ cdef void _register_decorated_callbacks(Eo obj):
     arguments. Must be called just after the _set_obj call.
     List items signature: ("function_name", *args)
 
-    """
-    cdef object attr_name, attrib, func_name, func
-    cdef type cls = type(obj)
+    The list of callbacks is only computed once for each class, and computed
+    again only if the class is modified.
 
-    # FIXME: This whole thing is really slow. Can we do it better?
+    """
+    cdef object func_name, args
 
-    for attr_name, attrib in cls.__dict__.items():
-        if "__decorated_callbacks__" in dir(attrib):
-            for (func_name, *args) in getattr(attrib, "__decorated_callbacks__"):
-                func = getattr(obj, func_name)
-                func(*args)
+    for func_name, args in _decorated_callbacks_get(type(obj)):
+        getattr(obj, func_name)(*args)
 
 
 ######################################################################
@@ -227,10 +312,6 @@ cdef class Eo(object):
 
     # c globals declared in eo.pxd (to make the class available to others)
 
-    def __cinit__(self):
-        self.data = dict()
-        self.internal_data = dict()
-
     def __init__(self, *args, **kwargs):
         if type(self) is Eo:
             raise TypeError("Must not instantiate Eo, but subclasses")
@@ -260,14 +341,22 @@ cdef class Eo(object):
 
         # from efl 1.18 eo.parent changed behaviour, objects are now reparented
         # when, fe, swallowed. This is the hack to keep the old behavior.
-        try:
-            parent = object_from_instance(efl_parent_get(obj))
-        except ValueError:
-            parent = None
-        self.internal_data["_legacy_parent"] = parent
+        # The python object is only looked up when the parent is requested.
+        self._legacy_parent = efl_parent_get(obj)
 
         return 1
 
+    cdef object _legacy_parent_get(self):
+        # a borrowed pointer, the parent may have been deleted since: eo
+        # ids are checked, a stale one is not a valid object anymore
+        if self._legacy_parent == NULL or \
+                not efl_isa(self._legacy_parent, efl_object_class_get()):
+            return None
+        try:
+            return object_from_instance(self._legacy_parent)
+        except ValueError:
+            return None
+
     def _wipe_obj_data_NEVER_USE_THIS(self):
         # only used in tests/eo/test_02_class_names.py
         # to force object_from_instance() to recreate the obj
@@ -307,6 +396,22 @@ cdef class Eo(object):
         """
         return bool(self.obj == NULL)
 
+    property data:
+        """A dictionary that holds user data.
+
+        The dictionary is only created the first time it is accessed.
+
+        :type: dict
+
+        .. versionchanged:: 1.27
+            The dictionary is created on first access
+
+        """
+        def __get__(self):
+            if self._data is None:
+                self._data = dict()
+            return self._data
+
     property parent:
         """The parent object
 
@@ -314,18 +419,18 @@ cdef class Eo(object):
 
         """
         def __set__(self, Eo parent):
-            self.internal_data["_legacy_parent"] = parent
+            self._legacy_parent = parent.obj
             efl_parent_set(self.obj, parent.obj)
 
         def __get__(self):
-            return self.internal_data["_legacy_parent"]
+            return self._legacy_parent_get()
 
     def parent_set(self, Eo parent):
-        self.internal_data["_legacy_parent"] = parent
+        self._legacy_parent = parent.obj
         efl_parent_set(self.obj, parent.obj)
 
     def parent_get(self):
-        return self.internal_data["_legacy_parent"]
+        return self._legacy_parent_get()
 
     def event_freeze(self):
         """Pause event propagation for this object."""
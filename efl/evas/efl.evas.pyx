@@ -973,7 +973,8 @@ Module level functions
 
 cimport efl.evas.enums as enums
 
-from efl.utils.conversions cimport eina_list_strings_to_python_list
+from efl.utils.conversions cimport eina_list_strings_to_python_list, \
+    eina_list_objects_to_python_list, eina_list_objects_to_python_iterator
 from efl.eina cimport EINA_LOG_DOM_DBG, EINA_LOG_DOM_INFO, EINA_LOG_DOM_WARN, \
     EINA_LOG_DOM_ERR, EINA_LOG_DOM_CRIT
 from efl.utils.logger cimport add_logger
@@ -981,6 +982,7 @@ from efl.utils.logger cimport add_logger
 cdef int PY_EFL_EVAS_LOG_DOMAIN = add_logger(__name__).eina_log_domain
 
 import atexit
+import weakref
 
 
 EVAS_LAYER_MIN = enums.EVAS_LAYER_MIN
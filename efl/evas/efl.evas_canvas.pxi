@@ -393,25 +393,36 @@ cdef class Canvas(Eo):
 
         :return: children objects.
         :rtype: List of :py:class:`efl.evas.Object`
+
+        .. seealso:: :py:meth:`objects_at_xy_iter`
         """
-        cdef:
-            Eina_List *objs
-            Eina_List *itr
-            int ip, ih
-            Evas_Object *o
+        cdef Eina_List *objs
 
-        ip = include_pass_events_objects
-        ih = include_hidden_objects
-        objs = evas_objects_at_xy_get(self.obj, x, y, ip, ih)
-        lst = []
-        itr = objs
-        while itr != NULL:
-            o = <Evas_Object*>itr.data
-            lst.append(object_from_instance(o))
-            itr = itr.next
+        objs = evas_objects_at_xy_get(self.obj, x, y,
+                                      include_pass_events_objects,
+                                      include_hidden_objects)
+        lst = eina_list_objects_to_python_list(objs)
         eina_list_free(objs)
         return lst
 
+    def objects_at_xy_iter(self, int x, int y,
+                           include_pass_events_objects=False,
+                           include_hidden_objects=False):
+        """Iterate over all children at (x, y).
+
+        Like :py:meth:`objects_at_xy_get`, but the objects are only created
+        when reached. ``len()`` of the returned iterator is the number of
+        objects, without creating them.
+
+        :rtype: iterator of :py:class:`efl.evas.Object`
+
+        .. versionadded:: 1.27
+        """
+        return eina_list_objects_to_python_iterator(
+            evas_objects_at_xy_get(self.obj, x, y,
+                                   include_pass_events_objects,
+                                   include_hidden_objects))
+
     def objects_in_rectangle_get(self, int x, int y, int w, int h,
                                  include_pass_events_objects=False,
                                  include_hidden_objects=False):
@@ -426,25 +437,36 @@ cdef class Canvas(Eo):
 
         :return: children objects.
         :rtype: List of :py:class:`efl.evas.Object`
+
+        .. seealso:: :py:meth:`objects_in_rectangle_iter`
         """
-        cdef:
-            Eina_List *objs
-            Eina_List *itr
-            int ip, ih
-            Evas_Object *o
+        cdef Eina_List *objs
 
-        ip = include_pass_events_objects
-        ih = include_hidden_objects
-        objs = evas_objects_in_rectangle_get(self.obj, x, y, w, h, ip, ih)
-        lst = []
-        itr = objs
-        while itr != NULL:
-            o = <Evas_Object*>itr.data
-            lst.append(object_from_instance(o))
-            itr = itr.next
+        objs = evas_objects_in_rectangle_get(self.obj, x, y, w, h,
+                                             include_pass_events_objects,
+                                             include_hidden_objects)
+        lst = eina_list_objects_to_python_list(objs)
         eina_list_free(objs)
         return lst
 
+    def objects_in_rectangle_iter(self, int x, int y, int w, int h,
+                                  include_pass_events_objects=False,
+                                  include_hidden_objects=False):
+        """Iterate over all children at given geometry.
+
+        Like :py:meth:`objects_in_rectangle_get`, but the objects are only
+        created when reached. ``len()`` of the returned iterator is the
+        number of objects, without creating them.
+
+        :rtype: iterator of :py:class:`efl.evas.Object`
+
+        .. versionadded:: 1.27
+        """
+        return eina_list_objects_to_python_iterator(
+            evas_objects_in_rectangle_get(self.obj, x, y, w, h,
+                                          include_pass_events_objects,
+                                          include_hidden_objects))
+
     def damage_rectangle_add(self, int x, int y, int w, int h):
         evas_damage_rectangle_add(self.obj, x, y, w, h)
 
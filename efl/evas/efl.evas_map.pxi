@@ -16,6 +16,66 @@
 # along with this Python-EFL.  If not, see <http://www.gnu.org/licenses/>.
 
 
+from cpython.buffer cimport Py_buffer, PyObject_CheckBuffer, \
+    PyObject_GetBuffer, PyBuffer_Release, PyBUF_FORMAT, PyBUF_C_CONTIGUOUS
+from cpython cimport array
+from libc.string cimport memcpy
+from efl.utils.conversions cimport buffer_format_code
+
+
+cdef array.array _doubles_array_get(object obj, int width, name):
+    """Get the values in obj as a new flat array of C doubles.
+
+    Like _coords_array_get(), but for buffers of floats or integers.
+
+    """
+    cdef:
+        Py_buffer view
+        array.array arr
+        char code
+        Py_ssize_t n, i
+        double *p
+
+    if not PyObject_CheckBuffer(obj):
+        obj = list(obj)
+        if obj and not isinstance(obj[0], (int, long, float)):
+            obj = [c for point in obj for c in point]
+        arr = array.array("d", obj)
+        if len(arr) % width:
+            raise ValueError("%s must have a multiple of %d items, not %d" %
+                             (name, width, len(arr)))
+        return arr
+
+    PyObject_GetBuffer(obj, &view, PyBUF_FORMAT | PyBUF_C_CONTIGUOUS)
+    try:
+        code = buffer_format_code(&view)
+        if not (
+           (code == c'd' and view.itemsize == sizeof(double)) or
+           (code == c'f' and view.itemsize == sizeof(float))):
+            code = 0
+        else:
+            n = view.len // view.itemsize
+            if n % width:
+                raise ValueError(
+                    "%s must have a multiple of %d items, not %d" %
+                    (name, width, n))
+
+            arr = array.clone(array.array("d"), n, False)
+            p = arr.data.as_doubles
+            if code == c'd':
+                memcpy(p, view.buf, view.len)
+            else:
+                for i in range(n):
+                    p[i] = (<float *>view.buf)[i]
+    finally:
+        PyBuffer_Release(&view)
+
+    if code == 0:
+        # not floats, try with integers
+        return array.array("d", _coords_array_get(obj, width, name))
+    return arr
+
+
 cdef class Map(object):
     """
 
@@ -418,14 +478,72 @@ cdef class Map(object):
         else:
             return (mx, my)
 
-    #
-    # XXX:  Can't use property here since getter has an argument.
-    #
-    # property point_coord:
-    #     def __get__(self):
-    #         return self.point_coord_get()
-    #     def __set__(self, value):
-    #         self.point_coord_set(*value)
+    cdef int _points_check(self, Py_ssize_t n, name) except -1:
+        if n != evas_map_count_get(self.map):
+            raise ValueError("%s has %d points, the map has %d" %
+                             (name, n, evas_map_count_get(self.map)))
+        return 0
+
+    property point_coords:
+        """The coordinates of all the points of the map.
+
+        :type: :class:`array.array` of type ``'i'``, flat (x0, y0, z0,
+            x1, y1, z1...)
+
+        .. seealso:: :py:meth:`point_coords_set`
+
+        .. versionadded:: 1.27
+
+        """
+        def __get__(self):
+            return self.point_coords_get()
+
+        def __set__(self, coords):
+            self.point_coords_set(coords)
+
+    def point_coords_set(self, coords):
+        """Change the coordinates of all the points of the map at once.
+
+        :param coords: The (x, y, z) coordinates of every point, an object
+            supporting the buffer protocol with integers, flat or with one
+            row per point, like :class:`array.array` or an (N, 3) NumPy
+            array, or a sequence of (x, y, z) tuples or of integers.
+        :raise ValueError: if the number of points is not the map count.
+
+        .. seealso:: :py:meth:`point_coord_set`
+
+        .. versionadded:: 1.27
+
+        """
+        cdef:
+            array.array arr = _coords_array_get(coords, 3, "coords")
+            int *p = arr.data.as_ints
+            int i, n = len(arr) // 3
+
+        self._points_check(n, "coords")
+        for i in range(n):
+            evas_map_point_coord_set(self.map, i, p[0], p[1], p[2])
+            p += 3
+
+    def point_coords_get(self):
+        """Get the coordinates of all the points of the map.
+
+        :return: A flat (x0, y0, z0, x1, y1, z1...) array.
+        :rtype: :class:`array.array` of type ``'i'``
+
+        .. versionadded:: 1.27
+
+        """
+        cdef:
+            int i, n = evas_map_count_get(self.map)
+            array.array arr = array.clone(array.array("i"), 3 * max(n, 0),
+                                          False)
+            int *p = arr.data.as_ints
+
+        for i in range(n):
+            evas_map_point_coord_get(self.map, i, &p[0], &p[1], &p[2])
+            p += 3
+        return arr
 
     def point_image_uv_set(self, int idx, double u, double v):
         """Change the map point's U and V texture source point
@@ -456,14 +574,65 @@ cdef class Map(object):
         evas_map_point_image_uv_get(self.map, idx, &u, &v)
         return (u, v)
 
-    #
-    # XXX:  Can't use property here since getter has an argument.
-    #
-    # property point_image_uv:
-    #     def __get__(self):
-    #         return self.point_image_uv_get()
-    #     def __set__(self, value):
-    #         self.point_image_uv_set(*value)
+    property point_image_uvs:
+        """The U and V texture source points of all the points of the map.
+
+        :type: :class:`array.array` of type ``'d'``, flat (u0, v0, u1, v1...)
+
+        .. seealso:: :py:meth:`point_image_uvs_set`
+
+        .. versionadded:: 1.27
+
+        """
+        def __get__(self):
+            return self.point_image_uvs_get()
+
+        def __set__(self, uvs):
+            self.point_image_uvs_set(uvs)
+
+    def point_image_uvs_set(self, uvs):
+        """Change the U and V texture source points of all the map points.
+
+        :param uvs: The (u, v) of every point, an object supporting the
+            buffer protocol with doubles, floats or integers, flat or with
+            one row per point, like :class:`array.array` or an (N, 2) NumPy
+            array, or a sequence of (u, v) tuples or of numbers.
+        :raise ValueError: if the number of points is not the map count.
+
+        .. seealso:: :py:meth:`point_image_uv_set`
+
+        .. versionadded:: 1.27
+
+        """
+        cdef:
+            array.array arr = _doubles_array_get(uvs, 2, "uvs")
+            double *p = arr.data.as_doubles
+            int i, n = len(arr) // 2
+
+        self._points_check(n, "uvs")
+        for i in range(n):
+            evas_map_point_image_uv_set(self.map, i, p[0], p[1])
+            p += 2
+
+    def point_image_uvs_get(self):
+        """Get the U and V texture source points of all the map points.
+
+        :return: A flat (u0, v0, u1, v1...) array.
+        :rtype: :class:`array.array` of type ``'d'``
+
+        .. versionadded:: 1.27
+
+        """
+        cdef:
+            int i, n = evas_map_count_get(self.map)
+            array.array arr = array.clone(array.array("d"), 2 * max(n, 0),
+                                          False)
+            double *p = arr.data.as_doubles
+
+        for i in range(n):
+            evas_map_point_image_uv_get(self.map, i, &p[0], &p[1])
+            p += 2
+        return arr
 
     def point_color_set(self, int idx, int r, int g, int b, int a):
         """Set the color of a vertex in the map
@@ -498,12 +667,124 @@ cdef class Map(object):
         evas_map_point_color_get(self.map, idx, &r, &g, &b, &a)
         return (r, g, b, a)
 
-    #
-    # XXX:  Can't use property here since getter has an argument.
-    #
-    # property point_color:
-    #     def __get__(self):
-    #         return self.point_color_get()
-    #     def __set__(self, value):
-    #         self.point_color_set(*value)
+    property point_colors:
+        """The colors of all the points of the map.
+
+        :type: :class:`array.array` of type ``'i'``, flat (r0, g0, b0, a0,
+            r1, g1, b1, a1...)
+
+        .. seealso:: :py:meth:`point_colors_set`
+
+        .. versionadded:: 1.27
+
+        """
+        def __get__(self):
+            return self.point_colors_get()
+
+        def __set__(self, colors):
+            self.point_colors_set(colors)
+
+    def point_colors_set(self, colors):
+        """Change the colors of all the points of the map at once.
+
+        :param colors: The (r, g, b, a) of every point, an object supporting
+            the buffer protocol with integers, flat or with one row per
+            point, like :class:`bytes`, :class:`array.array` or an (N, 4)
+            NumPy array, or a sequence of (r, g, b, a) tuples or of
+            integers.
+        :raise ValueError: if the number of points is not the map count.
+
+        .. seealso:: :py:meth:`point_color_set`
+
+        .. versionadded:: 1.27
+
+        """
+        cdef:
+            array.array arr = _coords_array_get(colors, 4, "colors")
+            int *p = arr.data.as_ints
+            int i, n = len(arr) // 4
+
+        self._points_check(n, "colors")
+        for i in range(n):
+            evas_map_point_color_set(self.map, i, p[0], p[1], p[2], p[3])
+            p += 4
+
+    def point_colors_get(self):
+        """Get the colors of all the points of the map.
+
+        :return: A flat (r0, g0, b0, a0, r1, g1, b1, a1...) array.
+        :rtype: :class:`array.array` of type ``'i'``
+
+        .. versionadded:: 1.27
+
+        """
+        cdef:
+            int i, n = evas_map_count_get(self.map)
+            array.array arr = array.clone(array.array("i"), 4 * max(n, 0),
+                                          False)
+            int *p = arr.data.as_ints
+
+        for i in range(n):
+            evas_map_point_color_get(self.map, i, &p[0], &p[1], &p[2], &p[3])
+            p += 4
+        return arr
+
+    def apply(self, objects, coords=None, bint enable=True):
+        """Set this map on many objects at once.
+
+        :param objects: The objects to set the map on.
+        :type objects: sequence of :py:class:`Object`
+        :param coords: Optionally, the point coordinates for each object,
+            ``len(objects) * count`` (x, y, z) points of any type accepted
+            by :py:meth:`point_coords_set`, the points of the first object
+            first.
+        :param bool enable: Whether to enable the map on the objects too,
+            see :py:attr:`Object.map_enabled`.
+
+        Evas copies the map set on an object, so a single map can be used
+        as a template: its image uvs, colors, smooth and alpha are set on
+        all the objects, with the coordinates of each object when given.
+        When ``coords`` is given the map keeps the coordinates of the last
+        object.
+
+        This animates the maps of many objects in a single call, for example
+        with ``coords`` updated in a NumPy array each frame::
+
+            m = Map(4)
+            m.point_image_uvs = [(0, 0), (w, 0), (w, h), (0, h)]
+            m.apply(objects, coords)
+
+        :raise TypeError: if one of the objects is not an :py:class:`Object`.
+
+        .. versionadded:: 1.27
+
+        """
+        cdef:
+            list objs = list(objects)
+            array.array arr
+            int *p = NULL
+            int i, j, count = evas_map_count_get(self.map)
+            Object obj
+
+        if coords is not None:
+            arr = _coords_array_get(coords, 3, "coords")
+            if len(arr) != 3 * count * len(objs):
+                raise ValueError(
+                    "coords has %d points, %d needed for %d objects" %
+                    (len(arr) // 3, count * len(objs), len(objs)))
+            p = arr.data.as_ints
+
+        # check all the objects before changing any
+        for obj in objs:
+            if obj is None:
+                raise TypeError("objects must be evas Objects, not None")
+
+        for obj in objs:
+            if p != NULL:
+                for j in range(count):
+                    evas_map_point_coord_set(self.map, j, p[0], p[1], p[2])
+                    p += 3
+            evas_object_map_set(obj.obj, self.map)
+            if enable:
+                evas_object_map_enable_set(obj.obj, 1)
 
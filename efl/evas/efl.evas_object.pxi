@@ -23,6 +23,7 @@ cdef int _object_free_wrapper_resources(Object obj) except 0:
     cdef int i
     for i from 0 <= i < evas_object_event_callbacks_len:
         obj._event_callbacks[i] = None
+    obj._event_coalesce = None
     return 1
 
 
@@ -37,6 +38,13 @@ cdef int _object_unregister_callbacks(Object obj) except 0:
                 evas_object_event_callback_del(o, i, cb)
 
         evas_object_event_callback_del(o, EVAS_CALLBACK_FREE, obj_free_cb)
+
+        if _object_event_coalesce_pending(obj):
+            _coalesce_objects.discard(obj)
+            evas_event_callback_del_full(evas_object_evas_get(o),
+                                         EVAS_CALLBACK_RENDER_PRE,
+                                         cb_object_coalesced_flush,
+                                         <void *>obj)
     return 1
 
 
@@ -71,10 +79,12 @@ cdef _object_add_callback_to_list(Object obj, int type, func, args, kargs):
     if type < 0 or type >= evas_object_event_callbacks_len:
         raise ValueError("Invalid callback type")
 
+    # the lists are replaced instead of changed in place, so that the
+    # dispatchers can iterate them without a copy
     r = (func, args, kargs)
     lst = obj._event_callbacks[type]
     if lst is not None:
-        lst.append(r)
+        obj._event_callbacks[type] = lst + [r]
         return False
     else:
         obj._event_callbacks[type] = [r]
@@ -98,11 +108,12 @@ cdef _object_del_callback_from_list(Object obj, int type, func):
         raise ValueError("Callback %s was not registered with type %d" %
                          (func, type))
 
-    lst.pop(i)
+    lst = lst[:i] + lst[i + 1:]
     if len(lst) == 0:
         obj._event_callbacks[type] = None
         return True
     else:
+        obj._event_callbacks[type] = lst
         return False
 
 
@@ -1727,6 +1738,59 @@ cdef class Object(Eo):
                 cb = evas_object_event_callbacks[<int>type]
                 evas_object_event_callback_del(self.obj, type, cb)
 
+    def event_coalesce_set(self, Evas_Callback_Type type, bint coalesce,
+                           bint history=False):
+        """Merge the move events received between two renders.
+
+        When enabled the callbacks of *EVAS_CALLBACK_MOUSE_MOVE* or
+        *EVAS_CALLBACK_MULTI_MOVE* are called at most once per rendered
+        frame (once per device for multi move), just before the canvas is
+        rendered, with the position of the last event received. If nothing
+        is rendered, they are called from an :py:class:`efl.ecore.Job`
+        once the pending main loop events are processed.
+        The ``prev_position`` of the merged mouse move event is the one
+        of the first event.
+
+        Changing the event flags of a merged event has no effect on the
+        propagation of the events, since they were already processed.
+
+        :param type: *EVAS_CALLBACK_MOUSE_MOVE* or
+            *EVAS_CALLBACK_MULTI_MOVE*
+        :param bool coalesce: whether to merge the events
+        :param bool history: if True the ``history`` attribute of the
+            merged events is a list of the ``(x, y, timestamp)`` canvas
+            positions of all the events received, otherwise it is None.
+
+        :raise ValueError: if **type** is not a move event.
+
+        .. versionadded:: 1.27
+
+        """
+        if <int>type != EVAS_CALLBACK_MOUSE_MOVE and \
+           <int>type != EVAS_CALLBACK_MULTI_MOVE:
+            raise ValueError("Only move events can be coalesced")
+
+        _object_event_coalesce_flush(self)
+        if coalesce:
+            if self._event_coalesce is None:
+                self._event_coalesce = {}
+            self._event_coalesce[<int>type] = _EventCoalescer(type, history)
+        elif self._event_coalesce is not None:
+            self._event_coalesce.pop(<int>type, None)
+            if not self._event_coalesce:
+                self._event_coalesce = None
+
+    def event_coalesce_get(self, Evas_Callback_Type type):
+        """Whether the events of the given type are merged.
+
+        :see: :py:func:`event_coalesce_set`
+
+        .. versionadded:: 1.27
+
+        """
+        return self._event_coalesce is not None and \
+            <int>type in self._event_coalesce
+
     def on_mouse_in_add(self, func, *a, **k):
         """Same as event_callback_add(EVAS_CALLBACK_MOUSE_IN, ...)
 
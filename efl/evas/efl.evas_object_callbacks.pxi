@@ -17,8 +17,11 @@
 
 
 cdef int cb_object_dispatcher(Object self, event, int type) except 0:
-    # iterate over copy since users may delete callback from callback
-    lst = tuple(self._event_callbacks[type])
+    # the callback lists are never changed in place, see
+    # _object_add_callback_to_list(), so no copy is needed here
+    lst = self._event_callbacks[type]
+    if lst is None:
+        return 1
     for func, args, kargs in lst:
         try:
             func(self, event, *args, **kargs)
@@ -28,8 +31,9 @@ cdef int cb_object_dispatcher(Object self, event, int type) except 0:
 
 
 cdef int cb_object_dispatcher2(Object self, int type) except 0:
-    # iterate over copy since users may delete callback from callback
-    lst = tuple(self._event_callbacks[type])
+    lst = self._event_callbacks[type]
+    if lst is None:
+        return 1
     for func, args, kargs in lst:
         try:
             func(self, *args, **kargs)
@@ -38,84 +42,314 @@ cdef int cb_object_dispatcher2(Object self, int type) except 0:
     return 1
 
 
+cdef inline object _event_pool_take(int type):
+    # The event objects are reused, one for each callback type. The pool
+    # slot is emptied while the event is dispatched, so that a nested event
+    # of the same type gets its own object.
+    event = _event_pool[type]
+    if event is not None:
+        _event_pool[type] = None
+    return event
+
+
+cdef inline void _event_pool_give(int type, object event):
+    # only the calling handler still holds the event, nobody kept it
+    if Py_REFCNT(<PyObject *>event) == 1:
+        _event_pool[type] = event
+
+
+cdef class _PendingMove:
+    """The merged move events of one device"""
+    cdef:
+        Evas_Event_Mouse_Move mouse
+        Evas_Event_Multi_Move multi
+        list history
+
+
+cdef class _EventCoalescer:
+    """Merges the move events an object receives between two renders"""
+    cdef:
+        int type
+        bint keep_history
+        dict pending
+
+    def __cinit__(self, int type, bint keep_history):
+        self.type = type
+        self.keep_history = keep_history
+        self.pending = {}
+
+    cdef int add(self, void *e_inf) except 0:
+        cdef:
+            Evas_Event_Mouse_Move *mouse = NULL
+            Evas_Event_Multi_Move *multi = NULL
+            Evas_Position prev
+            _PendingMove p
+            int device = 0
+
+        if self.type == enums.EVAS_CALLBACK_MOUSE_MOVE:
+            mouse = <Evas_Event_Mouse_Move *>e_inf
+        else:
+            multi = <Evas_Event_Multi_Move *>e_inf
+            device = multi.device
+
+        p = self.pending.get(device)
+        if p is None:
+            p = _PendingMove()
+            if self.keep_history:
+                p.history = []
+            self.pending[device] = p
+            if mouse != NULL:
+                p.mouse = mouse[0]
+            else:
+                p.multi = multi[0]
+        elif mouse != NULL:
+            # keep the position the pointer had before the first event
+            prev = p.mouse.prev
+            p.mouse = mouse[0]
+            p.mouse.prev = prev
+        else:
+            p.multi = multi[0]
+
+        # the device and the event data may be gone when the event is
+        # delivered, they are not exposed anyway
+        if mouse != NULL:
+            p.mouse.dev = NULL
+            p.mouse.data = NULL
+        else:
+            p.multi.dev = NULL
+            p.multi.data = NULL
+
+        if p.history is not None:
+            if mouse != NULL:
+                p.history.append((mouse.cur.canvas.x, mouse.cur.canvas.y,
+                                  mouse.timestamp))
+            else:
+                p.history.append((multi.cur.canvas.x, multi.cur.canvas.y,
+                                  multi.timestamp))
+        return 1
+
+    cdef int flush(self, Object obj) except 0:
+        cdef:
+            _PendingMove p
+            EventMouseMove mouse_event
+            EventMultiMove multi_event
+
+        pending = self.pending
+        self.pending = {}
+        for p in pending.values():
+            if obj._event_callbacks[self.type] is None:
+                break
+            if self.type == enums.EVAS_CALLBACK_MOUSE_MOVE:
+                mouse_event = EventMouseMove()
+                mouse_event._set_obj(&p.mouse)
+                mouse_event.history = p.history
+                cb_object_dispatcher(obj, mouse_event, self.type)
+                mouse_event._unset_obj()
+            else:
+                multi_event = EventMultiMove()
+                multi_event._set_obj(&p.multi)
+                multi_event.history = p.history
+                cb_object_dispatcher(obj, multi_event, self.type)
+                multi_event._unset_obj()
+        return 1
+
+
+# the objects with merged events pending, and the ecore job delivering
+# them when nothing gets rendered
+cdef set _coalesce_objects = set()
+cdef object _coalesce_job = None
+
+
+def _object_event_coalesce_job():
+    global _coalesce_job
+    cdef Object obj
+    _coalesce_job = None
+    for obj in tuple(_coalesce_objects):
+        try:
+            _object_event_coalesce_flush(obj)
+        except Exception:
+            traceback.print_exc()
+
+
+cdef int _object_event_coalesce_job_add() except 0:
+    global _coalesce_job
+    if _coalesce_job is not None:
+        return 1
+    try:
+        from efl import ecore
+    except ImportError:
+        # without ecore the events are only delivered by the renders
+        return 1
+    _coalesce_job = ecore.Job(_object_event_coalesce_job)
+    return 1
+
+
+cdef bint _object_event_coalesce_pending(Object obj):
+    cdef _EventCoalescer c
+    if obj._event_coalesce is None:
+        return 0
+    for c in obj._event_coalesce.values():
+        if c.pending:
+            return 1
+    return 0
+
+
+cdef bint _object_event_coalesce(Object obj, Evas *e, int type,
+                                 void *e_inf) except -1:
+    """
+
+    Queue a move event to be delivered before the next render, or from
+    an ecore job if nothing is rendered before, return False if the
+    object does not coalesce events of this type.
+
+    """
+    cdef _EventCoalescer c = obj._event_coalesce.get(type)
+    if c is None:
+        return 0
+
+    if not _object_event_coalesce_pending(obj):
+        evas_event_callback_add(e, enums.EVAS_CALLBACK_RENDER_PRE,
+                                cb_object_coalesced_flush, <void *>obj)
+        _coalesce_objects.add(obj)
+        _object_event_coalesce_job_add()
+    c.add(e_inf)
+    return 1
+
+
+cdef int _object_event_coalesce_flush(Object obj) except 0:
+    cdef _EventCoalescer c
+    if not _object_event_coalesce_pending(obj):
+        return 1
+    _coalesce_objects.discard(obj)
+    evas_event_callback_del_full(evas_object_evas_get(obj.obj),
+                                 enums.EVAS_CALLBACK_RENDER_PRE,
+                                 cb_object_coalesced_flush, <void *>obj)
+    for c in tuple(obj._event_coalesce.values()):
+        c.flush(obj)
+    return 1
+
+
+cdef void cb_object_coalesced_flush(void *data, Evas *e,
+                                    void *e_inf) with gil:
+    try:
+        _object_event_coalesce_flush(<Object>data)
+    except Exception:
+        traceback.print_exc()
+
+
 cdef void cb_object_mouse_in(void *data, Evas *e,
                              Evas_Object *obj, void *e_inf) with gil:
     cdef EventMouseIn event
-    event = EventMouseIn()
+    event = _event_pool_take(enums.EVAS_CALLBACK_MOUSE_IN)
+    if event is None:
+        event = EventMouseIn()
     event._set_obj(e_inf)
     cb_object_dispatcher(<Object>data, event, enums.EVAS_CALLBACK_MOUSE_IN)
     event._unset_obj()
+    _event_pool_give(enums.EVAS_CALLBACK_MOUSE_IN, event)
 
 
 cdef void cb_object_mouse_out(void *data, Evas *e,
                               Evas_Object *obj, void *e_inf) with gil:
     cdef EventMouseOut event
-    event = EventMouseOut()
+    event = _event_pool_take(enums.EVAS_CALLBACK_MOUSE_OUT)
+    if event is None:
+        event = EventMouseOut()
     event._set_obj(e_inf)
     cb_object_dispatcher(<Object>data, event, enums.EVAS_CALLBACK_MOUSE_OUT)
     event._unset_obj()
+    _event_pool_give(enums.EVAS_CALLBACK_MOUSE_OUT, event)
 
 
 cdef void cb_object_mouse_down(void *data, Evas *e,
                                Evas_Object *obj, void *e_inf) with gil:
     cdef EventMouseDown event
-    event = EventMouseDown()
+    event = _event_pool_take(enums.EVAS_CALLBACK_MOUSE_DOWN)
+    if event is None:
+        event = EventMouseDown()
     event._set_obj(e_inf)
     cb_object_dispatcher(<Object>data, event, enums.EVAS_CALLBACK_MOUSE_DOWN)
     event._unset_obj()
+    _event_pool_give(enums.EVAS_CALLBACK_MOUSE_DOWN, event)
 
 
 cdef void cb_object_mouse_up(void *data, Evas *e,
                              Evas_Object *obj, void *e_inf) with gil:
     cdef EventMouseUp event
-    event = EventMouseUp()
+    event = _event_pool_take(enums.EVAS_CALLBACK_MOUSE_UP)
+    if event is None:
+        event = EventMouseUp()
     event._set_obj(e_inf)
     cb_object_dispatcher(<Object>data, event, enums.EVAS_CALLBACK_MOUSE_UP)
     event._unset_obj()
+    _event_pool_give(enums.EVAS_CALLBACK_MOUSE_UP, event)
 
 
 cdef void cb_object_mouse_move(void *data, Evas *e,
                                Evas_Object *obj, void *e_inf) with gil:
+    cdef Object self = <Object>data
     cdef EventMouseMove event
-    event = EventMouseMove()
+    if self._event_coalesce is not None and \
+       _object_event_coalesce(self, e, enums.EVAS_CALLBACK_MOUSE_MOVE, e_inf):
+        return
+    event = _event_pool_take(enums.EVAS_CALLBACK_MOUSE_MOVE)
+    if event is None:
+        event = EventMouseMove()
     event._set_obj(e_inf)
-    cb_object_dispatcher(<Object>data, event, enums.EVAS_CALLBACK_MOUSE_MOVE)
+    cb_object_dispatcher(self, event, enums.EVAS_CALLBACK_MOUSE_MOVE)
     event._unset_obj()
+    _event_pool_give(enums.EVAS_CALLBACK_MOUSE_MOVE, event)
 
 
 cdef void cb_object_multi_down(void *data, Evas *e,
                                Evas_Object *obj, void *e_inf) with gil:
     cdef EventMultiDown event
-    event = EventMultiDown()
+    event = _event_pool_take(enums.EVAS_CALLBACK_MULTI_DOWN)
+    if event is None:
+        event = EventMultiDown()
     event._set_obj(e_inf)
     cb_object_dispatcher(<Object>data, event, enums.EVAS_CALLBACK_MULTI_DOWN)
     event._unset_obj()
+    _event_pool_give(enums.EVAS_CALLBACK_MULTI_DOWN, event)
 
 cdef void cb_object_multi_up(void *data, Evas *e,
                              Evas_Object *obj, void *e_inf) with gil:
     cdef EventMultiUp event
-    event = EventMultiUp()
+    event = _event_pool_take(enums.EVAS_CALLBACK_MULTI_UP)
+    if event is None:
+        event = EventMultiUp()
     event._set_obj(e_inf)
     cb_object_dispatcher(<Object>data, event, enums.EVAS_CALLBACK_MULTI_UP)
     event._unset_obj()
+    _event_pool_give(enums.EVAS_CALLBACK_MULTI_UP, event)
 
 
 cdef void cb_object_multi_move(void *data, Evas *e,
                                Evas_Object *obj, void *e_inf) with gil:
+    cdef Object self = <Object>data
     cdef EventMultiMove event
-    event = EventMultiMove()
+    if self._event_coalesce is not None and \
+       _object_event_coalesce(self, e, enums.EVAS_CALLBACK_MULTI_MOVE, e_inf):
+        return
+    event = _event_pool_take(enums.EVAS_CALLBACK_MULTI_MOVE)
+    if event is None:
+        event = EventMultiMove()
     event._set_obj(e_inf)
-    cb_object_dispatcher(<Object>data, event, enums.EVAS_CALLBACK_MULTI_MOVE)
+    cb_object_dispatcher(self, event, enums.EVAS_CALLBACK_MULTI_MOVE)
     event._unset_obj()
+    _event_pool_give(enums.EVAS_CALLBACK_MULTI_MOVE, event)
 
 
 cdef void cb_object_mouse_wheel(void *data, Evas *e,
                                 Evas_Object *obj, void *e_inf) with gil:
     cdef EventMouseWheel event
-    event = EventMouseWheel()
+    event = _event_pool_take(enums.EVAS_CALLBACK_MOUSE_WHEEL)
+    if event is None:
+        event = EventMouseWheel()
     event._set_obj(e_inf)
     cb_object_dispatcher(<Object>data, event, enums.EVAS_CALLBACK_MOUSE_WHEEL)
     event._unset_obj()
+    _event_pool_give(enums.EVAS_CALLBACK_MOUSE_WHEEL, event)
 
 
 cdef void cb_object_free(void *data, Evas *e,
@@ -126,19 +360,25 @@ cdef void cb_object_free(void *data, Evas *e,
 cdef void cb_object_key_down(void *data, Evas *e,
                              Evas_Object *obj, void *e_inf) with gil:
     cdef EventKeyDown event
-    event = EventKeyDown()
+    event = _event_pool_take(enums.EVAS_CALLBACK_KEY_DOWN)
+    if event is None:
+        event = EventKeyDown()
     event._set_obj(e_inf)
     cb_object_dispatcher(<Object>data, event, enums.EVAS_CALLBACK_KEY_DOWN)
     event._unset_obj()
+    _event_pool_give(enums.EVAS_CALLBACK_KEY_DOWN, event)
 
 
 cdef void cb_object_key_up(void *data, Evas *e,
                            Evas_Object *obj, void *e_inf) with gil:
     cdef EventKeyUp event
-    event = EventKeyUp()
+    event = _event_pool_take(enums.EVAS_CALLBACK_KEY_UP)
+    if event is None:
+        event = EventKeyUp()
     event._set_obj(e_inf)
     cb_object_dispatcher(<Object>data, event, enums.EVAS_CALLBACK_KEY_UP)
     event._unset_obj()
+    _event_pool_give(enums.EVAS_CALLBACK_KEY_UP, event)
 
 
 cdef void cb_object_focus_in(void *data, Evas *e,
@@ -184,10 +424,13 @@ cdef void cb_object_del(void *data, Evas *e,
 cdef void cb_object_hold(void *data, Evas *e,
                          Evas_Object *obj, void *e_inf) with gil:
     cdef EventHold event
-    event = EventHold()
+    event = _event_pool_take(enums.EVAS_CALLBACK_HOLD)
+    if event is None:
+        event = EventHold()
     event._set_obj(e_inf)
     cb_object_dispatcher(<Object>data, event, enums.EVAS_CALLBACK_HOLD)
     event._unset_obj()
+    _event_pool_give(enums.EVAS_CALLBACK_HOLD, event)
 
 
 cdef void cb_object_changed_size_hints(void *data, Evas *e,
@@ -258,6 +501,8 @@ cdef void cb_object_viewport_resize(void *data, Evas *e,
 cdef int evas_object_event_callbacks_len
 cdef Evas_Object_Event_Cb evas_object_event_callbacks[36]
 evas_object_event_callbacks_len = 36
+
+cdef list _event_pool = [None] * evas_object_event_callbacks_len
 evas_object_event_callbacks[<int>enums.EVAS_CALLBACK_MOUSE_IN] = cb_object_mouse_in
 evas_object_event_callbacks[<int>enums.EVAS_CALLBACK_MOUSE_OUT] = cb_object_mouse_out
 evas_object_event_callbacks[<int>enums.EVAS_CALLBACK_MOUSE_DOWN] = cb_object_mouse_down
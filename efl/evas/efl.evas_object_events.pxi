@@ -17,7 +17,18 @@
 
 from cpython cimport PyUnicode_AsUTF8String
 
-from efl.utils.conversions cimport _ctouni
+from cpython.ref cimport PyObject
+from efl.utils.conversions cimport _ctouni, _ctouni_cached
+
+cdef extern from "Python.h":
+    Py_ssize_t Py_REFCNT(PyObject *o)
+
+
+cdef inline bint _event_part_reusable(PyObject *part):
+    # Event objects and their parts are reused by the next event of the
+    # same type, unless someone kept a reference to them.
+    return part != <PyObject *>None and Py_REFCNT(part) == 1
+
 
 cdef class EventPoint:
     cdef void _set_obj(self, Evas_Point *obj):
@@ -174,9 +185,11 @@ cdef class EventPrecisionPoint:
 
 cdef class EventPosition:
     cdef void _set_objs(self, Evas_Point *output, Evas_Coord_Point *canvas):
-        self.output = EventPoint()
+        if not _event_part_reusable(<PyObject *>self.output):
+            self.output = EventPoint()
         self.output._set_obj(output)
-        self.canvas = EventCoordPoint()
+        if not _event_part_reusable(<PyObject *>self.canvas):
+            self.canvas = EventCoordPoint()
         self.canvas._set_obj(canvas)
 
     cdef void _unset_objs(self):
@@ -191,9 +204,11 @@ cdef class EventPosition:
 
 cdef class EventPrecisionPosition:
     cdef void _set_objs(self, Evas_Point *output, Evas_Coord_Precision_Point *canvas):
-        self.output = EventPoint()
+        if not _event_part_reusable(<PyObject *>self.output):
+            self.output = EventPoint()
         self.output._set_obj(output)
-        self.canvas = EventPrecisionPoint()
+        if not _event_part_reusable(<PyObject *>self.canvas):
+            self.canvas = EventPrecisionPoint()
         self.canvas._set_obj(canvas)
 
     cdef void _unset_objs(self):
@@ -210,7 +225,8 @@ cdef class EventPrecisionPosition:
 cdef class EventMouseIn:
     cdef void _set_obj(self, void *ptr):
         self.obj = <Evas_Event_Mouse_In*>ptr
-        self.position = EventPosition()
+        if not _event_part_reusable(<PyObject *>self.position):
+            self.position = EventPosition()
         self.position._set_objs(&self.obj.output, &self.obj.canvas)
 
     cdef void _unset_obj(self):
@@ -257,7 +273,8 @@ cdef class EventMouseIn:
 cdef class EventMouseOut:
     cdef void _set_obj(self, void *ptr):
         self.obj = <Evas_Event_Mouse_Out*>ptr
-        self.position = EventPosition()
+        if not _event_part_reusable(<PyObject *>self.position):
+            self.position = EventPosition()
         self.position._set_objs(&self.obj.output, &self.obj.canvas)
 
     cdef void _unset_obj(self):
@@ -304,7 +321,8 @@ cdef class EventMouseOut:
 cdef class EventMouseDown:
     cdef void _set_obj(self, void *ptr):
         self.obj = <Evas_Event_Mouse_Down*>ptr
-        self.position = EventPosition()
+        if not _event_part_reusable(<PyObject *>self.position):
+            self.position = EventPosition()
         self.position._set_objs(&self.obj.output, &self.obj.canvas)
 
     cdef void _unset_obj(self):
@@ -360,7 +378,8 @@ cdef class EventMouseDown:
 cdef class EventMouseUp:
     cdef void _set_obj(self, void *ptr):
         self.obj = <Evas_Event_Mouse_Up*>ptr
-        self.position = EventPosition()
+        if not _event_part_reusable(<PyObject *>self.position):
+            self.position = EventPosition()
         self.position._set_objs(&self.obj.output, &self.obj.canvas)
 
     cdef void _unset_obj(self):
@@ -416,9 +435,11 @@ cdef class EventMouseUp:
 cdef class EventMouseMove:
     cdef void _set_obj(self, void *ptr):
         self.obj = <Evas_Event_Mouse_Move*>ptr
-        self.position = EventPosition()
+        if not _event_part_reusable(<PyObject *>self.position):
+            self.position = EventPosition()
         self.position._set_objs(&self.obj.cur.output, &self.obj.cur.canvas)
-        self.prev_position = EventPosition()
+        if not _event_part_reusable(<PyObject *>self.prev_position):
+            self.prev_position = EventPosition()
         self.prev_position._set_objs(&self.obj.prev.output,
                                      &self.obj.prev.canvas)
 
@@ -470,7 +491,8 @@ cdef class EventMouseMove:
 cdef class EventMultiDown:
     cdef void _set_obj(self, void *ptr):
         self.obj = <Evas_Event_Multi_Down*>ptr
-        self.position = EventPrecisionPosition()
+        if not _event_part_reusable(<PyObject *>self.position):
+            self.position = EventPrecisionPosition()
         self.position._set_objs(&self.obj.output, &self.obj.canvas)
 
     cdef void _unset_obj(self):
@@ -554,7 +576,8 @@ cdef class EventMultiDown:
 cdef class EventMultiUp:
     cdef void _set_obj(self, void *ptr):
         self.obj = <Evas_Event_Multi_Up*>ptr
-        self.position = EventPrecisionPosition()
+        if not _event_part_reusable(<PyObject *>self.position):
+            self.position = EventPrecisionPosition()
         self.position._set_objs(&self.obj.output, &self.obj.canvas)
 
     cdef void _unset_obj(self):
@@ -639,7 +662,8 @@ cdef class EventMultiUp:
 cdef class EventMultiMove:
     cdef void _set_obj(self, void *ptr):
         self.obj = <Evas_Event_Multi_Move*>ptr
-        self.position = EventPrecisionPosition()
+        if not _event_part_reusable(<PyObject *>self.position):
+            self.position = EventPrecisionPosition()
         self.position._set_objs(&self.obj.cur.output, &self.obj.cur.canvas)
 
     cdef void _unset_obj(self):
@@ -710,7 +734,8 @@ cdef class EventMultiMove:
 cdef class EventMouseWheel:
     cdef void _set_obj(self, void *ptr):
         self.obj = <Evas_Event_Mouse_Wheel*>ptr
-        self.position = EventPosition()
+        if not _event_part_reusable(<PyObject *>self.position):
+            self.position = EventPosition()
         self.position._set_objs(&self.obj.output, &self.obj.canvas)
 
     cdef void _unset_obj(self):
@@ -781,12 +806,12 @@ cdef class EventKeyDown:
     property keyname:
         def __get__(self):
             self._check_validity()
-            return _ctouni(self.obj.keyname)
+            return _ctouni_cached(self.obj.keyname)
 
     property key:
         def __get__(self):
             self._check_validity()
-            return _ctouni(self.obj.key)
+            return _ctouni_cached(self.obj.key)
 
     property string:
         def __get__(self):
@@ -840,12 +865,12 @@ cdef class EventKeyUp:
     property keyname:
         def __get__(self):
             self._check_validity()
-            return _ctouni(self.obj.keyname)
+            return _ctouni_cached(self.obj.keyname)
 
     property key:
         def __get__(self):
             self._check_validity()
-            return _ctouni(self.obj.key)
+            return _ctouni_cached(self.obj.key)
 
     property string:
         def __get__(self):
@@ -15,32 +15,170 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with this Python-EFL.  If not, see <http://www.gnu.org/licenses/>.
 
-from cpython cimport PyObject
-
-cdef extern from "Python.h":
-    PyObject * PyMemoryView_FromBuffer(Py_buffer *info)
+from cpython cimport PyMem_Malloc, PyMem_Free
 
 from cpython.buffer cimport Py_buffer, PyObject_CheckBuffer, \
-    PyObject_GetBuffer, PyBuffer_Release, PyBUF_SIMPLE
+    PyObject_GetBuffer, PyBuffer_Release, PyBUF_SIMPLE, PyBUF_WRITABLE, \
+    PyBUF_FORMAT, PyBUF_ND, PyBUF_STRIDES
 
 
 cdef int _data_size_get(Evas_Object *obj):
-    cdef int stride, h, bpp, cspace, have_alpha
+    cdef int stride, h, cspace, have_alpha
     stride = evas_object_image_stride_get(obj)
     evas_object_image_size_get(obj, NULL, &h)
     cspace = evas_object_image_colorspace_get(obj)
     have_alpha = evas_object_image_alpha_get(obj)
     if cspace == EVAS_COLORSPACE_ARGB8888:
-        bpp = 4
+        return stride * h
     elif cspace == EVAS_COLORSPACE_RGB565_A5P:
         if have_alpha == 0:
-            bpp = 2
+            return stride * h
         else:
-            bpp = 3
+            # the alpha plane (1 byte per pixel) follows the color plane
+            return stride * h + (stride / 2) * h
     else:
         return 0 # XXX not supported.
 
-    return stride * h * bpp
+
+cdef struct _ImageBufferInfo:
+    Py_ssize_t shape[2]
+    Py_ssize_t strides[2]
+    int w, h
+    bint writable
+
+
+cdef int _image_buffer_get(Evas_Object *obj, Py_buffer *view, int flags,
+                           bint writable, bint simple) except -1:
+    """Fill ``view`` with the pixels of the image ``obj``.
+
+    The pixels are not copied, ``view.buf`` points straight into the image
+    data. Every successful call must be paired with
+    :func:`_image_buffer_release`.
+
+    """
+    cdef:
+        int w, h, stride, cspace, bpp
+        void *data
+        _ImageBufferInfo *info
+
+    if flags & PyBUF_WRITABLE and not writable:
+        raise BufferError("image data buffer is read-only")
+
+    evas_object_image_size_get(obj, &w, &h)
+    stride = evas_object_image_stride_get(obj)
+    cspace = evas_object_image_colorspace_get(obj)
+
+    if cspace == EVAS_COLORSPACE_ARGB8888:
+        bpp = 4
+        view.format = "I"
+    elif cspace == EVAS_COLORSPACE_RGB565_A5P and \
+         not evas_object_image_alpha_get(obj):
+        bpp = 2
+        view.format = "H"
+    elif cspace == EVAS_COLORSPACE_RGB565_A5P and simple:
+        # color and alpha planes have different pixel sizes, export bytes
+        bpp = 1
+        view.format = "B"
+    else:
+        raise BufferError("unsupported colorspace for a %s buffer" %
+                          ("1D" if simple else "2D"))
+
+    if not simple and flags & PyBUF_STRIDES != PyBUF_STRIDES and \
+       stride != w * bpp:
+        raise BufferError("image rows are padded, strides are required")
+
+    info = <_ImageBufferInfo *>PyMem_Malloc(sizeof(_ImageBufferInfo))
+    if info == NULL:
+        raise MemoryError
+
+    data = evas_object_image_data_get(obj, writable)
+    if data == NULL:
+        PyMem_Free(info)
+        raise BufferError("image has no allocated buffer.")
+
+    info.w = w
+    info.h = h
+    info.writable = writable
+
+    view.buf = data
+    view.len = _data_size_get(obj)
+    view.readonly = not writable
+    view.itemsize = bpp
+    view.suboffsets = NULL
+    view.internal = info
+
+    if simple:
+        view.ndim = 1
+        info.shape[0] = view.len / bpp
+        info.strides[0] = bpp
+    else:
+        view.ndim = 2
+        view.len = w * h * bpp
+        info.shape[0] = h
+        info.shape[1] = w
+        info.strides[0] = stride
+        info.strides[1] = bpp
+
+    view.shape = info.shape if flags & PyBUF_ND == PyBUF_ND else NULL
+    view.strides = \
+        info.strides if flags & PyBUF_STRIDES == PyBUF_STRIDES else NULL
+    if not flags & PyBUF_FORMAT:
+        view.format = NULL
+
+    return 1
+
+
+cdef void _image_buffer_release(Evas_Object *obj, Py_buffer *view):
+    """Give the pixels back to evas, marking them dirty if writable."""
+    cdef _ImageBufferInfo *info = <_ImageBufferInfo *>view.internal
+
+    if obj != NULL:
+        evas_object_image_data_set(obj, view.buf)
+        if info != NULL and info.writable:
+            evas_object_image_data_update_add(obj, 0, 0, info.w, info.h)
+
+    PyMem_Free(info)
+    view.internal = NULL
+
+
+cdef class ImageDataBuffer(object):
+    """
+
+    Buffer exporter for the raw pixels of an :py:class:`Image`.
+
+    Objects of this class are returned by
+    :py:meth:`Image.image_data_memoryview_get` and are usually wrapped in a
+    :class:`memoryview` or passed directly to libraries that understand the
+    buffer protocol (ie: ``numpy.asarray()``). The exported memory is the
+    image data itself, nothing is copied.
+
+    While a view is exported the image data is referenced, when it is
+    released the data is given back to evas and, if it was writable, the
+    whole image is marked to be redrawn at the next render.
+
+    .. versionadded:: 1.27
+
+    """
+    cdef:
+        readonly Image image
+        readonly bint writable
+        readonly bint simple
+
+    def __cinit__(self, Image image not None, bint writable=False,
+                  bint simple=True):
+        self.image = image
+        self.writable = writable
+        self.simple = simple
+
+    def __getbuffer__(self, Py_buffer *view, int flags):
+        if self.image.obj == NULL:
+            raise BufferError("image has been deleted")
+        _image_buffer_get(self.image.obj, view, flags,
+                          self.writable, self.simple)
+        view.obj = self
+
+    def __releasebuffer__(self, Py_buffer *view):
+        _image_buffer_release(self.image.obj, view)
 
 
 cdef class Image(Object):
@@ -85,6 +223,9 @@ cdef class Image(Object):
     of :py:attr:`stride`, with the following considerations about
     colorspace:
 
+    .. seealso:: :py:meth:`image_data_memoryview_get` for writable and 2D
+        (stride aware) access to the pixels without copies.
+
     - **EVAS_COLORSPACE_ARGB8888:** This pixel format is a linear block of
         pixels, starting at the top-left row by row until the bottom right of
         the image or pixel region. All pixels are 32-bit unsigned int's with
@@ -424,7 +565,7 @@ cdef class Image(Object):
         evas_object_image_size_set(self.obj, w, h)
 
     property stride:
-        """Get the row stride (in pixels) being used to draw this image.
+        """Get the row stride (in bytes) being used to draw this image.
 
         While image have logical dimension of width and height set by
         :py:attr:`image_size`, the line can be a bit larger than width to
@@ -437,7 +578,7 @@ cdef class Image(Object):
         alpha plane with data using stride in multiple of 1 byte.
 
         .. note:: This value can change after setting :py:attr:`image_size`.
-        .. note:: Unit is pixels, not bytes.
+        .. note:: Unit is bytes, not pixels.
 
         :type: int
 
@@ -486,10 +627,11 @@ cdef class Image(Object):
         PyObject_GetBuffer(buf, &view, PyBUF_SIMPLE)
 
         expected_size = _data_size_get(self.obj)
-        if view.itemsize < expected_size:
+        if view.len < expected_size:
+            PyBuffer_Release(&view)
             raise ValueError(
                 "buffer size (%d) is smaller than expected (%d)!" % (
-                    view.itemsize, expected_size
+                    view.len, expected_size
                     )
                 )
 
@@ -497,100 +639,40 @@ cdef class Image(Object):
 
         PyBuffer_Release(&view)
 
-    # def image_data_memoryview_get(self, bint for_writing=False, bint simple=True):
-    #     """image_data_memoryview_get(bool for_writing) -> MemoryView
-
-    #     Get a MemoryView object to the raw image data of the given image object.
+    def image_data_memoryview_get(self, bint for_writing=False, bint simple=True):
+        """Get a MemoryView object to the raw image data of the image.
 
-    #     :param bool for_writing: Whether the data being retrieved will be
-    #             modified or not.
-    #     :param bool simple: Whether the MemoryView is 1D or 2D
-    #     :return MemoryView: The raw image data.
+        :param bool for_writing: Whether the data being retrieved will be
+                modified or not.
+        :param bool simple: Whether the MemoryView is 1D or 2D
+        :return MemoryView: The raw image data.
 
-    #     This method returns a MemoryView object to an image object's internal pixel
-    #     buffer, for reading only or read/write. If you request it for
-    #     writing, the image will be marked dirty so that it gets redrawn at
-    #     the next update.
+        This method returns a MemoryView object to the image internal pixel
+        buffer, for reading only or read/write. No data is copied, writing to
+        the MemoryView (or to a NumPy array built on top of it) changes the
+        image pixels in place.
 
-    #     Each time you call this method on an image object, its data
-    #     buffer will have an internal reference counter
-    #     incremented. Decrement it back by using
-    #     :py:func:`image_data_set`.
+        A 1D view covers the whole buffer, including row padding (see
+        :py:attr:`stride`). A 2D view has shape ``(h, w)`` and uses the image
+        stride to skip the padding, it is only available for the
+        ``EVAS_COLORSPACE_ARGB8888`` and ``EVAS_COLORSPACE_RGB565_A5P``
+        (without alpha) colorspaces.
 
-    #     This is best suited for when you want to modify an existing image,
-    #     without changing its dimensions.
+        The image data is referenced until the MemoryView is released,
+        either explicitly with :meth:`memoryview.release` (or a ``with``
+        block) or when it is garbage collected. On release a view obtained
+        for writing marks the whole image dirty, so that it gets redrawn at
+        the next render, there is no need to call
+        :py:func:`image_data_update_add` or :py:func:`image_data_set`.
 
-    #     .. note::
-    #         The contents' format returned by it depend on the color
-    #         space of the given image object.
-
-    #     .. note::
-    #         You may want to use :py:func:`image_data_update_add` to
-    #         inform data changes, if you did any.
+        .. note::
+            The contents' format returned by it depend on the color
+            space of the given image object.
 
-    #     """
-    #     cdef int stride, h, bpp, cspace, have_alpha, img_size
-
-    #     stride = evas_object_image_stride_get(self.obj)
-    #     evas_object_image_size_get(self.obj, NULL, &h)
-    #     cspace = evas_object_image_colorspace_get(self.obj)
-    #     have_alpha = evas_object_image_alpha_get(self.obj)
-
-    #     bpp = 0
-    #     if cspace == EVAS_COLORSPACE_ARGB8888:
-    #         bpp = 4
-    #         format = "L"
-    #     elif cspace == EVAS_COLORSPACE_RGB565_A5P:
-    #         if have_alpha == 0:
-    #             bpp = 2
-    #             format = "H"
-    #         else:
-    #             pass #bpp = 3
-    #             # XXX: There's no type that has three bytes.
-    #             #      Is the format string actually used?
-    #     if bpp == 0:
-    #         raise ValueError("Unsupported colorspace")
-
-    #     img_size = stride * h * bpp
-
-    #     cdef Py_buffer *img_buf = <Py_buffer *>PyMem_Malloc(sizeof(Py_buffer))
-    #     if img_buf == NULL:
-    #         raise MemoryError
-
-    #     cdef:
-    #         Py_ssize_t simple_shape[1]
-    #         Py_ssize_t shape[2]
-    #         Py_ssize_t strides[2]
-    #         Py_ssize_t suboffsets[2]
-
-    #     if simple:
-    #         simple_shape[0] = img_size
-    #     else:
-    #         shape[0] = stride / bpp
-    #         shape[1] = h
-    #         strides[0] = stride
-    #         strides[1] = h * bpp
-    #         suboffsets[0] = -1
-    #         suboffsets[1] = -1
-
-    #     img_buf.buf = evas_object_image_data_get(self.obj, for_writing)
-    #     img_buf.len = img_size
-    #     img_buf.readonly = not for_writing
-    #     img_buf.format = format
-    #     if simple:
-    #         img_buf.ndim = 1
-    #         img_buf.shape = simple_shape
-    #         img_buf.strides = NULL
-    #         img_buf.suboffsets = NULL
-    #     else:
-    #         img_buf.ndim = 2
-    #         img_buf.shape = shape
-    #         img_buf.strides = strides
-    #         img_buf.suboffsets = suboffsets
-    #     img_buf.itemsize = bpp
-
-    #     return <object>PyMemoryView_FromBuffer(img_buf)
+        .. versionadded:: 1.27
 
+        """
+        return memoryview(ImageDataBuffer(self, for_writing, simple))
 
     # TODO:
     # def image_data_convert(self, to_cspace):
@@ -1339,19 +1421,12 @@ cdef class Image(Object):
 
 
     def __getbuffer__(self, Py_buffer *view, int flags):
-        view.buf = evas_object_image_data_get(self.obj, not view.readonly)
-        if view.buf == NULL:
-            raise SystemError("image has no allocated buffer.")
-        view.len = _data_size_get(self.obj)
-        view.format = "L"
-        view.ndim = 1
-        view.itemsize = 4
-        # TODO: Check flags, provide multidim if possible, handle other
-        #       colorspaces
+        _image_buffer_get(self.obj, view, flags,
+                          flags & PyBUF_WRITABLE == PyBUF_WRITABLE, True)
+        view.obj = self
 
     def __releasebuffer__(self, Py_buffer *view):
-        evas_object_image_data_set(self.obj, view.buf)
-        # TODO: Free possibly allocated memory here (shape, strides, suboffsets)
+        _image_buffer_release(self.obj, view)
 
 
     def on_image_preloaded_add(self, func, *a, **k):
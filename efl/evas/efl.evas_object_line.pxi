@@ -16,6 +16,9 @@
 # along with this Python-EFL.  If not, see <http://www.gnu.org/licenses/>.
 
 
+from cpython cimport array
+
+
 cdef class Line(Object):
     """
 
@@ -166,4 +169,69 @@ cdef class Line(Object):
         return (x2, y2)
 
 
+    @staticmethod
+    def strip_add(Canvas canvas not None, points, **kwargs):
+        """Create the lines of a strip joining consecutive points.
+
+        :param canvas: Evas canvas for the lines
+        :type canvas: :py:class:`~efl.evas.Canvas`
+        :param points: The points of the strip, any type accepted by
+            :py:meth:`strip_set`
+        :keyword \**kwargs: All the remaining keyword arguments are interpreted
+                            as properties of every line
+        :return: One line per segment, that is one less than the points.
+        :rtype: list of :py:class:`Line`
+
+        .. versionadded:: 1.27
+
+        """
+        cdef:
+            array.array arr = _coords_array_get(points, 2, "points")
+            Py_ssize_t i, n = len(arr) // 2 - 1
+            list lines
+
+        if n < 1:
+            return []
+        lines = [Line(canvas, **kwargs) for i in range(n)]
+        _line_strip_set(lines, arr)
+        return lines
+
+    @staticmethod
+    def strip_set(lines, points):
+        """Move the lines of a strip to join consecutive points.
+
+        :param lines: The lines, as returned by :py:meth:`strip_add`
+        :type lines: list of :py:class:`Line`
+        :param points: The points of the strip, one more than the lines, an
+            object supporting the buffer protocol with integers, flat
+            (x0, y0, x1, y1...) or with one row per point, like
+            :class:`array.array` or an (N, 2) NumPy array, or a sequence of
+            (x, y) tuples or of integers.
+
+        Line ``i`` goes from point ``i`` to point ``i + 1``. Evas lines are
+        single segments, this updates the whole strip in one call, without
+        creating any Python object for the coordinates.
+
+        .. versionadded:: 1.27
+
+        """
+        _line_strip_set(list(lines), _coords_array_get(points, 2, "points"))
+
+
+cdef int _line_strip_set(list lines, array.array arr) except -1:
+    cdef:
+        int *p = arr.data.as_ints
+        Py_ssize_t i, n = len(lines)
+        Line line
+
+    if len(arr) // 2 != n + 1:
+        raise ValueError("%d points needed for %d lines, not %d" %
+                         (n + 1, n, len(arr) // 2))
+    for i in range(n):
+        line = <Line?>lines[i]
+        evas_object_line_xy_set(line.obj, p[2 * i], p[2 * i + 1],
+                                p[2 * i + 2], p[2 * i + 3])
+    return 0
+
+
 _object_mapping_register("Evas.Line", Line)
@@ -16,6 +16,80 @@
 # along with this Python-EFL.  If not, see <http://www.gnu.org/licenses/>.
 
 
+from cpython.buffer cimport Py_buffer, PyObject_CheckBuffer, \
+    PyObject_GetBuffer, PyBuffer_Release, PyBUF_FORMAT, PyBUF_C_CONTIGUOUS
+from cpython cimport array
+from libc.string cimport memcpy
+from efl.utils.conversions cimport buffer_format_code
+import array
+
+
+cdef inline long long _coords_buffer_item_get(Py_buffer *view, Py_ssize_t i,
+                                              bint signed):
+    if view.itemsize == 1:
+        if signed:
+            return (<signed char *>view.buf)[i]
+        return (<unsigned char *>view.buf)[i]
+    elif view.itemsize == 2:
+        if signed:
+            return (<short *>view.buf)[i]
+        return (<unsigned short *>view.buf)[i]
+    elif view.itemsize == 4:
+        if signed:
+            return (<int *>view.buf)[i]
+        return (<unsigned int *>view.buf)[i]
+    else:
+        return (<long long *>view.buf)[i]
+
+
+cdef array.array _coords_array_get(object obj, int width, name):
+    """Get the coordinates in obj as a new flat array of C ints.
+
+    obj is either a buffer of integers, flat or with one row of ``width``
+    items per point, or a sequence of integers or of ``width`` tuples.
+
+    """
+    cdef:
+        Py_buffer view
+        array.array arr
+        char code
+        Py_ssize_t n, i
+        int *p
+
+    if not PyObject_CheckBuffer(obj):
+        obj = list(obj)
+        if obj and not isinstance(obj[0], (int, long)):
+            obj = [c for point in obj for c in point]
+        arr = array.array("i", obj)
+        if len(arr) % width:
+            raise ValueError("%s must have a multiple of %d items, not %d" %
+                             (name, width, len(arr)))
+        return arr
+
+    PyObject_GetBuffer(obj, &view, PyBUF_FORMAT | PyBUF_C_CONTIGUOUS)
+    try:
+        code = buffer_format_code(&view)
+        if code == 0 or code not in b"bBhHiIlLqQnN" or \
+           view.itemsize not in (1, 2, 4, 8):
+            raise TypeError("%s must be a buffer of integers" % (name,))
+
+        n = view.len // view.itemsize
+        if n % width:
+            raise ValueError("%s must have a multiple of %d items, not %d" %
+                             (name, width, n))
+
+        arr = array.clone(array.array("i"), n, False)
+        p = arr.data.as_ints
+        if view.itemsize == sizeof(int) and code >= c'a':
+            memcpy(p, view.buf, view.len)
+        else:
+            for i in range(n):
+                p[i] = <int>_coords_buffer_item_get(&view, i, code >= c'a')
+    finally:
+        PyBuffer_Release(&view)
+    return arr
+
+
 cdef class Polygon(Object):
     """
 
@@ -28,16 +102,16 @@ cdef class Polygon(Object):
         :param canvas: Evas canvas for this object
         :type canvas: :py:class:`~efl.evas.Canvas`
         :keyword points: Points of the polygon
-        :type points: list of tuple of x, y int pairs
+        :type points: list of tuple of x, y int pairs, or any type accepted
+            by :py:meth:`points_set`
         :keyword \**kwargs: All the remaining keyword arguments are interpreted
                             as properties of the instance
 
         """
         self._set_obj(evas_object_polygon_add(canvas.obj))
         self._set_properties_from_keyword_args(kwargs)
-        if points:
-            for x, y in points:
-                self.point_add(x, y)
+        if points is not None:
+            self.points_set(points)
 
     def point_add(self, int x, int y):
         """Add a new point to the polygon
@@ -49,10 +123,71 @@ cdef class Polygon(Object):
 
         """
         evas_object_polygon_point_add(self.obj, x, y)
+        if self._points is None:
+            self._points = array.array("i")
+        self._points.append(x)
+        self._points.append(y)
 
     def points_clear(self):
         """Remove all the points from the polygon"""
         evas_object_polygon_points_clear(self.obj)
+        self._points = None
+
+    property points:
+        """All the points of the polygon.
+
+        :type: :class:`array.array` of type ``'i'``, flat (x0, y0, x1, y1...)
+
+        .. seealso:: :py:meth:`points_set`
+
+        .. versionadded:: 1.27
+
+        """
+        def __set__(self, points):
+            self.points_set(points)
+
+        def __get__(self):
+            return self.points_get()
+
+    def points_set(self, points):
+        """Replace all the points of the polygon at once.
+
+        :param points: The new points, an object supporting the buffer
+            protocol with integers, flat (x0, y0, x1, y1...) or with one
+            row per point, like :class:`array.array` or an (N, 2) NumPy
+            array, or a sequence of (x, y) tuples or of integers.
+
+        This is much faster than clearing the polygon and adding the
+        points one by one with :py:meth:`point_add`.
+
+        .. versionadded:: 1.27
+
+        """
+        cdef:
+            array.array arr = _coords_array_get(points, 2, "points")
+            int *p = arr.data.as_ints
+            Py_ssize_t i, n = len(arr)
+
+        evas_object_polygon_points_clear(self.obj)
+        for i in range(0, n, 2):
+            evas_object_polygon_point_add(self.obj, p[i], p[i + 1])
+        self._points = arr
+
+    def points_get(self):
+        """Get all the points of the polygon.
+
+        :return: A flat (x0, y0, x1, y1...) copy of the points.
+        :rtype: :class:`array.array` of type ``'i'``
+
+        .. note:: Evas doesn't allow reading the points back, only the ones
+            added with this object are returned.
+
+        .. versionadded:: 1.27
+
+        """
+        if self._points is None:
+            return array.array("i")
+        return array.copy(self._points)
 
 
 _object_mapping_register("Efl.Canvas.Polygon", Polygon)
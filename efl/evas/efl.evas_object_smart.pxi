@@ -378,6 +378,43 @@ cdef void _smart_object_member_del(Evas_Object *o, Evas_Object *clip) with gil:
         traceback.print_exc()
 
 
+cdef void _smart_object_move_children(Evas_Object *o,
+                                      Evas_Coord x, Evas_Coord y):
+    cdef Evas_Coord orig_x, orig_y
+    evas_object_geometry_get(o, &orig_x, &orig_y, NULL, NULL)
+    evas_object_smart_move_children_relative(o, x - orig_x, y - orig_y)
+
+
+# The methods implemented by each Smart class, see _smart_methods_get()
+cdef object _smart_methods_cache = weakref.WeakKeyDictionary()
+
+cdef tuple _smart_method_names = (
+    "delete", "member_add", "member_del", "move", "resize", "show", "hide",
+    "color_set", "clip_set", "clip_unset", "calculate")
+
+
+cdef frozenset _smart_methods_get(type cls):
+    """
+
+    The names of the methods a Smart class implements, itself or in one of
+    its bases, "move_children" is in the set when the class uses
+    :py:meth:`Smart.move_children` as its move method. Computed once for
+    each class.
+
+    """
+    cdef frozenset methods = _smart_methods_cache.get(cls)
+    if methods is not None:
+        return methods
+
+    methods = frozenset(name for name in _smart_method_names
+                        if getattr(cls, name, None) is not None)
+    if getattr(cls, "move", None) is Smart.move_children:
+        methods = methods | frozenset(("move_children",))
+
+    _smart_methods_cache[cls] = methods
+    return methods
+
+
 cdef class _SmartCb:
     cdef:
         SmartObject obj
@@ -387,6 +424,8 @@ cdef class _SmartCb:
         object func
         tuple args
         dict kargs
+        # the arguments used when there is no event_info to convert
+        tuple static_args
 
 
 cdef object _smart_cb_pass_conv(void *addr):
@@ -401,9 +440,10 @@ cdef void _smart_callback(void *data, Evas_Object *o, void *event_info) with gil
     cdef:
         void *tmp = NULL
         SmartObject obj
-        object event, ei
+        object event, ei = None
+        object(*ei_conv)(void*)
         _SmartCb spec
-        list tmp_args
+        tuple args
         list lst
 
     tmp = efl_key_data_get(o, "python-eo")
@@ -413,39 +453,34 @@ cdef void _smart_callback(void *data, Evas_Object *o, void *event_info) with gil
     else:
         obj = <SmartObject>tmp
 
+    ei_conv = NULL
     event = <object>data
-    lst = <list>obj._smart_callback_specs[event]
+    # the lists are replaced, never changed in place, when callbacks are
+    # added or removed, so it can be iterated while calling them
+    lst = <list>obj._smart_callback_specs.get(event)
+    if lst is None:
+        return
 
     for spec in lst:
-        if event_info == NULL:
-            try:
-                tmp_args = [spec.obj]
-                if spec.event_conv != NULL:
-                    tmp_args.append(None)
-                tmp_args.extend(spec.args)
-                PyObject_Call(spec.func, tuple(tmp_args), spec.kargs)
-            except Exception:
-                traceback.print_exc()
-        elif event_info != NULL and spec.event_conv == NULL:
-            #EINA_LOG_DOM_WARN(
-            #    PY_EFL_EVAS_LOG_DOMAIN,
-            #    'event_info for event "%s" is not NULL and there is no event_conv!',
-            #    <const char*>event
-            #    )
-            try:
-                tmp_args = [spec.obj]
-                tmp_args.extend(spec.args)
-                PyObject_Call(spec.func, tuple(tmp_args), spec.kargs)
-            except Exception:
-                traceback.print_exc()
-        else:
-            try:
-                tmp_args = [spec.obj]
-                tmp_args.append(spec.event_conv(event_info))
-                tmp_args.extend(spec.args)
-                PyObject_Call(spec.func, tuple(tmp_args), spec.kargs)
-            except Exception:
-                traceback.print_exc()
+        try:
+            if event_info == NULL or spec.event_conv == NULL:
+                args = spec.static_args
+            else:
+                # event_info is converted once for all the callbacks
+                if spec.event_conv != ei_conv:
+                    ei = spec.event_conv(event_info)
+                    ei_conv = spec.event_conv
+                if not spec.args and not spec.kargs:
+                    spec.func(spec.obj, ei)
+                    continue
+                args = (spec.obj, ei) + spec.args
+
+            if spec.kargs:
+                PyObject_Call(spec.func, args, spec.kargs)
+            else:
+                spec.func(*args)
+        except Exception:
+            traceback.print_exc()
 
 
 cdef class Smart(object):
@@ -511,6 +546,17 @@ cdef class Smart(object):
 
         Called before object is used for rendering and it is marked as dirty/changed with :py:func:`changed`.
 
+    The methods are looked up once for each class, when its first instance
+    is created, and the ones not implemented have no cost at all. Use
+    :meth:`move_children` as the ``move`` method to move the members of the
+    object without calling Python code::
+
+        class MySmart(Smart):
+            move = Smart.move_children
+
+    .. versionchanged:: 1.27
+        The methods are also looked up in the base classes
+
     """
 
     def __cinit__(self, Smart parent=None, bint clipped=False, callback_descriptions=[], *args, **kwargs):
@@ -526,63 +572,67 @@ cdef class Smart(object):
         cls_def.name = name
         cls_def.version = enums.EVAS_SMART_CLASS_VERSION
 
+        methods = _smart_methods_get(type(self))
+
         if clipped:
             evas_object_smart_clipped_smart_set(cls_def)
             # override add to NULL?
         else:
             cls_def.add = NULL # use python constructor
 
-            if "delete" in self.__class__.__dict__:
+            if "delete" in methods:
                 cls_def.delete = _smart_object_delete
             else:
                 cls_def.delete = NULL
 
-            if "move" in self.__class__.__dict__:
+            if "move_children" in methods:
+                cls_def.move = _smart_object_move_children
+            elif "move" in methods:
                 cls_def.move = _smart_object_move
             else:
                 cls_def.move = NULL
 
-            if "show" in self.__class__.__dict__:
+            if "show" in methods:
                 cls_def.show = _smart_object_show
             else:
                 cls_def.show = NULL
 
-            if "hide" in self.__class__.__dict__:
+            if "hide" in methods:
                 cls_def.hide = _smart_object_hide
             else:
                 cls_def.hide = NULL
 
-            if "color_set" in self.__class__.__dict__:
+            if "color_set" in methods:
                 cls_def.color_set = _smart_object_color_set
             else:
                 cls_def.color_set = NULL
 
-            if "clip_set" in self.__class__.__dict__:
+            if "clip_set" in methods:
                 cls_def.clip_set = _smart_object_clip_set
             else:
                 cls_def.clip_set = NULL
 
-            if "clip_unset" in self.__class__.__dict__:
+            if "clip_unset" in methods:
                 cls_def.clip_unset = _smart_object_clip_unset
             else:
                 cls_def.clip_unset = NULL
 
-            if "member_add" in self.__class__.__dict__:
+            if "member_add" in methods:
                 cls_def.member_add = _smart_object_member_add
             else:
                 cls_def.member_add = NULL
 
-            if "member_del" in self.__class__.__dict__:
+            if "member_del" in methods:
                 cls_def.member_del = _smart_object_member_del
             else:
                 cls_def.member_del = NULL
 
-        if "resize" in self.__class__.__dict__:
+        if "resize" in methods:
             cls_def.resize = _smart_object_resize
         else:
             cls_def.resize = NULL
 
-        if "calculate" in self.__class__.__dict__:
+        if "calculate" in methods:
             cls_def.calculate = _smart_object_calculate
         else:
             cls_def.calculate = NULL
@@ -607,6 +657,19 @@ cdef class Smart(object):
         evas_smart_free(self.cls) # FIXME: Check that all resources (cb descriptions etc.) are truly freed
         self.cls = NULL
 
+    @staticmethod
+    def move_children(SmartObject obj, int x, int y):
+        """Move the members of the object by the offset it is moved.
+
+        A ready made :meth:`move` method, implemented in C: when a class
+        uses it as its ``move`` method Python code is not called at all
+        when the object is moved.
+
+        .. versionadded:: 1.27
+
+        """
+        _smart_object_move_children(obj.obj, x, y)
+
     property callback_descriptions:
         def __get__(self):
             cdef:
@@ -877,17 +940,23 @@ cdef class SmartObject(Object):
         spec.event = event
         spec.event_conv = event_conv
         spec.func = func
-        spec.args = args
+        spec.args = args if args is not None else ()
         spec.kargs = kargs
+        if event_conv != NULL:
+            spec.static_args = (self, None) + spec.args
+        else:
+            spec.static_args = (self,) + spec.args
 
-        lst = <list>self._smart_callback_specs.setdefault(event, [])
+        lst = <list>self._smart_callback_specs.get(event)
         if not lst:
             evas_object_smart_callback_add(self.obj,
                 <const char*>spec.event,
                 _smart_callback,
                 <void *>spec.event
                 )
-        lst.append(spec)
+            lst = []
+        # _smart_callback() relies on the lists not being changed in place
+        self._smart_callback_specs[event] = lst + [spec]
 
         return 1
 
@@ -930,7 +999,8 @@ cdef class SmartObject(Object):
         if found == 0:
             raise ValueError("func not registered")
 
-        lst.pop(i)
+        lst = lst[:i] + lst[i + 1:]
+        self._smart_callback_specs[event] = lst
 
         if not lst:
             tmp = evas_object_smart_callback_del(self.obj,
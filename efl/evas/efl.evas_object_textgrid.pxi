@@ -16,6 +16,84 @@
 # along with this Python-EFL.  If not, see <http://www.gnu.org/licenses/>.
 
 from libc.stdlib cimport malloc
+from cpython.buffer cimport Py_buffer, PyObject_GetBuffer, PyBuffer_Release, \
+    PyBUF_FORMAT, PyBUF_ND, PyBUF_WRITABLE
+from cpython cimport array
+import array
+
+
+TEXTGRID_CELL_BOLD = 1 << 0
+TEXTGRID_CELL_ITALIC = 1 << 1
+TEXTGRID_CELL_UNDERLINE = 1 << 2
+TEXTGRID_CELL_STRIKETHROUGH = 1 << 3
+TEXTGRID_CELL_FG_EXTENDED = 1 << 4
+TEXTGRID_CELL_BG_EXTENDED = 1 << 5
+TEXTGRID_CELL_DOUBLE_WIDTH = 1 << 6
+
+
+cdef inline unsigned int _textgrid_cell_attrs_get(Evas_Textgrid_Cell *cell):
+    return ((cell.bold != 0) |
+            (cell.italic != 0) << 1 |
+            (cell.underline != 0) << 2 |
+            (cell.strikethrough != 0) << 3 |
+            (cell.fg_extended != 0) << 4 |
+            (cell.bg_extended != 0) << 5 |
+            (cell.double_width != 0) << 6)
+
+
+cdef inline void _textgrid_cell_attrs_set(Evas_Textgrid_Cell *cell,
+                                          unsigned int attrs):
+    cell.bold = attrs & 1
+    cell.italic = (attrs >> 1) & 1
+    cell.underline = (attrs >> 2) & 1
+    cell.strikethrough = (attrs >> 3) & 1
+    cell.fg_extended = (attrs >> 4) & 1
+    cell.bg_extended = (attrs >> 5) & 1
+    cell.double_width = (attrs >> 6) & 1
+
+
+cdef int _textgrid_buffer_get(object obj, Py_buffer *view, Py_ssize_t n,
+                              bint writable, name) except 0:
+    """Get a contiguous buffer of at least ``n`` unsigned integers."""
+    cdef int flags = PyBUF_FORMAT | PyBUF_ND
+    if writable:
+        flags |= PyBUF_WRITABLE
+
+    PyObject_GetBuffer(obj, view, flags)
+
+    if view.itemsize not in (1, 2, 4, 8) or (view.format != NULL and
+       (<bytes>view.format)[-1:] in (b"e", b"f", b"d", b"?")):
+        PyBuffer_Release(view)
+        raise TypeError("%s must be a buffer of integers" % (name,))
+    if view.len / view.itemsize < n:
+        PyBuffer_Release(view)
+        raise ValueError("%s has %d items, %d needed" % (
+            name, view.len / view.itemsize, n))
+    return 1
+
+
+cdef inline unsigned long long _textgrid_buffer_item_get(Py_buffer *view,
+                                                          Py_ssize_t i):
+    if view.itemsize == 1:
+        return (<unsigned char *>view.buf)[i]
+    elif view.itemsize == 2:
+        return (<unsigned short *>view.buf)[i]
+    elif view.itemsize == 4:
+        return (<unsigned int *>view.buf)[i]
+    else:
+        return (<unsigned long long *>view.buf)[i]
+
+
+cdef inline void _textgrid_buffer_item_set(Py_buffer *view, Py_ssize_t i,
+                                           unsigned long long value):
+    if view.itemsize == 1:
+        (<unsigned char *>view.buf)[i] = <unsigned char>value
+    elif view.itemsize == 2:
+        (<unsigned short *>view.buf)[i] = <unsigned short>value
+    elif view.itemsize == 4:
+        (<unsigned int *>view.buf)[i] = <unsigned int>value
+    else:
+        (<unsigned long long *>view.buf)[i] = value
 
 
 cdef class TextgridCell(object):
@@ -448,4 +526,218 @@ cdef class Textgrid(Object):
         """
         evas_object_textgrid_update_add(self.obj, x, y, w, h)
 
+    cdef int _region_check(self, int x, int y, int *w, int *h) except 0:
+        cdef int gw, gh
+        evas_object_textgrid_size_get(self.obj, &gw, &gh)
+        if w[0] < 0:
+            w[0] = gw - x
+        if h[0] < 0:
+            h[0] = gh - y
+        if x < 0 or y < 0 or x + w[0] > gw or y + h[0] > gh:
+            raise ValueError("region (%d, %d, %d, %d) is outside the grid "
+                             "(%d, %d)" % (x, y, w[0], h[0], gw, gh))
+        return 1
+
+    def cells_set(self, int x, int y, int w, int h, codepoints=None,
+                  fg=None, bg=None, attrs=None, bint update=True):
+        """Set a rectangular region of cells from packed arrays.
+
+        :param int x: The region top-left x (column)
+        :param int y: The region top-left y (row)
+        :param int w: The region width in cells (columns)
+        :param int h: The region height in cells (rows)
+        :param codepoints: The characters, a string of ``w * h`` characters or
+            a buffer of ``w * h`` unsigned integers.
+        :param fg: The foreground palette indexes.
+        :param bg: The background palette indexes.
+        :param attrs: The cell attributes, as a combination of the
+            ``TEXTGRID_CELL_*`` bit flags.
+        :param bool update: Whether to call :py:meth:`update_add` for the
+            whole region once done.
+
+        All the values are given in row-major order. Each one of
+        ``codepoints``, ``fg``, ``bg`` and ``attrs`` can be ``None``, to leave
+        that value untouched, an ``int``, to set the same value on all the
+        cells, or an object supporting the buffer protocol, like ``bytes``,
+        :class:`array.array` or NumPy arrays, with integers of 1, 2, 4 or 8
+        bytes each.
+
+        This is much faster than modifying :class:`TextgridCell` objects
+        one by one, as no Python object is created for the cells::
+
+            tg.cells_set(0, row, width, 1, b"Hello world!",
+                         fg=7, bg=0, attrs=TEXTGRID_CELL_BOLD)
+
+        .. seealso::
+
+            :py:meth:`cells_get`
+            :py:meth:`update_add`
+
+        .. versionadded:: 1.27
+
+        """
+        cdef:
+            Py_buffer cp_view, fg_view, bg_view, attrs_view
+            bint cp_buf = False, fg_buf = False, bg_buf = False
+            bint attrs_buf = False, cp_str = False
+            unicode ucp
+            Py_UCS4 cp_val = 0
+            unsigned int fg_val = 0, bg_val = 0, attrs_val = 0
+            Py_ssize_t n, i
+            int row, col
+            Evas_Textgrid_Cell *cells
+            Evas_Textgrid_Cell *cell
+
+        self._region_check(x, y, &w, &h)
+        n = w * h
+        if n == 0:
+            return
+
+        if isinstance(codepoints, unicode):
+            ucp = codepoints
+            if len(ucp) < n:
+                raise ValueError("codepoints has %d items, %d needed" % (
+                    len(ucp), n))
+            cp_str = True
+        elif isinstance(codepoints, (int, long)):
+            cp_val = codepoints
+        elif codepoints is not None:
+            cp_buf = _textgrid_buffer_get(codepoints, &cp_view, n, False,
+                                          "codepoints")
+
+        try:
+            if isinstance(fg, (int, long)):
+                fg_val = fg
+            elif fg is not None:
+                fg_buf = _textgrid_buffer_get(fg, &fg_view, n, False, "fg")
+            if isinstance(bg, (int, long)):
+                bg_val = bg
+            elif bg is not None:
+                bg_buf = _textgrid_buffer_get(bg, &bg_view, n, False, "bg")
+            if isinstance(attrs, (int, long)):
+                attrs_val = attrs
+            elif attrs is not None:
+                attrs_buf = _textgrid_buffer_get(attrs, &attrs_view, n, False,
+                                                 "attrs")
+
+            i = 0
+            for row in range(y, y + h):
+                cells = evas_object_textgrid_cellrow_get(self.obj, row)
+                if cells == NULL:
+                    i += w
+                    continue
+                for col in range(x, x + w):
+                    cell = &cells[col]
+                    if cp_str:
+                        cell.codepoint = ucp[i]
+                    elif cp_buf:
+                        cell.codepoint = \
+                            <Py_UCS4>_textgrid_buffer_item_get(&cp_view, i)
+                    elif codepoints is not None:
+                        cell.codepoint = cp_val
+                    if fg_buf:
+                        cell.fg = <unsigned char>_textgrid_buffer_item_get(
+                            &fg_view, i)
+                    elif fg is not None:
+                        cell.fg = fg_val
+                    if bg_buf:
+                        cell.bg = <unsigned char>_textgrid_buffer_item_get(
+                            &bg_view, i)
+                    elif bg is not None:
+                        cell.bg = bg_val
+                    if attrs_buf:
+                        _textgrid_cell_attrs_set(cell,
+                            <unsigned int>_textgrid_buffer_item_get(
+                                &attrs_view, i))
+                    elif attrs is not None:
+                        _textgrid_cell_attrs_set(cell, attrs_val)
+                    i += 1
+                evas_object_textgrid_cellrow_set(self.obj, row, cells)
+        finally:
+            if cp_buf: PyBuffer_Release(&cp_view)
+            if fg_buf: PyBuffer_Release(&fg_view)
+            if bg_buf: PyBuffer_Release(&bg_view)
+            if attrs_buf: PyBuffer_Release(&attrs_view)
+
+        if update:
+            evas_object_textgrid_update_add(self.obj, x, y, w, h)
+
+    def cells_get(self, int x=0, int y=0, int w=-1, int h=-1,
+                  codepoints=None, fg=None, bg=None, attrs=None):
+        """Read a rectangular region of cells into packed arrays.
+
+        :param int x: The region top-left x (column)
+        :param int y: The region top-left y (row)
+        :param int w: The region width in cells, -1 for up to the grid end
+        :param int h: The region height in cells, -1 for up to the grid end
+        :param codepoints: Writable buffer for the characters
+        :param fg: Writable buffer for the foreground palette indexes
+        :param bg: Writable buffer for the background palette indexes
+        :param attrs: Writable buffer for the ``TEXTGRID_CELL_*`` flags
+
+        :return: The (**codepoints**, **fg**, **bg**, **attrs**) arrays
+        :rtype: tuple
+
+        Values are stored in row-major order. Output buffers can be given to
+        avoid any allocation, they must be writable, contain integers of 1, 2,
+        4 or 8 bytes each and have room for at least ``w * h`` items. Missing
+        ones are created as :class:`array.array` of type ``'I'`` for
+        codepoints and ``'B'`` for the others.
+
+        .. seealso:: :py:meth:`cells_set`
+
+        .. versionadded:: 1.27
+
+        """
+        cdef:
+            Py_buffer cp_view, fg_view, bg_view, attrs_view
+            bint cp_buf = False, fg_buf = False
+            bint bg_buf = False, attrs_buf = False
+            Py_ssize_t n, i
+            int row, col
+            Evas_Textgrid_Cell *cells
+            Evas_Textgrid_Cell *cell
+
+        self._region_check(x, y, &w, &h)
+        n = w * h
+
+        if codepoints is None:
+            codepoints = array.clone(array.array("I"), n, True)
+        if fg is None:
+            fg = array.clone(array.array("B"), n, True)
+        if bg is None:
+            bg = array.clone(array.array("B"), n, True)
+        if attrs is None:
+            attrs = array.clone(array.array("B"), n, True)
+
+        try:
+            cp_buf = _textgrid_buffer_get(codepoints, &cp_view, n, True,
+                                          "codepoints")
+            fg_buf = _textgrid_buffer_get(fg, &fg_view, n, True, "fg")
+            bg_buf = _textgrid_buffer_get(bg, &bg_view, n, True, "bg")
+            attrs_buf = _textgrid_buffer_get(attrs, &attrs_view, n, True,
+                                             "attrs")
+
+            i = 0
+            for row in range(y, y + h):
+                cells = evas_object_textgrid_cellrow_get(self.obj, row)
+                if cells == NULL:
+                    i += w
+                    continue
+                for col in range(x, x + w):
+                    cell = &cells[col]
+                    _textgrid_buffer_item_set(&cp_view, i, cell.codepoint)
+                    _textgrid_buffer_item_set(&fg_view, i, cell.fg)
+                    _textgrid_buffer_item_set(&bg_view, i, cell.bg)
+                    _textgrid_buffer_item_set(&attrs_view, i,
+                                              _textgrid_cell_attrs_get(cell))
+                    i += 1
+        finally:
+            if cp_buf: PyBuffer_Release(&cp_view)
+            if fg_buf: PyBuffer_Release(&fg_view)
+            if bg_buf: PyBuffer_Release(&bg_view)
+            if attrs_buf: PyBuffer_Release(&attrs_view)
+
+        return (codepoints, fg, bg, attrs)
+
 _object_mapping_register("Evas.Textgrid", Textgrid)
@@ -16,12 +16,18 @@
 # along with this Python-EFL.  If not, see <http://www.gnu.org/licenses/>.
 
 from libc.stdlib cimport malloc
-from libc.string cimport strdup
-from cpython cimport PyUnicode_AsUTF8String
+from libc.stdint cimport uintptr_t
+from libc.string cimport strdup, strcmp
+from cpython cimport PyUnicode_AsUTF8String, PyObject, Py_INCREF, Py_XDECREF, \
+    PyList_New, PyList_SET_ITEM
+from cpython.bytes cimport PyBytes_AS_STRING
 
-from efl.c_eo cimport Eo as cEo
+from efl.c_eo cimport Eo as cEo, efl_isa, efl_object_class_get
 from efl.eo cimport Eo, object_from_instance
-from efl.eina cimport eina_list_append, eina_stringshare_add
+from efl.eina cimport eina_list_append, eina_list_count, eina_list_free, \
+    eina_stringshare_add
+
+import sys
 
 cdef unicode _touni(char* s):
     """
@@ -41,6 +47,76 @@ cdef unicode _ctouni(const char *s):
     return s.decode('UTF-8', 'strict') if s else None
 
 
+# Strings converted by _ctouni_cached(), by address. This is a direct
+# mapped cache: a string replaces the one in its slot. The bytes are kept to
+# check that the address was not reused for another string.
+DEF _STRINGS_CACHE_SIZE = 1024
+
+cdef struct _CachedString:
+    const char *s
+    PyObject *b
+    PyObject *u
+
+cdef _CachedString _strings_cache[_STRINGS_CACHE_SIZE]
+
+
+cdef unicode _ctouni_cached(const char *s):
+    """
+
+    Converts a const char * to a python string object, like _ctouni(), but
+    returns the same object for the same string at the same address without
+    creating any object. Use it for the names converted again and again,
+    like parts, signals and keys, usually stringshared.
+
+    """
+    cdef:
+        uintptr_t addr = <uintptr_t>s
+        _CachedString *slot
+        bytes b
+        unicode u
+
+    if s == NULL:
+        return None
+    slot = &_strings_cache[((addr >> 4) ^ (addr >> 14)) %
+                           _STRINGS_CACHE_SIZE]
+    if slot.s == s and strcmp(PyBytes_AS_STRING(<object>slot.b), s) == 0:
+        return <unicode>slot.u
+
+    b = <bytes>s
+    u = b.decode('UTF-8', 'strict')
+    Py_INCREF(b)
+    Py_INCREF(u)
+    Py_XDECREF(slot.b)
+    Py_XDECREF(slot.u)
+    slot.s = s
+    slot.b = <PyObject *>b
+    slot.u = <PyObject *>u
+    return u
+
+
+# UTF-8 encoded strings of _tobytes_cached(), cleared when full
+cdef dict _bytes_cache = {}
+
+
+cdef object _tobytes_cached(object s):
+    """
+
+    Converts a python string object to UTF-8 encoded bytes, keeping the
+    result for the next conversions. Bytes and None are returned as they
+    are. Use it for the names converted again and again, like parts.
+
+    """
+    if not isinstance(s, unicode):
+        return s
+    b = _bytes_cache.get(s)
+    if b is None:
+        if len(_bytes_cache) >= 1024:
+            _bytes_cache.clear()
+        b = PyUnicode_AsUTF8String(s)
+        _bytes_cache[s] = b
+    return b
+
+
 cdef list array_of_strings_to_python_list(char **array, int array_length):
     """
 
@@ -181,13 +257,98 @@ cdef Eina_List *python_list_strings_to_eina_list(list strings):
 
 
 cdef list eina_list_objects_to_python_list(const Eina_List *lst):
-    cdef list ret = list()
+    cdef:
+        list ret = PyList_New(eina_list_count(lst))
+        Py_ssize_t i = 0
+    # the list is created with its final size and filled in place
     while lst:
-        ret.append(object_from_instance(<cEo *>lst.data))
+        o = object_from_instance(<cEo *>lst.data)
+        Py_INCREF(o)
+        PyList_SET_ITEM(ret, i, o)
+        i += 1
         lst = lst.next
     return ret
 
 
+cdef object _object_from_data(void *data):
+    return object_from_instance(<cEo *>data)
+
+
+cdef class EinaListIterator(object):
+    """
+
+    Lazy iterator on the Python objects of an Eina_List.
+
+    The objects are created only when reached, and ``len()`` returns the
+    number of objects still to come without creating any. The list is owned,
+    and freed, by the iterator.
+
+    The list is a snapshot: the Eo objects deleted while iterating are
+    skipped, so ``len()`` is an upper bound in that case.
+
+    .. versionadded:: 1.27
+
+    """
+    cdef:
+        Eina_List *lst
+        Eina_List *itr
+        unsigned int remaining
+        eina_list_data_conv conv
+        bint eo_check
+
+    def __dealloc__(self):
+        eina_list_free(self.lst)
+        self.lst = NULL
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        cdef void *data
+        while self.itr != NULL:
+            data = self.itr.data
+            self.itr = self.itr.next
+            self.remaining -= 1
+            # the eo id of a deleted object is not valid anymore
+            if self.eo_check and \
+                    not efl_isa(<cEo *>data, efl_object_class_get()):
+                continue
+            return self.conv(data)
+        raise StopIteration
+
+    def __len__(self):
+        return self.remaining
+
+
+cdef object eina_list_to_python_iterator(Eina_List *lst,
+                                         eina_list_data_conv conv):
+    """
+
+    Converts an Eina_List to a lazy iterator, the data of the nodes is
+    converted by conv. The iterator takes the ownership of lst.
+
+    """
+    cdef EinaListIterator ret = EinaListIterator.__new__(EinaListIterator)
+    ret.lst = ret.itr = lst
+    ret.remaining = eina_list_count(lst)
+    ret.conv = conv
+    return ret
+
+
+cdef object eina_list_objects_to_python_iterator(Eina_List *lst):
+    """
+
+    Converts an Eina_List of Eo objects to a lazy iterator, skipping the
+    objects deleted before they are reached. The iterator takes the
+    ownership of lst.
+
+    """
+    cdef EinaListIterator ret = \
+        eina_list_to_python_iterator(lst, _object_from_data)
+    ret.eo_check = True
+    return ret
+
+
 cdef Eina_List *python_list_objects_to_eina_list(list objects):
     cdef:
         Eina_List *lst = NULL
@@ -200,3 +361,26 @@ cdef Eina_List *python_list_objects_to_eina_list(list objects):
         lst = eina_list_append(lst, o.obj)
 
     return lst
+
+
+cdef bint _big_endian = sys.byteorder == "big"
+
+
+cdef char buffer_format_code(const Py_buffer *view):
+    """
+
+    Returns the struct type code of the items of a buffer, like 'i' or
+    'd', or 0 if they are not single values in native byte order. A NULL
+    format means unsigned bytes, 'B'.
+
+    """
+    cdef const char *fmt = view.format
+    if fmt == NULL:
+        return c'B'
+    if fmt[0] == c'@' or fmt[0] == c'=' or \
+       fmt[0] == (c'>' if _big_endian else c'<') or \
+       (fmt[0] == c'!' and _big_endian):
+        fmt += 1
+    if fmt[0] == 0 or fmt[1] != 0:
+        return 0
+    return fmt[0]
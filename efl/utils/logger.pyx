@@ -18,19 +18,26 @@
 from efl.eina cimport Eina_Log_Domain, Eina_Log_Level, \
     eina_log_print_cb_set, eina_log_domain_register, eina_log_level_set, \
     eina_log_level_get, eina_log_domain_level_get, eina_log_domain_level_set, \
-    eina_log_print, EINA_LOG_DOM_DBG, EINA_LOG_DOM_INFO, EINA_LOG_DOM_WARN, \
-    EINA_LOG_DOM_ERR, EINA_LOG_DOM_CRIT
+    eina_log_print, eina_log_main_thread_check, EINA_LOG_DOM_DBG, \
+    EINA_LOG_DOM_INFO, EINA_LOG_DOM_WARN, EINA_LOG_DOM_ERR, EINA_LOG_DOM_CRIT
 from cpython cimport PyUnicode_AsUTF8String, PY_VERSION_HEX
+from libc.stdlib cimport malloc, free
+from libc.string cimport strcmp, strdup
 
 import logging
 import types
+import time
+import warnings
+from collections import deque
 
 cdef extern from "stdarg.h":
     ctypedef struct va_list:
         pass
+    void va_copy(va_list dest, va_list src) nogil
+    void va_end(va_list ap) nogil
 
 cdef extern from "stdio.h":
-    int vsprintf(char *, const char *fmt, va_list args)
+    int vsnprintf(char *, size_t size, const char *fmt, va_list args) nogil
 
 cdef extern from "Python.h":
     void PyEval_InitThreads()
@@ -45,30 +52,211 @@ cdef tuple log_levels = (
 
 cdef dict loggers = dict()
 
-cdef char log_buf[1024]
+
+# The effective levels of the Python loggers, mirrored here so that the
+# messages they would drop are discarded without taking the GIL. Entries
+# are only appended, and only while holding the GIL.
+cdef struct _DomainLevel:
+    char *name
+    int level
+
+DEF _DOMAIN_LEVELS_MAX = 64
+cdef _DomainLevel _domain_levels[_DOMAIN_LEVELS_MAX]
+cdef int _domain_levels_count = 0
+cdef int _default_level = 0
+# set when a logger could not be mirrored, the unknown domains are then
+# only filtered by eina
+cdef bint _domain_levels_full = False
+
+
+cdef inline int _py_level(int level) nogil:
+    """The Python logging level for an Eina log level."""
+    if level <= 0:
+        return 50
+    elif level <= 4:
+        return 50 - level * 10
+    # custom levels, more verbose than debug
+    return 10 - (level - 4) if level < 13 else 1
+
+
+cdef int _level_get(const char *name) nogil:
+    cdef int i
+    for i in range(_domain_levels_count):
+        if strcmp(_domain_levels[i].name, name) == 0:
+            return _domain_levels[i].level
+    return 0 if _domain_levels_full else _default_level
+
+
+cdef void _levels_update():
+    """Mirror the effective level of every registered logger."""
+    global _default_level
+    cdef int i
+    for i in range(_domain_levels_count):
+        name = _domain_levels[i].name.decode("UTF-8", "replace")
+        log = loggers.get(name)
+        if log is not None:
+            _domain_levels[i].level = log.getEffectiveLevel()
+    root = loggers.get("efl")
+    if root is not None:
+        _default_level = root.getEffectiveLevel()
+
+
+cdef void _levels_register(name):
+    global _domain_levels_count, _domain_levels_full
+    if _domain_levels_count >= _DOMAIN_LEVELS_MAX:
+        # the table can't grow, the nogil readers would see it moving
+        if not _domain_levels_full:
+            _domain_levels_full = True
+            warnings.warn("more than %d efl loggers, the level of %r and "
+                          "the next ones is only checked by eina" %
+                          (_DOMAIN_LEVELS_MAX, name), RuntimeWarning)
+        return
+    cname = name
+    if isinstance(cname, unicode): cname = PyUnicode_AsUTF8String(cname)
+    _domain_levels[_domain_levels_count].name = strdup(cname)
+    _domain_levels[_domain_levels_count].level = 0
+    _domain_levels_count += 1
+
+
+# Records queued in asynchronous mode, see async_mode_set()
+cdef bint _async_mode = False
+cdef bint _async_flush_pending = False
+cdef object _async_queue = deque()
+cdef object _call_async = None
+cdef object _Job = None
+
+
+cdef void _record_handle(unicode name, int level, unicode ufile, int line,
+                         unicode msg, unicode ufnc, double created):
+    rec = logging.LogRecord(name, level, ufile, line, msg, None, None, ufnc)
+    if created > 0:
+        # relative to the start of the logging module, like rec.created
+        rec.relativeCreated += (created - rec.created) * 1000
+        rec.created = created
+        rec.msecs = (created - int(created)) * 1000
+    logger = loggers.get(name, loggers["efl"])
+    logger.handle(rec)
+
+
+def flush():
+    """Handle the records queued in asynchronous mode.
+
+    This is called from the main loop when needed, but can be used to handle
+    the pending records immediately, for example before exiting.
+
+    .. versionadded:: 1.27
+
+    """
+    global _async_flush_pending
+    _async_flush_pending = False
+    cdef Py_ssize_t ntodo = len(_async_queue)
+    while ntodo > 0:
+        ntodo -= 1
+        name, level, ufile, line, msg, ufnc, created = \
+            _async_queue.popleft()
+        _record_handle(name, level, ufile, line, msg, ufnc, created)
+
+
+def async_mode_set(bint enabled):
+    """Queue the records from the C libraries and handle them later.
+
+    In asynchronous mode the messages are formatted when emitted, but the
+    log records are created and passed to the handlers from the main loop.
+    This keeps slow handlers out of the code emitting them, and out of the
+    threads not holding the main loop.
+
+    :param bool enabled: Whether to enable asynchronous mode, when disabled
+        the pending records are handled immediately.
+
+    .. note:: The ``thread`` and ``process`` attributes of the records are
+        the ones of the main loop. Their ``created`` time is when they were
+        emitted.
+
+    .. versionadded:: 1.27
+
+    """
+    global _async_mode, _call_async, _Job
+    if enabled and _call_async is None:
+        from efl.ecore import call_async, Job
+        _call_async = call_async
+        _Job = Job
+    _async_mode = enabled
+    if not enabled:
+        flush()
+
+
+def async_mode_get():
+    """Whether the records are handled asynchronously.
+
+    .. versionadded:: 1.27
+
+    """
+    return _async_mode
 
 
 PyEval_InitThreads()
 
 cdef void py_eina_log_print_cb(const Eina_Log_Domain *d, Eina_Log_Level level,
     const char *file, const char *fnc, int line,
-    const char *fmt, void *data, va_list args) with gil:
+    const char *fmt, void *data, va_list args) nogil:
 
     cdef:
-        unicode msg, name, ufile, ufnc
-        object rec, logger
+        char buf[1024]
+        char *msg_buf = buf
+        int n
+        va_list args_copy
+
+    if _py_level(level) < _level_get(d.name):
+        return
 
-    vsprintf(log_buf, fmt, args)
+    # the buffer is on the stack of the logging thread, only messages too
+    # long for it are allocated
+    va_copy(args_copy, args)
+    n = vsnprintf(buf, sizeof(buf), fmt, args)
+    if n >= <int>sizeof(buf):
+        msg_buf = <char *>malloc(n + 1)
+        if msg_buf != NULL:
+            vsnprintf(msg_buf, n + 1, fmt, args_copy)
+        else:
+            msg_buf = buf
+            n = sizeof(buf) - 1
+    va_end(args_copy)
+    if n < 0:
+        n = 0
 
-    msg = log_buf.decode('UTF-8', 'replace')
+    with gil:
+        _log_print(d, level, file, fnc, line, msg_buf, n)
+
+    if msg_buf != buf:
+        free(msg_buf)
+
+
+cdef void _log_print(const Eina_Log_Domain *d, Eina_Log_Level level,
+                     const char *file, const char *fnc, int line,
+                     const char *msg_buf, int n):
+    global _async_flush_pending
+
+    cdef:
+        unicode msg, name, ufile, ufnc
+
+    msg = msg_buf[:n].decode('UTF-8', 'replace')
     name = d.name.decode('UTF-8', 'replace')
     ufile = file.decode('UTF-8', 'replace')
     ufnc = fnc.decode('UTF-8', 'replace')
 
-    rec = logging.LogRecord(
-        name, log_levels[level], ufile, line, msg, None, None, ufnc)
-    logger = loggers.get(name, loggers["efl"])
-    logger.handle(rec)
+    if not _async_mode:
+        _record_handle(name, _py_level(level), ufile, line, msg, ufnc, 0)
+        return
+
+    _async_queue.append((name, _py_level(level), ufile, line, msg, ufnc,
+                         time.time()))
+    if not _async_flush_pending:
+        _async_flush_pending = True
+        # call_async() calls immediately from the main loop thread
+        if eina_log_main_thread_check():
+            _Job(flush)
+        else:
+            _call_async(flush)
 
 eina_log_print_cb_set(py_eina_log_print_cb, NULL)
 
@@ -77,6 +265,7 @@ def setLevel(self, lvl):
     if isinstance(cname, unicode): cname = PyUnicode_AsUTF8String(cname)
     eina_log_domain_level_set(cname, log_levels.index(lvl))
     logging.Logger.setLevel(self, lvl)
+    _levels_update()
 
 class PyEFLLogger(logging.Logger):
 
@@ -85,6 +274,7 @@ class PyEFLLogger(logging.Logger):
         if isinstance(cname, unicode): cname = PyUnicode_AsUTF8String(cname)
         self.eina_log_domain = eina_log_domain_register(cname, NULL)
         loggers[name] = self
+        _levels_register(name)
         logging.Logger.__init__(self, name)
         if PY_VERSION_HEX < 0x03000000:
             self.setLevel = types.MethodType(setLevel, self, type(self))
@@ -102,6 +292,7 @@ cdef object add_logger(object name):
         if isinstance(cname, unicode): cname = PyUnicode_AsUTF8String(cname)
         log.eina_log_domain = eina_log_domain_register(cname, NULL)
         loggers[name] = log
+        _levels_register(name)
         lvl = log.getEffectiveLevel()
         eina_log_domain_level_set(cname, log_levels.index(lvl))
         if PY_VERSION_HEX < 0x03000000:
@@ -116,6 +307,7 @@ cdef object add_logger(object name):
         log.addHandler(logging.NullHandler())
 
     logging.setLoggerClass(logging.Logger)
+    _levels_update()
 
     return log
 
@@ -103,7 +103,7 @@ cdef extern from "Eo.h":
     void efl_unref(const Eo *obj)
     int efl_ref_get(const Eo *obj)
 
-    void efl_wref_add(Eo **wref)
+    void efl_wref_add(Eo *obj, Eo **wref)
 
     const Efl_Class *efl_object_class_get()
 
@@ -111,6 +111,7 @@ cdef extern from "Eo.h":
     void *efl_key_data_get(Eo *obj, const char *key)
 
     const Efl_Class *efl_class_get(const Eo *obj)
+    Eina_Bool efl_isa(const Eo *obj, const Efl_Class *klass)
     const char *efl_class_name_get(const Efl_Class *klass)
 
     void efl_parent_set(Eo *obj, Eo *parent)
@@ -79,6 +79,7 @@ cdef extern from "Ecore.h":
     # Other typedefs
     #
     ctypedef void (*Ecore_Cb)(void *data)
+    ctypedef void *(*Ecore_Data_Cb)(void *data)
     ctypedef Eina_Bool (*Ecore_Task_Cb)(void *data)
     ctypedef Eina_Bool (*Ecore_Fd_Cb)(void *data, Ecore_Fd_Handler *fd_handler)
     ctypedef void (*Ecore_Fd_Prep_Cb)(void *data, Ecore_Fd_Handler *fd_handler)
@@ -97,6 +98,9 @@ cdef extern from "Ecore.h":
     void ecore_main_loop_begin() nogil
     void ecore_main_loop_quit()
 
+    void  ecore_main_loop_thread_safe_call_async(Ecore_Cb callback, void *data) nogil
+    void *ecore_main_loop_thread_safe_call_sync(Ecore_Data_Cb callback, void *data) nogil
+
     int ecore_main_loop_glib_integrate()
     void ecore_main_loop_glib_always_integrate_disable()
 
@@ -253,18 +257,30 @@ cdef class Exe(object):
     cdef Ecore_Exe *exe
     cdef readonly object __data
     cdef object __callbacks
-
-    cdef int _set_obj(self, char *exe_cmd, int flags) except 0
+    cdef int _stdin_fd, _cmd_skip
+    cdef Ecore_Fd_Handler *_stdin_handler
+    cdef object _stdin_queue
+    cdef Py_ssize_t _stdin_pending, _stdin_offset, _stdin_high, _stdin_low
+    cdef bint _stdin_wants_drain, _stdin_closing
+    cdef list _drain_callbacks, _drain_waiters
+
+    cdef int _set_obj(self, char *exe_cmd, int flags,
+                      bint stdin_stream=*) except 0
     cdef int _unset_obj(self) except 0
+    cdef object _event_filter_get(self, int event_type)
+    cdef int _stdin_close(self) except 0
+    cdef int _stdin_flush(self) except 0
+    cdef int _stdin_check(self) except 0
 
 
 cdef class ExeEventFilter(object):
     cdef Ecore_Exe *exe
-    cdef Ecore_Event_Handler *handler
     cdef readonly object owner
     cdef readonly int event_type
     cdef object callbacks
 
+    cdef int _call(self, void *event) except 0
+
 
 cdef class EventHandler(object):
     cdef Ecore_Event_Handler *obj
@@ -329,9 +345,12 @@ cdef class EventExeDel(Event):
 
 cdef class EventExeData(Event):
     cdef readonly object exe
-    cdef readonly object data
-    cdef readonly object size
-    cdef readonly object lines
+    cdef Ecore_Exe_Event_Data *obj
+    cdef readonly int size
+    cdef object _bytes, _data, _lines
+
+    cdef void _unset_obj(self)
+    cdef int _check(self) except 0
 
 
 cdef class FileDownload:
@@ -114,9 +114,17 @@ cdef extern from "Ecore_Con.h":
     Eina_Bool         ecore_con_url_proxy_password_set(Ecore_Con_Url *url_con, const char *password)
 
 
+cdef class _UrlSink(object):
+    cdef int _feed(self, const unsigned char *data, int size) except -1
+    cdef int _finish(self, int status) except 0
+
 cdef class Url(Eo):
     # we cannot use Eo.obj here because Url is no more eo objects in C
     cdef Ecore_Con_Url *obj2
+    cdef _UrlSink _sink
+    cdef double _progress_interval, _progress_last
+
+    cdef int _sink_get(self, _UrlSink sink) except 0
 
 cdef class Lookup(object):
     cdef object done_cb
@@ -139,12 +147,16 @@ cdef class EventUrlProgress(Event):
 cdef class EventUrlData(Event):
     cdef readonly Url url
     cdef readonly int size
-    cdef readonly bytes data
+    cdef const unsigned char *_buf
+    cdef bytes _data
+
+    cdef void _unset_obj(self)
 
 
 cdef class ConEventFilter(object):
     cdef dict callbacks
     cdef dict handlers
+    cdef int handler_add(self, int ev_type) except 0
     cdef callback_add(self, int ev_type, Eo obj, object func, tuple args, dict kargs)
     cdef callback_del(self, int ev_type, Eo obj, object func, tuple args, dict kargs)
     cdef callback_del_full(self, Eo obj)
@@ -318,6 +318,10 @@ cdef extern from "Edje.h":
 cdef class Message:
     cdef int _type
     cdef int _id
+    cdef Py_ssize_t _count, _stride
+    cdef bytes _data
+
+    cdef void _unset_obj(self)
 
 
 cdef class MessageSignal(Message):
@@ -327,42 +331,62 @@ cdef class MessageSignal(Message):
 cdef class MessageString(Message):
     cdef Edje_Message_String *obj
 
+    cdef void _unset_obj(self)
+
 
 cdef class MessageInt(Message):
     cdef Edje_Message_Int *obj
 
+    cdef void _unset_obj(self)
+
 
 cdef class MessageFloat(Message):
     cdef Edje_Message_Float *obj
 
+    cdef void _unset_obj(self)
+
 
 cdef class MessageStringSet(Message):
     cdef Edje_Message_String_Set *obj
 
+    cdef void _unset_obj(self)
+
 
 cdef class MessageIntSet(Message):
     cdef Edje_Message_Int_Set *obj
 
+    cdef void _unset_obj(self)
+
 
 cdef class MessageFloatSet(Message):
     cdef Edje_Message_Float_Set *obj
 
+    cdef void _unset_obj(self)
+
 
 cdef class MessageStringInt(Message):
     cdef Edje_Message_String_Int *obj
 
+    cdef void _unset_obj(self)
+
 
 cdef class MessageStringFloat(Message):
     cdef Edje_Message_String_Float *obj
 
+    cdef void _unset_obj(self)
+
 
 cdef class MessageStringIntSet(Message):
     cdef Edje_Message_String_Int_Set *obj
 
+    cdef void _unset_obj(self)
+
 
 cdef class MessageStringFloatSet(Message):
     cdef Edje_Message_String_Float_Set *obj
 
+    cdef void _unset_obj(self)
+
 
 cdef class ExternalParam:
     cdef Edje_External_Param *obj
@@ -405,6 +429,7 @@ cdef class Edje(Object):
     cdef object _text_change_cb
     cdef object _message_handler_cb
     cdef object _signal_callbacks
+    cdef list _signal_globs
 
     cdef void message_send_int(self, int id, int data)
     cdef void message_send_float(self, int id, float data)
@@ -417,6 +442,7 @@ cdef class Edje(Object):
     cdef void message_send_int_set(self, int id, data)
     cdef void message_send_float_set(self, int id, data)
     cdef message_send_set(self, int id, data)
+    cdef message_send_buffer(self, int id, data)
 
 
 cdef ExternalParam ExternalParam_from_ptr(Edje_External_Param *param)
@@ -18,3 +18,19 @@
 
 
 cdef int PY_EFL_ELM_LOG_DOMAIN
+
+from efl.evas cimport Evas_Object, SmartObject
+
+
+# Base classes needed by the widgets that are built as separate modules
+cdef class Object(SmartObject):
+    cdef:
+        list _elm_event_cbs, _elm_signal_cbs
+        object cnp_drop_cb, cnp_drop_data
+        object cnp_selection_loss_cb, cnp_selection_loss_data
+
+        int _set_obj(self, Evas_Object *obj) except 0
+
+
+cdef class LayoutClass(Object):
+    cdef dict _elm_layout_signal_cbs
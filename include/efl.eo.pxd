@@ -22,13 +22,20 @@ cdef:
     class Eo(object):
         cdef:
             cEo *obj
-            readonly dict data
-            dict internal_data
+            dict _data
+            dict _internal_data
+            cEo *_legacy_parent
 
             int _set_obj(self, cEo *obj) except 0
             int _set_properties_from_keyword_args(self, dict kwargs) except 0
+            object _legacy_parent_get(self)
             #_add_obj(self, Eo_Class *klass, cEo *parent)
 
+        cdef inline dict internal_data_get(self):
+            if self._internal_data is None:
+                self._internal_data = dict()
+            return self._internal_data
+
     class EoIterator:
         cdef Eina_Iterator *itr
         @staticmethod
@@ -42,6 +49,7 @@ cdef:
 
     void _object_mapping_register(char *name, object cls) except *
     void _object_mapping_unregister(char *name)
+    void _object_mapping_register_lazy(char *name, object module) except *
 
     void _register_decorated_callbacks(Eo obj)
 
@@ -213,6 +213,7 @@ cdef extern from "Evas.h":
         Evas_Device *dev
 
     ctypedef struct Evas_Event_Multi_Move:
+        int device
         double radius
         double radius_x
         double radius_y
@@ -485,6 +486,7 @@ cdef extern from "Evas.h":
 
     void  evas_event_callback_add(Evas *e, Evas_Callback_Type type, Evas_Event_Cb func, const void *data)
     void *evas_event_callback_del(Evas *e, Evas_Callback_Type type, Evas_Event_Cb func)
+    void *evas_event_callback_del_full(Evas *e, Evas_Callback_Type type, Evas_Event_Cb func, const void *data)
 
     void      evas_object_pass_events_set(Evas_Object *obj, Eina_Bool p)
     Eina_Bool evas_object_pass_events_get(const Evas_Object *obj)
@@ -916,9 +918,12 @@ cdef class Canvas(Eo):
 cdef class Map(object):
     cdef Evas_Map *map
 
+    cdef int _points_check(self, Py_ssize_t n, name) except -1
+
 
 cdef class Object(Eo):
     cdef list _event_callbacks
+    cdef dict _event_coalesce
     cdef int _set_properties_from_keyword_args(self, dict) except 0
 
 cdef class Rectangle(Object):
@@ -938,7 +943,7 @@ cdef class FilledImage(Image):
 
 
 cdef class Polygon(Object):
-    pass
+    cdef object _points
 
 
 cdef class Text(Object):
@@ -1059,6 +1064,7 @@ cdef class EventMouseMove:
     cdef Evas_Event_Mouse_Move *obj
     cdef readonly EventPosition position
     cdef readonly EventPosition prev_position
+    cdef readonly list history
 
     cdef void _set_obj(self, void *ptr)
     cdef void _unset_obj(self)
@@ -1086,6 +1092,7 @@ cdef class EventMultiUp:
 cdef class EventMultiMove:
     cdef Evas_Event_Multi_Move *obj
     cdef readonly EventPrecisionPosition position
+    cdef readonly list history
 
     cdef void _set_obj(self, void *ptr)
     cdef void _unset_obj(self)
@@ -19,13 +19,20 @@ from efl.eina cimport Eina_List
 
 cdef unicode _touni(char* s)
 cdef unicode _ctouni(const char *s)
+cdef unicode _ctouni_cached(const char *s)
+cdef object _tobytes_cached(object s)
 
 cdef list array_of_strings_to_python_list(char **array, int array_length)
 cdef const char ** python_list_strings_to_array_of_strings(list strings) except NULL
 cdef list eina_list_strings_to_python_list(const Eina_List *lst)
 cdef Eina_List * python_list_strings_to_eina_list(list strings)
 cdef list eina_list_objects_to_python_list(const Eina_List *lst)
+ctypedef object (*eina_list_data_conv)(void *data)
+cdef object eina_list_to_python_iterator(Eina_List *lst,
+                                         eina_list_data_conv conv)
+cdef object eina_list_objects_to_python_iterator(Eina_List *lst)
 cdef Eina_List *python_list_objects_to_eina_list(list objects)
 cdef int * python_list_ints_to_array_of_ints(list ints) except NULL
 cdef list array_of_ints_to_python_list(int *array, int array_length)
 cdef double * python_list_doubles_to_array_of_doubles(list doubles) except NULL
+cdef char buffer_format_code(const Py_buffer *view)
@@ -295,6 +295,13 @@ if set(('build', 'build_ext', 'install', 'bdist', 'bdist_wheel', 'sdist')) & set
         extra_compile_args=elm_cflags + common_cflags,
         extra_link_args=elm_libs
     ))
+    # widgets that are loaded on demand
+    for m in ('map', 'photocam', 'video', 'web'):
+        ext_modules.append(Extension(
+            'efl.elementary.' + m, ['efl/elementary/' + m + '.' + MODULES_EXT],
+            extra_compile_args=elm_cflags + common_cflags,
+            extra_link_args=elm_libs
+        ))
     packages.append('efl.elementary')
 
     # Cythonize all ext_modules
@@ -0,0 +1,418 @@
+#!/usr/bin/env python
+"""Report the timings of the optimized code paths.
+
+These are not tests, nothing is checked: each benchmark prints how long
+some operations took, usually with and without the faster API. Run all of
+them, or only the named ones:
+
+    python benchmarks.py [name ...]
+
+"""
+
+import os
+os.environ["ELM_ENGINE"] = "buffer"
+
+import array
+import subprocess
+import sys
+import time
+import logging
+
+
+script_path = os.path.dirname(os.path.realpath(__file__))
+theme_file = os.path.join(script_path, "edje", "theme.edj")
+exe_helper = os.path.join(script_path, "ecore", "exe_helper.sh")
+
+
+def canvas_new():
+    from efl import evas
+
+    canvas = evas.Canvas(method="buffer", size=(400, 500),
+                         viewport=(0, 0, 400, 500))
+    canvas.engine_info_set(canvas.engine_info_get())
+    return canvas
+
+
+def bench_object_construction():
+    from efl import evas
+
+    n = 5000
+    canvas = canvas_new()
+    for cls, kargs in ((evas.Rectangle, {}), (evas.Text, {"text": "MyText"})):
+        t = time.time()
+        objs = [cls(canvas, **kargs) for i in range(n)]
+        t = time.time() - t
+        for o in objs:
+            o.delete()
+        print("%s: %.0f objects/s" % (cls.__name__, n / t))
+    canvas.delete()
+
+
+def bench_objects_count():
+    from efl import evas
+
+    n = 1000
+    canvas = canvas_new()
+    for i in range(100):
+        evas.Rectangle(canvas, geometry=(0, 0, 10, 10)).show()
+
+    t = time.time()
+    for i in range(n):
+        len(canvas.objects_at_xy_get(5, 5))
+    as_list = time.time() - t
+
+    t = time.time()
+    for i in range(n):
+        len(canvas.objects_at_xy_iter(5, 5))
+    as_iter = time.time() - t
+
+    print("%d counts of 100 objects: %.1f ms list, %.1f ms iterator" %
+          (n, as_list * 1000, as_iter * 1000))
+    canvas.delete()
+
+
+def bench_smart_callbacks():
+    from efl import evas
+
+    n, emissions = 100, 1000
+    canvas = canvas_new()
+    obj = evas.SmartObject(canvas, evas.Smart())
+
+    def _event1_cb(obj, event_info):
+        pass
+
+    def _event1_cb_args(obj, event_info, arg):
+        pass
+
+    for i in range(n):
+        obj.callback_add("event1", _event1_cb)
+        obj.callback_add("event2", _event1_cb_args, i)
+
+    for name in ("event1", "event2"):
+        t = time.time()
+        for i in range(emissions):
+            obj.callback_call(name, i)
+        t = time.time() - t
+        print("%d emissions of %s to %d listeners: %.1f ms" % (
+              emissions, name, n, t * 1000))
+    canvas.delete()
+
+
+def bench_smart_move_children():
+    from efl import evas
+
+    class PyMoveSmart(evas.Smart):
+        @staticmethod
+        def move(obj, x, y):
+            ox, oy = obj.pos
+            obj.move_children_relative(x - ox, y - oy)
+
+    class CMoveSmart(evas.Smart):
+        move = evas.Smart.move_children
+
+    n = 2000
+    canvas = canvas_new()
+    times = []
+    for smart in (PyMoveSmart(), CMoveSmart()):
+        objs = []
+        for i in range(n):
+            obj = evas.SmartObject(canvas, smart, geometry=(0, 0, 10, 10))
+            for j in range(4):
+                obj.member_add(evas.Rectangle(canvas, geometry=(j, j, 2, 2)))
+            objs.append(obj)
+        t = time.time()
+        for i, obj in enumerate(objs):
+            obj.move(i % 400, i % 500)
+        times.append(time.time() - t)
+
+    print("moving %d smart objects: %.1f ms, %.1f ms with move_children" % (
+          n, times[0] * 1000, times[1] * 1000))
+    canvas.delete()
+
+
+def bench_line_strip():
+    from efl import evas
+
+    n = 1000
+    canvas = canvas_new()
+    points = [(i % 400, i % 500) for i in range(n + 1)]
+    flat = array.array("i", [c for p in points for c in p])
+    lines = evas.Line.strip_add(canvas, flat)
+
+    t = time.time()
+    for i in range(n):
+        lines[i].xy = points[i] + points[i + 1]
+    one_by_one = time.time() - t
+
+    t = time.time()
+    evas.Line.strip_set(lines, flat)
+    bulk = time.time() - t
+
+    print("%d lines: %.1f ms one by one, %.1f ms with strip_set" % (
+          n, one_by_one * 1000, bulk * 1000))
+    canvas.delete()
+
+
+def bench_polygon_points():
+    from efl import evas
+
+    n = 10000
+    canvas = canvas_new()
+    points = [(i % 400, i % 500) for i in range(n)]
+    flat = array.array("i", [c for p in points for c in p])
+    o = evas.Polygon(canvas)
+
+    t = time.time()
+    o.points_clear()
+    for x, y in points:
+        o.point_add(x, y)
+    one_by_one = time.time() - t
+
+    t = time.time()
+    o.points_set(flat)
+    bulk = time.time() - t
+
+    print("%d points: %.1f ms one by one, %.1f ms with points_set" % (
+          n, one_by_one * 1000, bulk * 1000))
+    canvas.delete()
+
+
+def bench_mouse_moves():
+    from efl import evas
+
+    n = 10000
+    canvas = canvas_new()
+    obj = evas.Rectangle(canvas, geometry=(0, 0, 400, 500))
+    obj.show()
+    canvas.feed_mouse_in(0)
+
+    def cb(obj, event):
+        event.position.canvas.x
+
+    def feed_moves(count, timestamp=1):
+        for i in range(count):
+            canvas.feed_mouse_move(i % 400, i % 500, timestamp + i)
+
+    obj.on_mouse_move_add(cb)
+    t = time.time()
+    feed_moves(n)
+    plain = time.time() - t
+
+    obj.event_coalesce_set(evas.EVAS_CALLBACK_MOUSE_MOVE, True)
+    t = time.time()
+    for i in range(n // 100):
+        feed_moves(100, i * 100)
+        canvas.render()
+    coalesced = time.time() - t
+
+    print("%d mouse moves: %.1f ms, %.1f ms coalesced by 100" % (
+          n, plain * 1000, coalesced * 1000))
+    obj.delete()
+    canvas.delete()
+
+
+def bench_map_apply():
+    from efl import evas
+
+    n = 500
+    canvas = canvas_new()
+    m = evas.Map(4)
+    objs = [evas.Rectangle(canvas, geometry=(0, 0, 10, 10))
+            for i in range(n)]
+    points = [(i % 400, i % 500, 0) for i in range(4 * n)]
+    coords = array.array("i", [c for p in points for c in p])
+
+    t = time.time()
+    for i, o in enumerate(objs):
+        for j in range(4):
+            m.point_coord_set(j, *points[4 * i + j])
+        o.map = m
+        o.map_enabled = True
+    one_by_one = time.time() - t
+
+    t = time.time()
+    m.apply(objs, coords)
+    bulk = time.time() - t
+
+    print("%d maps: %.1f ms one by one, %.1f ms with apply" % (
+          n, one_by_one * 1000, bulk * 1000))
+    canvas.delete()
+
+
+def bench_edje_signals():
+    from efl.edje import Edje
+
+    n = 2000
+    canvas = canvas_new()
+    o = Edje(canvas, file=theme_file, group="main")
+    o.message_signal_process()
+
+    def cb(obj, emission, source):
+        pass
+
+    for i in range(10):
+        o.signal_callback_add("mouse,move", "part%d" % i, cb)
+    o.signal_callback_add("*", "*", cb)
+    o.signal_callback_add("mouse,*", "part*", cb)
+
+    t = time.time()
+    for i in range(n):
+        o.signal_emit("mouse,move", "part%d" % (i % 10))
+    o.message_signal_process()
+    t = time.time() - t
+    print("%d signals: %.1f ms" % (n, t * 1000))
+    o.delete()
+    canvas.delete()
+
+
+def bench_edje_message_buffers():
+    from efl.edje import Edje
+
+    canvas = canvas_new()
+    o = Edje(canvas, file=theme_file, group="main")
+    values = list(range(1000))
+    buf = array.array("i", values)
+
+    t = time.time()
+    for i in range(1000):
+        o.message_send(1, values)
+    as_list = time.time() - t
+
+    t = time.time()
+    for i in range(1000):
+        o.message_send(1, buf)
+    as_buffer = time.time() - t
+    o.message_signal_process()
+
+    print("1000 int sets of 1000: %.1f ms as list, %.1f ms as buffer" %
+          (as_list * 1000, as_buffer * 1000))
+    o.delete()
+    canvas.delete()
+
+
+def bench_elementary_import():
+    def import_time(code):
+        p = subprocess.Popen([sys.executable, "-X", "importtime", "-c", code],
+                             stderr=subprocess.PIPE, universal_newlines=True)
+        err = p.communicate()[1]
+        times = {}
+        for line in err.splitlines():
+            if line.startswith("import time:") and "cumulative" not in line:
+                self_us, cumulative, name = line[12:].split("|")
+                times[name.strip()] = int(cumulative)
+        return times
+
+    lazy_modules = ("efl.edje", "efl.elementary.map",
+                    "efl.elementary.photocam", "efl.elementary.video",
+                    "efl.elementary.web")
+    eager = import_time("from efl import elementary")
+    full = import_time("from efl import elementary, edje\n"
+                       "from efl.elementary import map, photocam, video, web")
+    saved = sum(full.get(m, 0) for m in lazy_modules)
+    print("import efl.elementary: %.1f ms (%.1f ms deferred)" % (
+          eager.get("efl.elementary", 0) / 1000.0, saved / 1000.0))
+
+
+def bench_genlist_item_memory():
+    import tracemalloc
+    from efl import elementary as elm
+
+    n = 10000
+    win = elm.Window("t", elm.ELM_WIN_BASIC)
+    gl = elm.Genlist(win)
+    itc = elm.GenlistItemClass(item_style="default")
+
+    def bytes_per_item(func):
+        tracemalloc.start()
+        try:
+            before = tracemalloc.take_snapshot()
+            keep = func()
+            after = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+        size = sum(s.size_diff for s in after.compare_to(before, "filename"))
+        del keep
+        return size / float(n)
+
+    def create():
+        return [elm.GenlistItem(itc, None) for i in range(n)]
+
+    def create_with_data():
+        items = create()
+        for it in items:
+            it.data
+        return items
+
+    lazy = bytes_per_item(create)
+    eager = bytes_per_item(create_with_data)
+    appended = bytes_per_item(lambda: gl.items_extend(itc, [None] * n))
+    print("GenlistItem: %d bytes, %d bytes with data dict, "
+          "%d bytes appended" % (lazy, eager, appended))
+    win.delete()
+
+
+def bench_log_messages():
+    from efl.utils import logger
+
+    n = 100000
+    log = logging.getLogger("efl")
+    level = log.level
+    handler = logging.NullHandler()
+    log.addHandler(handler)
+    log.setLevel(logging.DEBUG)
+
+    t = time.time()
+    for i in range(n):
+        logger.logger_test_dbg()
+    handled = time.time() - t
+
+    log.setLevel(logging.INFO)
+    t = time.time()
+    for i in range(n):
+        logger.logger_test_dbg()
+    dropped = time.time() - t
+    log.setLevel(level)
+    log.removeHandler(handler)
+
+    print("%d debug messages: %.1f ms handled, %.1f ms dropped" % (
+          n, handled * 1000, dropped * 1000))
+
+
+def bench_exe_children():
+    from efl import ecore
+
+    n = 50
+    flags = ecore.ECORE_EXE_PIPE_READ | \
+        ecore.ECORE_EXE_PIPE_READ_LINE_BUFFERED | \
+        ecore.ECORE_EXE_TERM_WITH_PARENT
+    alive = [n]
+
+    def on_data(exe, event):
+        event.lines
+
+    def on_del(exe, event):
+        alive[0] -= 1
+        if alive[0] == 0:
+            ecore.main_loop_quit()
+
+    t = time.time()
+    for i in range(n):
+        exe = ecore.Exe("%s 0.0" % exe_helper, flags)
+        exe.on_data_event_add(on_data)
+        exe.on_del_event_add(on_del)
+
+    timeout = ecore.timer_add(30, ecore.main_loop_quit)
+    ecore.main_loop_begin()
+    timeout.delete()
+    t = time.time() - t
+    print("%d children of 1000 lines: %.1f ms" % (n, t * 1000))
+
+
+if __name__ == '__main__':
+    benchmarks = [(name[6:], func) for name, func in sorted(globals().items())
+                  if name.startswith("bench_")]
+    names = sys.argv[1:]
+    for name, func in benchmarks:
+        if not names or name in names:
+            sys.stdout.write("%s: " % name)
+            func()
@@ -5,6 +5,7 @@ import os
 import unittest
 import logging
 import subprocess
+import tempfile
 
 from efl import ecore
 
@@ -192,6 +193,209 @@ class TestExe(unittest.TestCase):
         self.assertEqual(self.num_data, 8)
 
 
+class TestExeMany(unittest.TestCase):
+    def testManyChildren(self):
+        n = 50
+        lines = {}
+        self.alive = n
+
+        def on_data(exe, event):
+            lines[exe] += len(event.lines)
+
+        def on_del(exe, event):
+            self.alive -= 1
+            if self.alive == 0:
+                ecore.main_loop_quit()
+
+        for i in range(n):
+            exe = ecore.Exe("%s 0.0" % helper, flags)
+            lines[exe] = 0
+            exe.on_data_event_add(on_data)
+            exe.on_del_event_add(on_del)
+
+        timeout = ecore.timer_add(30, ecore.main_loop_quit)
+        ecore.main_loop_begin()
+        timeout.delete()
+
+        self.assertEqual(self.alive, 0)
+        self.assertEqual(list(lines.values()), [1000] * n)
+
+
+class TestExeBinary(unittest.TestCase):
+    # the callbacks only record, their exceptions would be swallowed
+
+    def testBinaryOutput(self):
+        expected = b"\x00\xff\xfe\x80abc\n"
+        self.received = bytearray()
+        self.checks = []
+        self.views = []
+        self.events = []
+        buf = bytearray(4096)
+
+        def on_data(exe, event):
+            n = event.readinto(buf)
+            self.received += buf[:n]
+            self.views.append(memoryview(event))
+            self.checks.append((event.size, event.bytes, event.data,
+                                event.lines))
+            self.events.append(event)
+
+        def on_del(exe, event):
+            ecore.main_loop_quit()
+
+        exe = ecore.Exe(r"printf '\000\377\376\200abc\n'",
+                        ecore.ECORE_EXE_PIPE_READ |
+                        ecore.ECORE_EXE_TERM_WITH_PARENT)
+        exe.on_data_event_add(on_data)
+        exe.on_del_event_add(on_del)
+
+        t = ecore.timer_add(5, ecore.main_loop_quit)
+        ecore.main_loop_begin()
+        t.delete()
+
+        self.assertEqual(bytes(self.received), expected)
+        self.assertTrue(self.events)
+        for size, data, text, lines in self.checks:
+            self.assertEqual(size, len(data))
+            self.assertIsInstance(text, type(u""))
+            self.assertEqual(text, data.decode("UTF-8", "replace"))
+            self.assertEqual(lines, [])
+
+        # the views and the values read during the callback are kept
+        self.assertEqual(b"".join(v.tobytes() for v in self.views), expected)
+        event = self.events[0]
+        self.assertEqual(event.bytes, expected[:event.size])
+        self.assertEqual(memoryview(event).tobytes(), event.bytes)
+        # what needs the C event is gone
+        self.assertRaises(ValueError, event.readinto, buf)
+
+    def testReadintoTooSmall(self):
+        self.errors = []
+
+        def readinto(event, *args):
+            try:
+                event.readinto(*args)
+            except Exception as e:
+                return type(e)
+
+        def on_data(exe, event):
+            self.errors.append((readinto(event, bytearray(1)),
+                                readinto(event, bytearray(event.size), 1),
+                                readinto(event, b"readonly")))
+
+        def on_del(exe, event):
+            ecore.main_loop_quit()
+
+        exe = ecore.Exe("echo abc", flags)
+        exe.on_data_event_add(on_data)
+        exe.on_del_event_add(on_del)
+
+        t = ecore.timer_add(5, ecore.main_loop_quit)
+        ecore.main_loop_begin()
+        t.delete()
+
+        self.assertTrue(self.errors)
+        for errors in self.errors:
+            self.assertEqual(errors, (ValueError, ValueError, TypeError))
+
+
+class TestExeStdinStream(unittest.TestCase):
+    def run_wc(self, feed):
+        # wc -c reports the number of bytes the child read from stdin
+        self.output = b""
+
+        def on_data(exe, event):
+            self.output += event.bytes
+
+        def on_del(exe, event):
+            ecore.main_loop_quit()
+
+        exe = ecore.Exe("wc -c", ecore.ECORE_EXE_PIPE_READ |
+                        ecore.ECORE_EXE_TERM_WITH_PARENT, stdin_stream=True)
+        exe.on_data_event_add(on_data)
+        exe.on_del_event_add(on_del)
+        feed(exe)
+
+        t = ecore.timer_add(10, ecore.main_loop_quit)
+        ecore.main_loop_begin()
+        t.delete()
+        return int(self.output)
+
+    def testWatermarks(self):
+        chunk = b"x" * 4096
+        self.written = 0
+        self.drains = 0
+        self.max_pending = 0
+        self.drain_pending = []
+
+        def on_drain(exe):
+            self.drains += 1
+            self.drain_pending.append(exe.stdin_pending)
+            fill(exe)
+
+        def fill(exe):
+            while self.written < 4 * 1024 * 1024:
+                self.written += len(chunk)
+                more = exe.write(chunk)
+                self.max_pending = max(self.max_pending, exe.stdin_pending)
+                if not more:
+                    return
+            exe.close_stdin()
+
+        def feed(exe):
+            exe.stdin_watermarks = (32768, 8192)
+            self.assertEqual(exe.stdin_watermarks_get(), (32768, 8192))
+            exe.on_drain_event_add(on_drain)
+            fill(exe)
+
+        self.assertEqual(self.run_wc(feed), 4 * 1024 * 1024)
+        self.assertGreater(self.drains, 0)
+        self.assertLessEqual(max(self.drain_pending), 8192)
+        self.assertLessEqual(self.max_pending, 32768)
+
+    def testSendFile(self):
+        self.drains = 0
+        f = tempfile.NamedTemporaryFile()
+        f.write(b"0123456789" * 100000)
+        f.flush()
+
+        def on_drain(exe):
+            self.drains += 1
+            exe.close_stdin()
+
+        def feed(exe):
+            exe.on_drain_event_add(on_drain)
+            exe.send(b"abc")
+            exe.send_file(f.name)
+            # sent from the current position
+            f.seek(0)
+            exe.send_file(f)
+            self.assertLessEqual(exe.stdin_pending, 3)
+
+        self.assertEqual(self.run_wc(feed), 2000003)
+        self.assertEqual(self.drains, 1)
+        f.close()
+
+    def testInvalid(self):
+        self.assertRaises(ValueError, ecore.Exe, "cat",
+                          ecore.ECORE_EXE_PIPE_WRITE, stdin_stream=True)
+        exe = ecore.Exe("true")
+        self.assertRaises(ValueError, exe.write, b"abc")
+        self.assertRaises(ValueError, exe.send_file, "/dev/null")
+        self.assertRaises(ValueError, exe.stdin_watermarks_set, 10, 20)
+        exe.kill()
+
+        # only regular files, reading a pipe could block the main loop
+        exe = ecore.Exe("cat", ecore.ECORE_EXE_TERM_WITH_PARENT,
+                        stdin_stream=True)
+        r, w = os.pipe()
+        self.assertRaises(ValueError, exe.send_file, r)
+        os.close(r)
+        os.close(w)
+        self.assertEqual(exe.cmd, b"cat")
+        exe.close_stdin()
+
+
 if __name__ == '__main__':
     formatter = logging.Formatter("[%(levelname)s] %(name)s (%(filename)s: %(lineno)d) --- %(message)s")
     handler = logging.StreamHandler()
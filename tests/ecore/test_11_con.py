@@ -4,12 +4,55 @@ import unittest
 import os
 import tempfile
 import logging
+import threading
+try:
+    from http.server import HTTPServer, BaseHTTPRequestHandler
+except ImportError:
+    from BaseHTTPServer import HTTPServer, BaseHTTPRequestHandler
 
 from efl import ecore, ecore_con
 
 
 TIMEOUT = 5.0 # seconds
 
+CONTENT = bytes(bytearray(range(256))) * 4096 # 1 MiB
+
+
+class LocalHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(CONTENT)))
+        self.end_headers()
+        self.wfile.write(CONTENT)
+
+    def log_message(self, *args):
+        pass
+
+
+class PathHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = self.path.encode("ascii")
+        self.send_response(404 if self.path == "/missing" else 200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class LocalServer(object):
+    def __init__(self, handler=LocalHandler):
+        self.server = HTTPServer(("127.0.0.1", 0), handler)
+        self.url = "http://127.0.0.1:%d/" % self.server.server_address[1]
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
 class TestCon(unittest.TestCase):
 
     def testLookup(self):
@@ -176,6 +219,219 @@ class TestCon(unittest.TestCase):
         self.assertEqual(u.status_code, 200) # assume net is ok
         u.delete()
 
+class TestUrlStreaming(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = LocalServer()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.close()
+
+    def run_url(self, u):
+        self.status = None
+
+        def _on_complete(event):
+            self.status = event.status
+            ecore.main_loop_quit()
+
+        u.on_complete_event_add(_on_complete)
+        t = ecore.Timer(TIMEOUT, ecore.main_loop_quit)
+        ecore.main_loop_begin()
+        t.delete()
+        self.assertEqual(self.status, 200)
+
+    def testGetToFile(self):
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        u = ecore_con.Url(self.server.url)
+        u.on_data_event_add(self.fail)
+        self.assertTrue(u.get_to_file(path))
+        # the running download is not redirected
+        self.assertRaises(ValueError, u.get_to_file, path + ".2")
+        self.assertFalse(os.path.exists(path + ".2"))
+        self.run_url(u)
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), CONTENT)
+        os.unlink(path)
+        u.delete()
+
+    def testGetInto(self):
+        buf = bytearray(len(CONTENT) + 16)
+        u = ecore_con.Url(self.server.url)
+        self.assertTrue(u.get_into(buf, 16))
+        self.assertRaises(ValueError, u.get_into, bytearray(10))
+        self.run_url(u)
+        self.assertEqual(bytes(buf[16:]), CONTENT)
+
+        # what doesn't fit is discarded
+        small = bytearray(1000)
+        self.assertTrue(u.get_into(small))
+        self.run_url(u)
+        self.assertEqual(bytes(small), CONTENT[:1000])
+        self.assertEqual(u.received_bytes, len(CONTENT))
+        u.delete()
+
+    def testGetChunks(self):
+        u = ecore_con.Url(self.server.url)
+        chunks = list(u.get_chunks(100000))
+        self.assertEqual(b"".join(chunks), CONTENT)
+        self.assertEqual(chunks[-1], CONTENT[-len(chunks[-1]):])
+        for chunk in chunks[:-1]:
+            self.assertGreaterEqual(len(chunk), 100000)
+        self.assertEqual(u.status_code, 200)
+        u.delete()
+
+    def testDataEvent(self):
+        self.received = []
+        self.views = []
+
+        def _on_data(event):
+            self.views.append(memoryview(event))
+            self.received.append(event)
+
+        u = ecore_con.Url(self.server.url)
+        u.on_data_event_add(_on_data)
+        self.assertTrue(u.get())
+        self.run_url(u)
+        # the views stay valid after the callbacks
+        self.assertEqual(b"".join(v.tobytes() for v in self.views), CONTENT)
+        self.assertEqual(b"".join(e.data for e in self.received), CONTENT)
+        u.delete()
+
+    def testProgressInterval(self):
+        self.progress = []
+
+        def _on_progress(event):
+            self.progress.append(event.down_now)
+
+        u = ecore_con.Url(self.server.url, progress_interval=60.0)
+        self.assertEqual(u.progress_interval, 60.0)
+        u.on_progress_event_add(_on_progress)
+        self.assertTrue(u.get())
+        self.run_url(u)
+        self.assertLessEqual(len(self.progress), 3)
+        u.delete()
+
+
+class TestUrlPool(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = LocalServer(PathHandler)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.close()
+
+    def setUp(self):
+        self.done = []
+        self.active = []
+
+    def run_pool(self, pool):
+        def _check():
+            if pool.active == 0 and pool.queued == 0:
+                ecore.main_loop_quit()
+                return False
+            return True
+
+        ecore.Timer(0.01, _check)
+        t = ecore.Timer(TIMEOUT, ecore.main_loop_quit)
+        ecore.main_loop_begin()
+        t.delete()
+
+    def _on_done(self, request, pool, n):
+        # checked after the main loop, failures here would be swallowed
+        self.active.append(pool.active)
+        self.done.append((n, request.status, request.data))
+
+    def testMany(self):
+        pool = ecore_con.UrlPool(max_active=3, timeout=TIMEOUT)
+        requests = [pool.get(self.server.url + "item/%d" % i,
+                             self._on_done, pool, i) for i in range(50)]
+        self.assertEqual(pool.active, 3)
+        self.assertEqual(pool.queued, 47)
+        self.run_pool(pool)
+
+        self.assertEqual(len(self.done), 50)
+        self.assertLessEqual(max(self.active), 3)
+        for n, status, data in self.done:
+            self.assertEqual(status, 200)
+            self.assertEqual(data, ("/item/%d" % n).encode("ascii"))
+        self.assertTrue(all(r.done for r in requests))
+        self.assertEqual(pool.completed, 50)
+        self.assertEqual(pool.failed, 0)
+        self.assertEqual(pool.bytes_received,
+                         sum(len(d) for n, s, d in self.done))
+        self.assertGreater(pool.bytes_per_second, 0)
+        pool.close()
+
+    def testPriorities(self):
+        pool = ecore_con.UrlPool(max_active=1)
+        pool.get(self.server.url + "first", self._on_done, pool, 0)
+        for i, prio in enumerate([1, 5, 1, 3, 5]):
+            pool.get(self.server.url + "p", self._on_done, pool, i + 1,
+                     priority=prio)
+        self.run_pool(pool)
+        self.assertEqual([n for n, s, d in self.done], [0, 2, 5, 4, 1, 3])
+        pool.close()
+
+    def testCancelAndFailure(self):
+        pool = ecore_con.UrlPool(max_active=1)
+        r1 = pool.get(self.server.url + "missing", self._on_done, pool, 1)
+        r2 = pool.get(self.server.url + "cancelled", self._on_done, pool, 2)
+        r3 = pool.get(self.server.url + "ok", self._on_done, pool, 3)
+        self.assertTrue(r2.cancel())
+        self.assertFalse(r2.cancel())
+        self.assertEqual(pool.queued, 1)
+        self.run_pool(pool)
+
+        self.assertEqual([(n, s) for n, s, d in self.done],
+                         [(1, 404), (3, 200)])
+        self.assertTrue(r2.cancelled)
+        self.assertIsNone(r2.data)
+        self.assertEqual((pool.completed, pool.failed), (1, 1))
+
+        r4 = pool.get(self.server.url + "aborted", self._on_done, pool, 4)
+        self.assertEqual(pool.active, 1)
+        self.assertTrue(r4.cancel())
+        self.assertEqual(pool.active, 0)
+        pool.close()
+        self.assertRaises(ValueError, pool.get, self.server.url)
+
+    def testCancelFromNextRequest(self):
+        pool = ecore_con.UrlPool(max_active=1)
+        r1 = pool.get(self.server.url + "ok", self._on_done, pool, 1)
+
+        def _on_failed(request):
+            # called while r1 finishes, its handle can't take this url
+            self.done.append((2, request.status, r1.cancel()))
+
+        pool.get(1234, _on_failed)
+        self.run_pool(pool)
+        self.assertEqual([(n, s) for n, s, d in self.done],
+                         [(2, 0), (1, 200)])
+        self.assertFalse(self.done[0][2])
+        self.assertTrue(r1.done)
+        self.assertFalse(r1.cancelled)
+        pool.close()
+
+    def testUrlFailure(self):
+        self.assertRaises(AttributeError, ecore_con.UrlPool,
+                          no_such_property=1)
+        # the Url of the requests can't be set up, they fail at once
+        pool = ecore_con.UrlPool(max_active=2, timeout="soon")
+        requests = [pool.get(self.server.url, self._on_done, pool, i)
+                    for i in range(5)]
+        self.assertTrue(all(r.done for r in requests))
+        self.assertEqual([(n, s) for n, s, d in self.done],
+                         [(i, 0) for i in range(5)])
+        self.assertEqual((pool.completed, pool.failed), (0, 5))
+        self.assertEqual((pool.active, pool.queued), (0, 0))
+        pool.close()
+
+
 if __name__ == '__main__':
     formatter = logging.Formatter("[%(levelname)s] %(name)s (%(filename)s: %(lineno)d) --- %(message)s")
     handler = logging.StreamHandler()
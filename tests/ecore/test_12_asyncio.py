@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+
+import os
+import time
+import asyncio
+import threading
+import unittest
+import logging
+
+from efl import ecore, ecore_con
+from efl.ecore_asyncio import EcoreEventLoop, EcoreEventLoopPolicy
+
+
+class TestAsyncio(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = EcoreEventLoop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        asyncio.set_event_loop(None)
+        self.loop.close()
+
+    def testPolicy(self):
+        policy = EcoreEventLoopPolicy()
+        loop = policy.new_event_loop()
+        self.assertIsInstance(loop, EcoreEventLoop)
+        loop.close()
+
+    def testSelectorNotPolled(self):
+        # ready fds are dispatched by ecore, the base class must not poll
+        self.assertRaises(RuntimeError, self.loop._selector.select, 0)
+
+    def testCallSoonAndLater(self):
+        calls = []
+        self.loop.call_later(0.1, calls.append, "later")
+        self.loop.call_later(0.2, self.loop.stop)
+        h = self.loop.call_later(0.05, calls.append, "cancelled")
+        self.loop.call_soon(calls.append, "soon")
+        h.cancel()
+
+        t = time.time()
+        self.loop.run_forever()
+        self.assertGreaterEqual(time.time() - t, 0.2)
+        self.assertEqual(calls, ["soon", "later"])
+
+    def testEcoreCallbacks(self):
+        # ecore primitives and coroutines run in the same loop
+        async def main():
+            fut = self.loop.create_future()
+            ecore.Timer(0.05, lambda: fut.set_result("timer") and False)
+            return await fut
+
+        self.assertEqual(self.loop.run_until_complete(main()), "timer")
+
+    def testReaderAndThreadsafe(self):
+        rfd, wfd = os.pipe()
+
+        async def main():
+            fut = self.loop.create_future()
+            self.loop.add_reader(rfd, lambda: fut.set_result(os.read(rfd, 32)))
+            threading.Thread(target=os.write, args=(wfd, b"data")).start()
+            data = await fut
+            self.loop.remove_reader(rfd)
+
+            fut = self.loop.create_future()
+            threading.Thread(
+                target=self.loop.call_soon_threadsafe,
+                args=(fut.set_result, "thread")).start()
+            return data, await fut
+
+        result = self.loop.run_until_complete(main())
+        self.assertEqual(result, (b"data", "thread"))
+        os.close(rfd)
+        os.close(wfd)
+
+    def testSocket(self):
+        async def handler(reader, writer):
+            writer.write(await reader.readline())
+            await writer.drain()
+            writer.close()
+
+        async def main():
+            server = await asyncio.start_server(handler, "127.0.0.1", 0)
+            reader, writer = await asyncio.open_connection(
+                *server.sockets[0].getsockname())
+            writer.write(b"hello\n")
+            line = await reader.readline()
+            writer.close()
+            server.close()
+            await server.wait_closed()
+            return line
+
+        self.assertEqual(self.loop.run_until_complete(main()), b"hello\n")
+
+
+    def testExeDrain(self):
+        chunk = b"x" * 8192
+
+        async def main():
+            done = self.loop.create_future()
+            output = []
+            exe = ecore.Exe("wc -c", ecore.ECORE_EXE_PIPE_READ,
+                            stdin_stream=True)
+            exe.on_data_event_add(lambda exe, ev: output.append(ev.bytes))
+            exe.on_del_event_add(lambda exe, ev: done.set_result(None))
+            for i in range(128):
+                if not exe.write(chunk):
+                    await exe.drain()
+            exe.close_stdin()
+            await done
+            return int(b"".join(output))
+
+        self.assertEqual(self.loop.run_until_complete(main()), 128 * 8192)
+
+
+    def testUrlChunks(self):
+        content = b"0123456789" * 50000
+
+        async def handler(reader, writer):
+            await reader.readuntil(b"\r\n\r\n")
+            writer.write(b"HTTP/1.0 200 OK\r\nContent-Length: %d\r\n\r\n"
+                         % len(content))
+            writer.write(content)
+            await writer.drain()
+            writer.close()
+
+        async def main():
+            server = await asyncio.start_server(handler, "127.0.0.1", 0)
+            u = ecore_con.Url("http://127.0.0.1:%d/" %
+                              server.sockets[0].getsockname()[1])
+            chunks = []
+            async for chunk in u.get_chunks(65536):
+                chunks.append(chunk)
+            u.delete()
+            server.close()
+            return chunks
+
+        chunks = self.loop.run_until_complete(main())
+        self.assertEqual(b"".join(chunks), content)
+        self.assertTrue(all(len(c) >= 65536 for c in chunks[:-1]))
+
+
+    def testUrlPool(self):
+        async def handler(reader, writer):
+            line = await reader.readline()
+            await reader.readuntil(b"\r\n\r\n")
+            body = line.split()[1]
+            writer.write(b"HTTP/1.0 200 OK\r\nContent-Length: %d\r\n\r\n"
+                         % len(body) + body)
+            await writer.drain()
+            writer.close()
+
+        async def main():
+            server = await asyncio.start_server(handler, "127.0.0.1", 0)
+            base = "http://127.0.0.1:%d/" % server.sockets[0].getsockname()[1]
+            pool = ecore_con.UrlPool(max_active=4)
+            requests = [pool.get(base + str(i)) for i in range(20)]
+            done = await asyncio.gather(*requests)
+            pool.close()
+            server.close()
+            return [r.data for r in done]
+
+        self.assertEqual(self.loop.run_until_complete(main()),
+                         [("/%d" % i).encode() for i in range(20)])
+
+
+if __name__ == '__main__':
+    formatter = logging.Formatter("[%(levelname)s] %(name)s (%(filename)s: %(lineno)d) --- %(message)s")
+    handler = logging.StreamHandler()
+    handler.setFormatter(formatter)
+    efllog = logging.getLogger("efl")
+    efllog.addHandler(handler)
+    efllog.setLevel(logging.DEBUG)
+    unittest.main(verbosity=2)
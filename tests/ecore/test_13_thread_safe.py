@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+
+import threading
+import unittest
+import logging
+
+from efl import ecore
+
+
+class TestThreadSafeCalls(unittest.TestCase):
+
+    def testCallAsync(self):
+        main_thread = threading.current_thread()
+        calls = []
+
+        def cb(n, a=None):
+            self.assertIs(threading.current_thread(), main_thread)
+            calls.append((n, a))
+            if len(calls) == 100:
+                ecore.main_loop_quit()
+
+        def worker():
+            for i in range(100):
+                ecore.call_async(cb, i, a="x")
+
+        t = threading.Thread(target=worker)
+        ecore.Timer(0.01, t.start)
+        timeout = ecore.Timer(2.0, ecore.main_loop_quit)
+        ecore.main_loop_begin()
+        timeout.delete()
+        t.join()
+
+        self.assertEqual(calls, [(i, "x") for i in range(100)])
+
+    def testCallSync(self):
+        results = []
+
+        def worker():
+            results.append(ecore.call_sync(lambda a, b: a + b, 1, b=2))
+            try:
+                ecore.call_sync(int, "not a number")
+            except ValueError:
+                results.append("raised")
+            ecore.call_async(ecore.main_loop_quit)
+
+        t = threading.Thread(target=worker)
+        ecore.Timer(0.01, t.start)
+        timeout = ecore.Timer(2.0, ecore.main_loop_quit)
+        ecore.main_loop_begin()
+        timeout.delete()
+        t.join()
+
+        self.assertEqual(results, [3, "raised"])
+
+    def testExecutor(self):
+        main_thread = threading.current_thread()
+        pool = ecore.ThreadPoolExecutor(max_workers=4)
+        results = []
+
+        def done(f):
+            self.assertIs(threading.current_thread(), main_thread)
+            results.append(f.result())
+            if len(results) == 10:
+                ecore.main_loop_quit()
+
+        for i in range(10):
+            pool.submit(pow, i, 2).add_done_callback(done)
+
+        timeout = ecore.Timer(2.0, ecore.main_loop_quit)
+        ecore.main_loop_begin()
+        timeout.delete()
+        pool.shutdown()
+
+        self.assertEqual(sorted(results), [i * i for i in range(10)])
+
+
+if __name__ == '__main__':
+    formatter = logging.Formatter("[%(levelname)s] %(name)s (%(filename)s: %(lineno)d) --- %(message)s")
+    handler = logging.StreamHandler()
+    handler.setFormatter(formatter)
+    efllog = logging.getLogger("efl")
+    efllog.addHandler(handler)
+    efllog.setLevel(logging.DEBUG)
+    unittest.main(verbosity=2)
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+
+import unittest
+import logging
+import time
+
+from efl import ecore
+from efl.utils import logger
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class TestLogger(unittest.TestCase):
+
+    def setUp(self):
+        self.log = logging.getLogger("efl")
+        self.level = self.log.level
+        self.handler = ListHandler()
+        self.log.addHandler(self.handler)
+        self.log.setLevel(logging.DEBUG)
+
+    def tearDown(self):
+        logger.async_mode_set(False)
+        self.log.removeHandler(self.handler)
+        self.log.setLevel(self.level)
+
+    def testLevels(self):
+        logger.logger_test_dbg()
+        self.assertEqual(len(self.handler.records), 1)
+        rec = self.handler.records[0]
+        self.assertEqual(rec.levelno, logging.DEBUG)
+        self.assertEqual(rec.getMessage(), "test message")
+
+        self.log.setLevel(logging.INFO)
+        logger.logger_test_dbg()
+        self.assertEqual(len(self.handler.records), 1)
+
+    def testAsync(self):
+        logger.async_mode_set(True)
+        self.assertTrue(logger.async_mode_get())
+        t = time.time()
+        logger.logger_test_dbg()
+        logger.logger_test_dbg()
+        self.assertEqual(self.handler.records, [])
+
+        ecore.Timer(0.01, ecore.main_loop_quit)
+        ecore.main_loop_begin()
+        self.assertEqual(len(self.handler.records), 2)
+        self.assertGreaterEqual(self.handler.records[0].created, t)
+        self.assertLess(self.handler.records[0].created, t + 0.01)
+        r0, r1 = self.handler.records
+        self.assertAlmostEqual(r1.relativeCreated - r0.relativeCreated,
+                               (r1.created - r0.created) * 1000, places=3)
+
+        # disabling handles the pending records
+        logger.logger_test_dbg()
+        logger.async_mode_set(False)
+        self.assertEqual(len(self.handler.records), 3)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+
+from efl import evas
+from efl import ecore
+from efl import edje
+from efl.edje import Edje
+
+import os, unittest
+
+
+theme_path = os.path.dirname(os.path.abspath(__file__))
+theme_file = os.path.join(theme_path, "theme.edj")
+
+
+class CachedEdje(Edje):
+    def __init__(self, canvas, received):
+        self.received = received
+        Edje.__init__(self, canvas, file=theme_file, group="main")
+
+    @edje.on_signal("test,one", "*")
+    def cb_one(self, emission, source):
+        self.received.append(emission)
+
+
+def iterate(n=10):
+    for i in range(n):
+        ecore.main_loop_iterate()
+
+
+class TestEdjeDecoratorsCache(unittest.TestCase):
+    def setUp(self):
+        self.canvas = evas.Canvas(method="buffer",
+                                  size=(400, 500),
+                                  viewport=(0, 0, 400, 500))
+        self.canvas.engine_info_set(self.canvas.engine_info_get())
+
+    def tearDown(self):
+        self.canvas.delete()
+
+    def emit(self, o, emission):
+        o.signal_emit(emission, "")
+        iterate()
+
+    def testManyInstances(self):
+        received = []
+        objs = [CachedEdje(self.canvas, received) for i in range(3)]
+        for o in objs:
+            self.emit(o, "test,one")
+        self.assertEqual(received, ["test,one"] * 3)
+        for o in objs:
+            o.delete()
+
+    def testClassChanged(self):
+        received = []
+        o = CachedEdje(self.canvas, received)
+        o.delete()
+
+        # a decorated method added later is used by the next instances
+        def cb_two(self, emission, source):
+            self.received.append(emission)
+        CachedEdje.cb_two = edje.on_signal("test,two", "*")(cb_two)
+        try:
+            o = CachedEdje(self.canvas, received)
+            self.emit(o, "test,one")
+            self.emit(o, "test,two")
+            o.delete()
+        finally:
+            del CachedEdje.cb_two
+
+        self.assertEqual(received, ["test,one", "test,two"])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+
+from efl import evas
+from efl import edje
+from efl.edje import Edje
+
+import os, unittest
+
+
+theme_path = os.path.dirname(os.path.abspath(__file__))
+theme_file = os.path.join(theme_path, "theme.edj")
+
+
+class TestEdjeSignals(unittest.TestCase):
+    def setUp(self):
+        self.canvas = evas.Canvas(method="buffer",
+                                  size=(400, 500),
+                                  viewport=(0, 0, 400, 500))
+        self.canvas.engine_info_set(self.canvas.engine_info_get())
+        self.o = Edje(self.canvas, file=theme_file, group="main")
+        self.o.message_signal_process()
+        self.received = []
+
+    def tearDown(self):
+        self.o.delete()
+        self.canvas.delete()
+
+    def cb(self, obj, emission, source, *args):
+        self.assertIs(obj, self.o)
+        self.received.append((emission, source) + args)
+
+    def emit(self, emission, source):
+        self.o.signal_emit(emission, source)
+        self.o.message_signal_process()
+
+    def testExact(self):
+        self.o.signal_callback_add("test,one", "src", self.cb, 1)
+        self.emit("test,one", "src")
+        self.emit("test,one", "other")
+        self.emit("test,two", "src")
+        self.assertEqual(self.received, [("test,one", "src", 1)])
+
+    def testGlob(self):
+        self.o.signal_callback_add("test,*", "*", self.cb, "star")
+        self.o.signal_callback_add("test,?", "s[rx]c", self.cb, "chars")
+        self.emit("test,one", "src")
+        self.emit("test,a", "src")
+        self.emit("test,a", "sxc")
+        self.emit("other", "src")
+        self.assertEqual(self.received, [
+            ("test,one", "src", "star"),
+            ("test,a", "src", "star"), ("test,a", "src", "chars"),
+            ("test,a", "sxc", "star"), ("test,a", "sxc", "chars")])
+
+    def testDel(self):
+        self.o.signal_callback_add("test,*", "*", self.cb)
+        self.o.signal_callback_add("test,one", "", self.cb)
+        self.emit("test,one", "")
+        self.assertEqual(len(self.received), 2)
+
+        self.o.signal_callback_del("test,*", "*", self.cb)
+        self.emit("test,one", "")
+        self.assertEqual(len(self.received), 3)
+
+        self.o.signal_callback_del("test,one", "", self.cb)
+        self.emit("test,one", "")
+        self.assertEqual(len(self.received), 3)
+        self.assertRaises(ValueError, self.o.signal_callback_del,
+                          "test,one", "", self.cb)
+
+    def testDelInCallback(self):
+        def cb1(obj, emission, source):
+            self.received.append(1)
+            obj.signal_callback_del("*", "*", cb1)
+
+        def cb2(obj, emission, source):
+            self.received.append(2)
+
+        self.o.signal_callback_add("*", "*", cb1)
+        self.o.signal_callback_add("*", "*", cb2)
+        self.emit("test", "")
+        self.emit("test", "")
+        self.assertEqual(self.received, [1, 2, 2])
+
+    def testStringsReused(self):
+        def cb(obj, emission, source):
+            self.received.append((emission, source))
+
+        self.o.signal_callback_add("test,one", "src", cb)
+        self.emit("test,one", "src")
+        self.emit(u"test,one", u"src")
+        (e1, s1), (e2, s2) = self.received
+        self.assertEqual((e1, s1), ("test,one", "src"))
+        self.assertIs(e1, e2)
+        self.assertIs(s1, s2)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
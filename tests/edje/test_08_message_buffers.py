@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+
+from efl import evas
+from efl.edje import Edje
+
+import os, unittest
+import array
+import shutil
+import subprocess
+import tempfile
+
+
+theme_path = os.path.dirname(os.path.abspath(__file__))
+theme_file = os.path.join(theme_path, "theme.edj")
+
+# a theme sending number sets back to the application
+sets_edc = """
+collections {
+    group { name: "main";
+        parts {
+            part { name: "bg";
+                type: RECT;
+                description { state: "default" 0.0; }
+            }
+        }
+        programs {
+            program { name: "send_sets";
+                signal: "send,sets";
+                script {
+                    send_message(MSG_INT_SET, 1, 1, -2, 3);
+                    send_message(MSG_FLOAT_SET, 2, 0.5, 1.5, -2.0);
+                    send_message(MSG_STRING_INT_SET, 3, "str", 4, 5);
+                }
+            }
+        }
+    }
+}
+"""
+
+
+class TestEdjeMessageBuffers(unittest.TestCase):
+    def setUp(self):
+        self.canvas = evas.Canvas(method="buffer",
+                                  size=(400, 500),
+                                  viewport=(0, 0, 400, 500))
+        self.canvas.engine_info_set(self.canvas.engine_info_get())
+        self.o = Edje(self.canvas, file=theme_file, group="main")
+
+    def tearDown(self):
+        self.o.delete()
+        self.canvas.delete()
+
+    def testSendArrays(self):
+        self.o.message_send(1, array.array("i", range(10)))
+        self.o.message_send(1, array.array("d", [0.5] * 10))
+        self.o.message_send(1, memoryview(array.array("i", [1, 2, 3])))
+        self.o.message_send(1, array.array("i"))
+        self.o.message_signal_process()
+
+    def testSendInvalid(self):
+        self.assertRaises(TypeError, self.o.message_send, 1,
+                          array.array("h", [1, 2]))
+        self.assertRaises(TypeError, self.o.message_send, 1,
+                          array.array("f", [1.0, 2.0]))
+        self.assertRaises(TypeError, self.o.message_send, 1, b"bytes")
+        self.assertRaises(TypeError, self.o.message_send, 1,
+                          bytearray(b"bytes"))
+
+
+class TestEdjeMessageReceive(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.mkdtemp()
+        edc = os.path.join(cls.tmpdir, "sets.edc")
+        cls.edj = os.path.join(cls.tmpdir, "sets.edj")
+        with open(edc, "w") as f:
+            f.write(sets_edc)
+        try:
+            subprocess.check_call(["edje_cc", edc, cls.edj])
+        except (OSError, subprocess.CalledProcessError):
+            cls.edj = None
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmpdir)
+
+    def setUp(self):
+        if self.edj is None:
+            self.skipTest("edje_cc not available")
+        self.canvas = evas.Canvas(method="buffer",
+                                  size=(400, 500),
+                                  viewport=(0, 0, 400, 500))
+        self.canvas.engine_info_set(self.canvas.engine_info_get())
+        self.o = Edje(self.canvas, file=self.edj, group="main")
+        self.o.message_signal_process()
+
+    def tearDown(self):
+        self.o.delete()
+        self.canvas.delete()
+
+    def testReceiveSets(self):
+        received = {}
+
+        def handler(obj, msg):
+            # the values seen in the handler, and a view kept after it
+            view = memoryview(msg)
+            received[msg.id] = (msg, msg.val, view.tolist(), view)
+
+        self.o.message_handler_set(handler)
+        self.o.signal_emit("send,sets", "")
+        self.o.message_signal_process()
+        self.o.message_signal_process()
+        self.assertEqual(sorted(received), [1, 2, 3])
+
+        expected = {1: ("i", [1, -2, 3]),
+                    2: ("d", [0.5, 1.5, -2.0]),
+                    3: ("i", [4, 5])}
+        for msg_id, (fmt, values) in expected.items():
+            msg, val, inside, view = received[msg_id]
+            self.assertEqual(val, values)
+            self.assertEqual(inside, values)
+            # the kept view still holds the values, edje freed its message
+            self.assertEqual(view.format, fmt)
+            self.assertEqual(view.itemsize, array.array(fmt).itemsize)
+            self.assertEqual(view.shape, (len(values),))
+            self.assertTrue(view.readonly)
+            self.assertEqual(view.tolist(), values)
+            self.assertRaises(ValueError, getattr, msg, "val")
+            self.assertEqual(memoryview(msg).tolist(), values)
+            view.release()
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+
+import os
+os.environ["ELM_ENGINE"] = "buffer"
+
+import unittest
+import subprocess
+import sys
+
+
+LAZY_MODULES = ("efl.edje", "efl.elementary.map", "efl.elementary.photocam",
+                "efl.elementary.video", "efl.elementary.web")
+
+
+def run_python(code, *opts):
+    """Run code in a fresh interpreter, return (stdout, stderr)."""
+    p = subprocess.Popen([sys.executable] + list(opts) + ["-c", code],
+                         stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                         universal_newlines=True)
+    out, err = p.communicate()
+    if p.returncode != 0:
+        raise AssertionError(err)
+    return out, err
+
+
+def import_times(stderr):
+    """Parse the -X importtime output into {module: cumulative usec}."""
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative, name = line[12:].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestElmLazyImport(unittest.TestCase):
+
+    def testNotImported(self):
+        out, err = run_python(
+            "import sys\n"
+            "from efl import elementary\n"
+            "print(' '.join(m for m in %r if m in sys.modules))\n"
+            % (LAZY_MODULES,))
+        self.assertEqual(out.strip(), "")
+
+    def testGetattr(self):
+        out, err = run_python(
+            "import sys\n"
+            "from efl import elementary\n"
+            "print(elementary.Photocam.__module__)\n"
+            "print('efl.elementary.photocam' in sys.modules)\n"
+            "print('efl.elementary.web' in sys.modules)\n")
+        self.assertEqual(out.split(),
+                         ["efl.elementary.photocam", "True", "False"])
+
+    def testMissingAttribute(self):
+        from efl import elementary
+        self.assertRaises(AttributeError, getattr, elementary, "NotAWidget")
+
+    def testSubmoduleImport(self):
+        from efl.elementary.web import Web, ELM_WEB_ZOOM_MODE_MANUAL
+        from efl import elementary
+        self.assertIs(elementary.Web, Web)
+        self.assertEqual(elementary.ELM_WEB_ZOOM_MODE_MANUAL,
+                         ELM_WEB_ZOOM_MODE_MANUAL)
+
+    def testLazyMapping(self):
+        # the Edje object is wrapped importing efl.edje only when needed
+        out, err = run_python(
+            "import sys\n"
+            "from efl import elementary as elm\n"
+            "win = elm.Window('t', elm.ELM_WIN_BASIC)\n"
+            "ly = elm.Layout(win)\n"
+            "print('efl.edje' in sys.modules)\n"
+            "print(type(ly.edje).__module__)\n")
+        self.assertEqual(out.split(), ["False", "efl.edje"])
+
+    def testImportTime(self):
+        # the lazy modules don't show up in the import times
+        out, err = run_python("from efl import elementary", "-X", "importtime")
+        eager = import_times(err)
+        self.assertIn("efl.elementary", eager)
+        for m in LAZY_MODULES:
+            self.assertNotIn(m, eager)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
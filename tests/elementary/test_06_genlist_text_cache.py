@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+
+import os
+os.environ["ELM_ENGINE"] = "buffer"
+
+import unittest
+
+from efl import ecore
+from efl import elementary as elm
+
+
+def iterate(n=20):
+    for i in range(n):
+        ecore.main_loop_iterate()
+
+
+class TestGenlistTextCache(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = []
+        self.win = elm.Window("t", elm.ELM_WIN_BASIC, size=(200, 200))
+        self.gl = elm.Genlist(self.win, size=(200, 200))
+        self.win.resize_object_add(self.gl)
+        self.gl.show()
+        self.win.show()
+
+    def tearDown(self):
+        self.win.delete()
+
+    def text_get(self, obj, part, item_data):
+        self.calls.append(item_data)
+        return "Item # %d" % (item_data,)
+
+    def testProperties(self):
+        itc = elm.GenlistItemClass(text_get_func=self.text_get)
+        self.assertEqual(itc.text_cache_size, 0)
+        itc = elm.GenlistItemClass(text_get_func=self.text_get,
+                                   text_cache_size=10)
+        self.assertEqual(itc.text_cache_size, 10)
+        itc.text_cache_size = 5
+        self.assertEqual(itc.text_cache_size, 5)
+        itc.text_cache_clear()
+        itc.text_cache_size = 0
+        self.assertEqual(itc.text_cache_size, 0)
+        itc.text_cache_clear()
+
+        itc = elm.GengridItemClass(text_get_func=self.text_get,
+                                   text_cache_size=10)
+        self.assertEqual(itc.text_cache_size, 10)
+
+    def testCache(self):
+        itc = elm.GenlistItemClass(item_style="default",
+                                   text_get_func=self.text_get,
+                                   text_cache_size=1000)
+        items = [self.gl.item_append(itc, i) for i in range(500)]
+        iterate()
+        self.assertIn(0, self.calls)
+
+        # scroll away and back, the first item must not be asked again
+        items[-1].show()
+        iterate()
+        items[0].show()
+        iterate()
+        self.assertEqual(self.calls.count(0), 1)
+
+        # until it is updated
+        items[0].update()
+        iterate()
+        self.assertEqual(self.calls.count(0), 2)
+
+        items[0].fields_update("*", elm.ELM_GENLIST_ITEM_FIELD_TEXT)
+        iterate()
+        self.assertEqual(self.calls.count(0), 3)
+
+    def testNoCache(self):
+        itc = elm.GenlistItemClass(item_style="default",
+                                   text_get_func=self.text_get)
+        items = [self.gl.item_append(itc, i) for i in range(500)]
+        iterate()
+        items[-1].show()
+        iterate()
+        items[0].show()
+        iterate()
+        self.assertGreater(self.calls.count(0), 1)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
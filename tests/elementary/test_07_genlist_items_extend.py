@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+
+import os
+os.environ["ELM_ENGINE"] = "buffer"
+
+import unittest
+
+from efl import ecore
+from efl import elementary as elm
+
+
+def compare(item1, item2):
+    return item1.data - item2.data
+
+
+class TestGenlistItemsExtend(unittest.TestCase):
+
+    def setUp(self):
+        self.win = elm.Window("t", elm.ELM_WIN_BASIC)
+        self.gl = elm.Genlist(self.win)
+        self.itc = elm.GenlistItemClass(item_style="default")
+
+    def tearDown(self):
+        self.win.delete()
+
+    def testExtend(self):
+        items = self.gl.items_extend(self.itc, range(100))
+        self.assertEqual(len(items), 100)
+        self.assertEqual(len(self.gl), 100)
+        self.assertEqual([it.data for it in self.gl], list(range(100)))
+
+        more = self.gl.items_extend(self.itc, (i for i in range(100, 110)))
+        self.assertEqual(len(self.gl), 110)
+        self.assertEqual(more[0].prev, items[-1])
+        self.assertEqual(self.gl.last_item, more[-1])
+
+    def testExtendChunked(self):
+        done = []
+
+        def done_cb(gl, items):
+            done.append(len(items))
+            ecore.main_loop_quit()
+
+        self.gl.items_extend(self.itc, range(1000), chunk_size=64,
+                             done_cb=done_cb)
+        self.assertEqual(len(self.gl), 0)
+        ecore.Timer(5.0, ecore.main_loop_quit)
+        ecore.main_loop_begin()
+        self.assertEqual(done, [1000])
+        self.assertEqual(len(self.gl), 1000)
+
+    def testSortedExtend(self):
+        for i in (10, 30, 50):
+            self.gl.item_sorted_insert(self.itc, i, compare)
+        items = self.gl.items_sorted_extend(self.itc, [60, 5, 30, 20, 40],
+                                            compare)
+        self.assertEqual([it.data for it in items], [5, 20, 30, 40, 60])
+        self.assertEqual([it.data for it in self.gl],
+                         [5, 10, 20, 30, 30, 40, 50, 60])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+
+import os
+os.environ["ELM_ENGINE"] = "buffer"
+
+import unittest
+import tracemalloc
+
+from efl import elementary as elm
+
+
+N = 10000
+
+
+def bytes_per_item(func):
+    """Python memory allocated by func(), divided by N."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        keep = func()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    size = sum(s.size_diff for s in after.compare_to(before, "filename"))
+    del keep
+    return size / float(N)
+
+
+class TestItemMemory(unittest.TestCase):
+
+    def setUp(self):
+        self.win = elm.Window("t", elm.ELM_WIN_BASIC)
+        self.itc = elm.GenlistItemClass(item_style="default")
+
+    def tearDown(self):
+        self.win.delete()
+
+    def testDataIsLazy(self):
+        it = elm.GenlistItem(self.itc, 1)
+        d = it.data
+        self.assertEqual(d, {})
+        d["key"] = "value"
+        self.assertIs(it.data, d)
+
+    def testDataDictMemory(self):
+        itc = self.itc
+
+        def create():
+            return [elm.GenlistItem(itc, None) for i in range(N)]
+
+        def create_with_data():
+            items = create()
+            for it in items:
+                it.data
+            return items
+
+        lazy = bytes_per_item(create)
+        eager = bytes_per_item(create_with_data)
+        self.assertLess(lazy, eager)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -132,6 +132,31 @@ class TestCanvasFactory(unittest.TestCase):
         o.delete()
 
 
+class TestCanvasObjectsAt(unittest.TestCase):
+    def setUp(self):
+        self.canvas = _new_canvas()
+        self.objs = [evas.Rectangle(self.canvas, geometry=(0, 0, 10, 10))
+                     for i in range(100)]
+        for o in self.objs:
+            o.show()
+
+    def tearDown(self):
+        self.canvas.delete()
+
+    def testIter(self):
+        it = self.canvas.objects_at_xy_iter(5, 5)
+        self.assertEqual(len(it), 100)
+        first = next(it)
+        self.assertEqual(len(it), 99)
+        self.assertEqual([first] + list(it),
+                         self.canvas.objects_at_xy_get(5, 5))
+        self.assertEqual(len(it), 0)
+
+        it = self.canvas.objects_in_rectangle_iter(0, 0, 20, 20)
+        self.assertEqual(set(it), set(self.objs))
+        self.assertEqual(len(self.canvas.objects_at_xy_iter(50, 50)), 0)
+
+
 if __name__ == '__main__':
     formatter = logging.Formatter("[%(levelname)s] %(name)s (%(filename)s: %(lineno)d) --- %(message)s")
     handler = logging.StreamHandler()
@@ -25,6 +25,22 @@ class TestImageBasics(unittest.TestCase):
         self.assertEqual(o.geometry_get(), (10, 20, 30, 40))
         self.assertEqual(o.file_get(), (icon_file, None))
 
+    def testDataMemoryview(self):
+        o = evas.Image(self.canvas, image_size=(16, 8))
+        stride = o.stride
+
+        with o.image_data_memoryview_get(True, False) as m:
+            self.assertFalse(m.readonly)
+            self.assertEqual(m.shape, (8, 16))
+            self.assertEqual(m.strides, (stride, 4))
+            m[2, 3] = 0xff00ff00
+
+        with o.image_data_memoryview_get() as m:
+            self.assertTrue(m.readonly)
+            self.assertEqual(m.nbytes, stride * 8)
+            self.assertEqual(m[2 * stride // 4 + 3], 0xff00ff00)
+            self.assertRaises(TypeError, m.__setitem__, 0, 0)
+
 
 if __name__ == '__main__':
     formatter = logging.Formatter("[%(levelname)s] %(name)s (%(filename)s: %(lineno)d) --- %(message)s")
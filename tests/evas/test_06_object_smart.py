@@ -142,6 +142,95 @@ class SmartObjectTest(unittest.TestCase):
         self.obj.callback_del("event1", _event1_cb)
         self.assertRaises(ValueError, self.obj.callback_del, "event1", _event1_cb)
 
+    def testCallbackDelInCallback(self):
+        called = []
+        def _event1_cb1(obj, event_info):
+            called.append(1)
+            obj.callback_del("event1", _event1_cb1)
+        def _event1_cb2(obj, event_info):
+            called.append(2)
+        self.obj.callback_add("event1", _event1_cb1)
+        self.obj.callback_add("event1", _event1_cb2)
+        self.obj.callback_call("event1")
+        self.obj.callback_call("event1")
+        self.assertEqual(called, [1, 2, 2])
+        self.obj.callback_del("event1", _event1_cb2)
+
+    def testCallbackEventInfoShared(self):
+        infos = []
+        def _event1_cb(obj, event_info, *args):
+            infos.append(event_info)
+        for i in range(3):
+            self.obj.callback_add("event1", _event1_cb, i)
+        info = ["info"]
+        self.obj.callback_call("event1", info)
+        self.assertEqual(len(infos), 3)
+        for ei in infos:
+            self.assertIs(ei, info)
+
+
+class PyMoveSmart(evas.Smart):
+    @staticmethod
+    def move(obj, x, y):
+        ox, oy = obj.pos
+        obj.move_children_relative(x - ox, y - oy)
+
+
+class CMoveSmart(evas.Smart):
+    move = evas.Smart.move_children
+
+
+class InheritedMoveSmart(MySmart):
+    pass
+
+
+class SmartMoveChildrenTest(unittest.TestCase):
+    def setUp(self):
+        self.canvas = evas.Canvas(method="buffer",
+                                  size=(400, 500),
+                                  viewport=(0, 0, 400, 500))
+        self.canvas.engine_info_set(self.canvas.engine_info_get())
+
+    def tearDown(self):
+        self.canvas.delete()
+
+    def create(self, smart, n):
+        objs = []
+        for i in range(n):
+            obj = evas.SmartObject(self.canvas, smart, geometry=(0, 0, 10, 10))
+            for j in range(4):
+                obj.member_add(evas.Rectangle(self.canvas,
+                                              geometry=(j, j, 2, 2)))
+            objs.append(obj)
+        return objs
+
+    def testMoveChildren(self):
+        obj, = self.create(CMoveSmart(), 1)
+        obj.move(10, 20)
+        self.assertEqual(obj.pos, (10, 20))
+        self.assertEqual([m.pos for m in obj.members],
+                         [(10, 20), (11, 21), (12, 22), (13, 23)])
+        evas.Smart.move_children(obj, 0, 0)
+        self.assertEqual(obj.members[3].pos, (3, 3))
+
+    def testInheritedMethods(self):
+        self.expected_cbs = 1
+        def _event1_cb(obj, event_info):
+            self.expected_cbs -= 1
+        obj = MyObject(self.canvas, InheritedMoveSmart())
+        obj.callback_add("event1", _event1_cb)
+        obj.move(1, 1)
+        self.assertEqual(self.expected_cbs, 0)
+
+    def testMoveMany(self):
+        n = 20
+        for smart in (PyMoveSmart(), CMoveSmart()):
+            objs = self.create(smart, n)
+            for i, obj in enumerate(objs):
+                obj.move(i, 2 * i)
+            self.assertEqual([o.members[3].pos for o in objs],
+                             [(i + 3, 2 * i + 3) for i in range(n)])
+
 
 if __name__ == '__main__':
     formatter = logging.Formatter("[%(levelname)s] %(name)s (%(filename)s: %(lineno)d) --- %(message)s")
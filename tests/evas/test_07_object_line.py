@@ -3,6 +3,7 @@
 from efl import evas
 import unittest
 import logging
+import array
 
 
 class TestLineBasics(unittest.TestCase):
@@ -22,6 +23,19 @@ class TestLineBasics(unittest.TestCase):
         self.assertEqual(o.start_get(), (10, 20))
         self.assertEqual(o.end_get(), (30, 40))
 
+    def testStrip(self):
+        lines = evas.Line.strip_add(self.canvas, [(0, 0), (10, 20), (30, 40)])
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(lines[0].xy, (0, 0, 10, 20))
+        self.assertEqual(lines[1].xy, (10, 20, 30, 40))
+
+        evas.Line.strip_set(lines, array.array("i", [1, 2, 3, 4, 5, 6]))
+        self.assertEqual(lines[0].xy, (1, 2, 3, 4))
+        self.assertEqual(lines[1].xy, (3, 4, 5, 6))
+
+        self.assertRaises(ValueError, evas.Line.strip_set, lines, [1, 2, 3, 4])
+        self.assertEqual(evas.Line.strip_add(self.canvas, [(0, 0)]), [])
+
 
 if __name__ == '__main__':
     formatter = logging.Formatter("[%(levelname)s] %(name)s (%(filename)s: %(lineno)d) --- %(message)s")
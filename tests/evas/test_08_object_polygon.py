@@ -3,6 +3,7 @@
 from efl import evas
 import unittest
 import logging
+import array
 
 
 class TestPolygonBasics(unittest.TestCase):
@@ -21,6 +22,39 @@ class TestPolygonBasics(unittest.TestCase):
         self.assertEqual(type(o), evas.Polygon)
         self.assertEqual(o.geometry_get(), (10, 20, 30, 40))
 
+    def testPoints(self):
+        o = evas.Polygon(self.canvas, points=[(10, 20), (30, 40), (10, 40)])
+        self.assertEqual(o.points_get(), array.array("i", [10, 20, 30, 40,
+                                                           10, 40]))
+        o.point_add(0, 0)
+        self.assertEqual(len(o.points), 8)
+        o.points_clear()
+        self.assertEqual(len(o.points_get()), 0)
+
+    def testPointsSet(self):
+        o = evas.Polygon(self.canvas)
+        points = array.array("i", [1, 2, 3, 4, 5, 6])
+        o.points_set(points)
+        self.assertEqual(o.points_get(), points)
+        self.assertIsNot(o.points_get(), points)
+
+        o.points = array.array("h", [7, 8, 9, 10])
+        self.assertEqual(list(o.points), [7, 8, 9, 10])
+        o.points = [1, 2, 3, 4]
+        self.assertEqual(list(o.points), [1, 2, 3, 4])
+
+        self.assertRaises(ValueError, o.points_set, [1, 2, 3])
+        self.assertRaises(TypeError, o.points_set, array.array("d", [1, 2]))
+
+    def testPointsNumpy(self):
+        try:
+            import numpy
+        except ImportError:
+            self.skipTest("NumPy not available")
+        o = evas.Polygon(self.canvas)
+        o.points_set(numpy.array([[1, 2], [3, 4], [5, 6]]))
+        self.assertEqual(list(o.points), [1, 2, 3, 4, 5, 6])
+
 
 if __name__ == '__main__':
     formatter = logging.Formatter("[%(levelname)s] %(name)s (%(filename)s: %(lineno)d) --- %(message)s")
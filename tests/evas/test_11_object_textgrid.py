@@ -1,7 +1,9 @@
 #!/usr/bin/env python
 #coding=UTF-8
 
-from efl.evas import Canvas, Textgrid, TextgridCell
+from efl.evas import Canvas, Textgrid, TextgridCell, \
+    TEXTGRID_CELL_BOLD, TEXTGRID_CELL_UNDERLINE
+import array
 import unittest
 import logging
 
@@ -36,6 +38,33 @@ class TestTextgridBasics(unittest.TestCase):
         print(tg.cell_size)
         self.assertEqual(row[0].codepoint, rowback[0].codepoint)
 
+    def testTextgridCells(self):
+        tg = Textgrid(self.canvas)
+        tg.size = 10, 10
+        attrs = array.array("B", [TEXTGRID_CELL_BOLD, TEXTGRID_CELL_UNDERLINE])
+        tg.cells_set(2, 3, 2, 2, "aböc", fg=array.array("B", [1, 2, 3, 4]),
+                     bg=5, attrs=attrs * 2)
+
+        cp, fg, bg, attrs = tg.cells_get(2, 3, 2, 2)
+        self.assertEqual(cp.tolist(), [ord(c) for c in "aböc"])
+        self.assertEqual(fg.tolist(), [1, 2, 3, 4])
+        self.assertEqual(bg.tolist(), [5, 5, 5, 5])
+        self.assertEqual(attrs.tolist(), [TEXTGRID_CELL_BOLD,
+                                          TEXTGRID_CELL_UNDERLINE] * 2)
+
+        row = tg.cellrow_get(4)
+        self.assertEqual(row[2].codepoint, "ö")
+        self.assertTrue(row[2].bold)
+        self.assertTrue(row[3].underline)
+
+        tg.cells_set(0, 0, 3, 1, b"xyz")
+        out = bytearray(3)
+        tg.cells_get(0, 0, 3, 1, codepoints=out)
+        self.assertEqual(bytes(out), b"xyz")
+
+        self.assertRaises(ValueError, tg.cells_set, 8, 8, 5, 5, "x" * 25)
+        self.assertRaises(ValueError, tg.cells_set, 0, 0, 2, 2, b"abc")
+
 
 if __name__ == '__main__':
     formatter = logging.Formatter("[%(levelname)s] %(name)s (%(filename)s: %(lineno)d) --- %(message)s")
@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+
+from efl import evas
+import unittest
+import logging
+
+
+class TestObjectConstruction(unittest.TestCase):
+    def setUp(self):
+        self.canvas = evas.Canvas(method="buffer",
+                                  size=(400, 500),
+                                  viewport=(0, 0, 400, 500))
+        self.canvas.engine_info_set(self.canvas.engine_info_get())
+
+    def tearDown(self):
+        self.canvas.delete()
+        del self.canvas
+
+    def testParent(self):
+        o = evas.Rectangle(self.canvas)
+        self.assertEqual(o.parent, self.canvas)
+        o.delete()
+
+    def testData(self):
+        o = evas.Rectangle(self.canvas)
+        o.data["test"] = 123
+        self.assertIs(o.data, o.data)
+        self.assertEqual(o.data["test"], 123)
+        o.delete()
+
+
+if __name__ == '__main__':
+    formatter = logging.Formatter("[%(levelname)s] %(name)s (%(filename)s: %(lineno)d) --- %(message)s")
+    handler = logging.StreamHandler()
+    handler.setFormatter(formatter)
+    efllog = logging.getLogger("efl")
+    efllog.addHandler(handler)
+    efllog.setLevel(logging.DEBUG)
+    unittest.main(verbosity=2)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+
+from efl import evas
+import unittest
+
+
+class TestObjectEvents(unittest.TestCase):
+    def setUp(self):
+        self.canvas = evas.Canvas(method="buffer",
+                                  size=(400, 500),
+                                  viewport=(0, 0, 400, 500))
+        self.canvas.engine_info_set(self.canvas.engine_info_get())
+        self.obj = evas.Rectangle(self.canvas, geometry=(0, 0, 400, 500))
+        self.obj.show()
+        self.events = []
+        self.canvas.feed_mouse_in(0)
+
+    def tearDown(self):
+        self.obj.delete()
+        self.canvas.delete()
+
+    def feed_moves(self, n, timestamp=1):
+        for i in range(n):
+            self.canvas.feed_mouse_move(i % 400, i % 500, timestamp + i)
+
+    def testEventReused(self):
+        def cb(obj, event):
+            self.events.append(id(event))
+
+        self.obj.on_mouse_move_add(cb)
+        self.feed_moves(3)
+        self.assertEqual(len(self.events), 3)
+        self.assertEqual(len(set(self.events)), 1)
+
+    def testEventKept(self):
+        def cb(obj, event):
+            self.events.append(event)
+
+        self.obj.on_mouse_move_add(cb)
+        self.feed_moves(3)
+        self.assertEqual(len(set(id(e) for e in self.events)), 3)
+        for event in self.events:
+            self.assertRaises(AssertionError, getattr, event, "buttons")
+
+    def testPositionKept(self):
+        def cb(obj, event):
+            self.events.append(event.position.canvas)
+
+        self.obj.on_mouse_move_add(cb)
+        self.feed_moves(2)
+        self.assertIsNot(self.events[0], self.events[1])
+
+    def testCoalesce(self):
+        def cb(obj, event):
+            self.events.append((event.position.canvas.xy,
+                                event.prev_position.canvas.xy,
+                                event.history))
+
+        self.obj.on_mouse_move_add(cb)
+        self.canvas.feed_mouse_move(10, 10, 1)
+        self.obj.event_coalesce_set(evas.EVAS_CALLBACK_MOUSE_MOVE, True)
+        self.assertTrue(
+            self.obj.event_coalesce_get(evas.EVAS_CALLBACK_MOUSE_MOVE))
+        self.assertFalse(
+            self.obj.event_coalesce_get(evas.EVAS_CALLBACK_MULTI_MOVE))
+        del self.events[:]
+
+        self.canvas.feed_mouse_move(20, 20, 2)
+        self.canvas.feed_mouse_move(30, 30, 3)
+        self.canvas.feed_mouse_move(40, 40, 4)
+        self.assertEqual(self.events, [])
+        self.canvas.render()
+        self.assertEqual(self.events, [((40, 40), (10, 10), None)])
+
+        # nothing pending, nothing delivered
+        self.canvas.render()
+        self.assertEqual(len(self.events), 1)
+
+    def testCoalesceWithoutRender(self):
+        from efl import ecore
+
+        def cb(obj, event):
+            self.events.append(event.position.canvas.xy)
+
+        self.obj.on_mouse_move_add(cb)
+        self.obj.event_coalesce_set(evas.EVAS_CALLBACK_MOUSE_MOVE, True)
+        self.canvas.feed_mouse_move(20, 20, 2)
+        self.canvas.feed_mouse_move(30, 30, 3)
+        self.assertEqual(self.events, [])
+
+        # nothing is rendered, the events are delivered by the main loop
+        t = ecore.Timer(0.1, ecore.main_loop_quit)
+        ecore.main_loop_begin()
+        t.delete()
+        self.assertEqual(self.events, [(30, 30)])
+
+    def testCoalesceHistory(self):
+        def cb(obj, event):
+            self.events.append(event.history)
+
+        self.obj.on_mouse_move_add(cb)
+        self.obj.event_coalesce_set(evas.EVAS_CALLBACK_MOUSE_MOVE, True,
+                                    history=True)
+        self.canvas.feed_mouse_move(20, 25, 2)
+        self.canvas.feed_mouse_move(30, 35, 3)
+        self.canvas.render()
+        self.assertEqual(self.events, [[(20, 25, 2), (30, 35, 3)]])
+
+    def testCoalesceDisable(self):
+        def cb(obj, event):
+            self.events.append(event.position.canvas.xy)
+
+        self.obj.on_mouse_move_add(cb)
+        self.obj.event_coalesce_set(evas.EVAS_CALLBACK_MOUSE_MOVE, True)
+        self.canvas.feed_mouse_move(20, 20, 2)
+        # the pending event is delivered when coalescing is disabled
+        self.obj.event_coalesce_set(evas.EVAS_CALLBACK_MOUSE_MOVE, False)
+        self.assertEqual(self.events, [(20, 20)])
+        self.canvas.feed_mouse_move(30, 30, 3)
+        self.assertEqual(self.events, [(20, 20), (30, 30)])
+
+    def testCoalesceInvalid(self):
+        self.assertRaises(ValueError, self.obj.event_coalesce_set,
+                          evas.EVAS_CALLBACK_MOUSE_DOWN, True)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+
+from efl import evas
+import unittest
+import array
+
+
+class TestMapArrays(unittest.TestCase):
+    def setUp(self):
+        self.canvas = evas.Canvas(method="buffer",
+                                  size=(400, 500),
+                                  viewport=(0, 0, 400, 500))
+        self.canvas.engine_info_set(self.canvas.engine_info_get())
+        self.map = evas.Map(4)
+
+    def tearDown(self):
+        self.map.delete()
+        self.canvas.delete()
+
+    def testCoords(self):
+        coords = array.array("i", range(12))
+        self.map.point_coords = coords
+        self.assertEqual(self.map.point_coords, coords)
+        self.assertEqual(self.map.point_coord_get(1), (3, 4, 5))
+
+        self.map.point_coords_set([(0, 0, 0), (10, 0, 0),
+                                   (10, 10, 0), (0, 10, 0)])
+        self.assertEqual(self.map.point_coord_get(2), (10, 10, 0))
+
+        self.assertRaises(ValueError, self.map.point_coords_set, [1, 2, 3])
+        self.assertRaises(ValueError, self.map.point_coords_set, range(10))
+
+    def testImageUvs(self):
+        self.map.point_image_uvs = array.array("d", [0.5] * 8)
+        self.assertEqual(list(self.map.point_image_uvs), [0.5] * 8)
+        self.map.point_image_uvs = array.array("f", [0, 0, 1, 0, 1, 1, 0, 1])
+        self.assertEqual(self.map.point_image_uv_get(2), (1.0, 1.0))
+        self.map.point_image_uvs = [(0, 0), (20, 0), (20, 10), (0, 10)]
+        self.assertEqual(self.map.point_image_uv_get(1), (20.0, 0.0))
+
+    def testColors(self):
+        self.map.point_colors = bytearray([255, 0, 0, 255] * 4)
+        self.assertEqual(self.map.point_color_get(3), (255, 0, 0, 255))
+        self.assertEqual(list(self.map.point_colors), [255, 0, 0, 255] * 4)
+
+    def testApply(self):
+        objs = [evas.Rectangle(self.canvas, geometry=(0, 0, 10, 10))
+                for i in range(3)]
+        self.map.util_points_populate_from_geometry(0, 0, 10, 10, 0)
+        self.map.apply(objs)
+        for o in objs:
+            self.assertTrue(o.map_enabled)
+            self.assertEqual(o.map.point_coord_get(2), (10, 10, 0))
+
+        coords = array.array("i")
+        for i in range(3):
+            coords.extend([i, 0, 0, i + 10, 0, 0, i + 10, 10, 0, i, 10, 0])
+        self.map.apply(objs, coords)
+        for i, o in enumerate(objs):
+            self.assertEqual(o.map.point_coord_get(0), (i, 0, 0))
+
+        self.assertRaises(ValueError, self.map.apply, objs, coords[:12])
+        self.assertRaises(TypeError, self.map.apply, [None])
+        self.assertRaises(TypeError, self.map.apply, [objs[0], "rect"])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)